@@ -0,0 +1,101 @@
+from .features import (
+    add_derived_features,
+    derive_group,
+    derive_purpose,
+    derive_time_cluster,
+    derive_time_columns,
+)
+from .customers import CUSTOMER_KEY_COL, CustomerKeyMap, add_customer_keys, customer_keys, customer_salt_tag
+from .repurchase import add_repurchase_columns, repurchase_intervals
+from .store import (
+    cache_dir_for,
+    cache_paths,
+    file_fingerprint,
+    is_fresh,
+    load_or_build,
+    read_cached_frame,
+    read_meta,
+    write_cached_frame,
+    write_meta,
+)
+from .schema import CATEGORY_COLUMNS, ORDER_COLUMNS, read_orders
+from .aggregates import (
+    channel_aov,
+    channel_summary,
+    daily_revenue,
+    purpose_repeat_stats,
+    region_channel_counts,
+    region_path_revenue,
+    region_stats,
+    seller_revenue,
+    time_cluster_stats,
+    variety_counts,
+    variety_revenue,
+    week_over_week,
+    weekday_seller_stats,
+    weekly_stats,
+)
+from .memo import AggregateCache, selection_key, stale_selections
+from .cube import CUBE_DIMENSIONS, CUBE_MEASURES, OrderCube, order_cube
+from .customer_table import CustomerTable, customer_order, customer_runs, customer_table
+from .cohorts import COHORT_FREQS, COHORT_SIZE_COL, COHORT_SPLITS, cohort_matrix, cohort_rates
+from .rfm import (
+    RFM_BINS,
+    SEGMENT_COL,
+    SEGMENTS,
+    quantile_scores,
+    rfm_segments,
+    row_segments,
+    segment_mix,
+    segment_summary,
+)
+from .pages import PageIndex, page_index
+from .incremental import ingest_partitions, merge_orders, partition_signature
+from .metrics import (
+    aov_by_purchase_round,
+    best_region_combos,
+    cancel_by_option,
+    citrus_orders,
+    customer_growth,
+    headline_kpis,
+    hourly_orders,
+    loyal_sellers,
+    page_option_breakdown,
+    path_member_mix,
+    path_visit_mix,
+    product_page_stats,
+    purpose_best_options,
+    purpose_option_counts,
+    region_hierarchy,
+    repeat_split,
+    retention_funnel,
+    revenue_by_customer_type,
+    seller_pareto,
+    time_cluster_summary,
+    top_product_pages,
+    true_aov,
+    variety_mix_first_vs_repeat,
+    weekday_hour_matrix,
+    weekday_seller_productivity,
+)
+from .growth import (
+    channel_share,
+    common_item_aov,
+    customer_type_channels,
+    customer_type_counts,
+    daily_customer_mix,
+    daily_repeat_trend,
+    daily_revenue_spike,
+    group_summary,
+    growth_orders,
+    variety_price_premium,
+)
+from .precompute import TAB_AGGREGATES, group_selections, precompute_aggregates, warm_cache
+from .downsample import downsample_series, lttb_indices
+from .daterange import DateIndex
+from .explorer import OrderExplorer
+from .filters import FILTER_COLUMNS, FilterIndex
+from .export import EXPORT_BATCH_ROWS, EXPORT_FORMATS, EXPORT_MAX_ROWS, export_frame, frame_batches, iter_csv_chunks, write_batches
+from .dataset import OrderDataset, write_order_dataset
+from .profiling import LatencyStats, RerunProfile, configure_perf_logging, process_memory_mb
+from .shared import copy_on_write_enabled, enable_copy_on_write, frame_nbytes, select_rows, session_view
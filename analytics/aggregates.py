@@ -0,0 +1,118 @@
+import pandas as pd
+
+from .customers import CUSTOMER_KEY_COL
+from .features import DAY_ORDER
+
+# ----------------------------------------------------------------
+# 탭 공통 집계 함수
+# 합산 가능한 집계는 그룹으로 슬라이스된 OrderCube(cube) 를, 고객 수/최빈값처럼
+# 합산할 수 없는 집계는 필터링된 주문 프레임(f_df)을 받는 순수 함수입니다.
+# (AggregateCache 에서 함수 이름을 키로 사용하므로 이름을 바꾸면 캐시 키도 바뀝니다)
+# ----------------------------------------------------------------
+
+
+def daily_revenue(cube):
+    return cube.rollup(['주문날짜'], ['실결제 금액']).reset_index()
+
+
+def weekly_stats(f_df):
+    # 주차(주 시작 월요일)별 매출 / 활성 고객 수 - 날짜순 정렬 (WoW 계산용)
+    return f_df.groupby('주차', observed=True).agg(**{
+        '실결제 금액': ('실결제 금액', 'sum'),
+        '고객수': (CUSTOMER_KEY_COL, 'nunique'),
+    }).reset_index()
+
+
+def week_over_week(weekly):
+    # 마지막 주 vs 직전 주 증감률(%) -> (매출, 고객수)
+    if len(weekly) < 2:
+        return 0, 0
+    curr_w = weekly.iloc[-1]
+    prev_w = weekly.iloc[-2]
+    rev_wow = ((curr_w['실결제 금액'] - prev_w['실결제 금액']) / prev_w['실결제 금액'] * 100)
+    cust_wow = ((curr_w['고객수'] - prev_w['고객수']) / prev_w['고객수'] * 100)
+    return rev_wow, cust_wow
+
+
+def seller_revenue(cube):
+    # 셀러별 매출 합계 (내림차순 Series)
+    return cube.rollup(['셀러명'], ['실결제 금액'])['실결제 금액'].sort_values(ascending=False)
+
+
+def channel_aov(cube):
+    # 건당 평균 결제액 = 매출 합계 / 금액이 있는 주문 수
+    t = cube.rollup(['주문경로'], ['실결제 금액', '결제건수'])
+    aov = (t['실결제 금액'] / t['결제건수']).rename('실결제 금액')
+    return aov.sort_values(ascending=False).reset_index()
+
+
+def channel_summary(cube):
+    t = cube.rollup(['주문경로'])
+    return pd.DataFrame({
+        '매출': t['실결제 금액'],
+        '건수': t['주문건수'],
+        '재구매비중(%)': t['재구매건수'] / t['행수'] * 100,
+    }).reset_index()
+
+
+def weekday_seller_stats(cube):
+    # 요일 x 그룹별 매출 합계와 활동 셀러 수 (셀러 결측 행도 매출에는 포함)
+    t = cube.rollup(['주문날짜', '그룹', '셀러명'], ['실결제 금액'], dropna=False).reset_index()
+    t['요일'] = pd.to_datetime(t['주문날짜']).dt.day_name()
+    return t.groupby(['요일', '그룹'], observed=True).agg({
+        '실결제 금액': 'sum',
+        '셀러명': 'nunique'
+    }).reindex(DAY_ORDER, level=0).reset_index()
+
+
+def region_stats(cube):
+    t = cube.rollup(['광역지역(정식)'])
+    reg_stats = pd.DataFrame({
+        '총매출': t['실결제 금액'],
+        '재구매율': t['재구매건수'] / t['행수'] * 100,
+        '주문건수': t['주문건수'],
+    }).reset_index()
+    reg_stats.columns = ['지역', '총매출', '재구매율', '주문건수']
+    return reg_stats
+
+
+def region_path_revenue(cube):
+    # 지역 > 경로 > 셀러 매출 (결측 경로/셀러도 유지 - 선버스트에서 '정보없음'으로 표시)
+    return cube.rollup(['광역지역(정식)', '주문경로', '셀러명'], ['실결제 금액'], dropna=False).reset_index()
+
+
+def region_channel_counts(cube):
+    # 지역 x 경로 주문 건수 피벗
+    return cube.rollup(['광역지역(정식)', '주문경로'], ['행수'])['행수'].unstack(fill_value=0)
+
+
+def variety_counts(cube):
+    # 품종별 판매량 (value_counts 와 동일한 'count' 컬럼)
+    return cube.rollup(['품종'], ['행수'])['행수'].rename('count').sort_values(ascending=False)
+
+
+def variety_revenue(cube):
+    return cube.rollup(['품종'], ['실결제 금액'])['실결제 금액'].sort_values(ascending=False)
+
+
+def purpose_repeat_stats(cube):
+    t = cube.rollup(['구매목적'])
+    return pd.DataFrame({
+        '재구매여부': t['재구매건수'] / t['행수'],
+        '주문번호': t['주문건수'],
+    }).reset_index()
+
+
+def time_cluster_stats(f_df):
+    # 클러스터별 주문수 / 평균 금액 / 최빈 요일 / 최빈 시간
+    cluster_stats = f_df.groupby('time_cluster', observed=True).agg({
+        '주문번호': 'count',
+        '실결제 금액': 'mean',
+        '주문일': lambda x: x.dt.dayofweek.mode()[0],
+        'time_cluster': 'first'  # 해석을 위해
+    }).reset_index(drop=True)
+
+    # 대표 시간(최빈값) 추가 - 클러스터 순서가 같으므로 위치 기준으로 붙임
+    cluster_stats['대표시간'] = f_df.groupby('time_cluster', observed=True)['주문일'].apply(
+        lambda x: f"{x.dt.hour.mode()[0]}시").to_numpy()
+    return cluster_stats
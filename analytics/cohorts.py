@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from .customer_table import customer_order, customer_runs
+
+# ----------------------------------------------------------------
+# 코호트 리텐션 매트릭스
+# 고객을 최초주문일이 속한 주(월요일 시작) / 월로 묶고(코호트), 이후 주문이 몇 번째 기간(경과)에 있었는지로
+# 기간별 활성 고객 수를 셉니다. 기간 번호는 정수 산술로 계산하고(코호트별 반복 없음),
+# (고객, 경과) 첫 행만 남긴 뒤 groupby 1회 + unstack 으로 매트릭스를 만듭니다.
+# 분할 기준(그룹 / 셀러명 / 주문경로)은 고객 첫 주문의 값(유입 그룹 / 셀러 / 경로)입니다.
+# ----------------------------------------------------------------
+
+COHORT_FREQS = {'W': '주', 'M': '월'}
+COHORT_SPLITS = ['그룹', '셀러명', '주문경로']
+COHORT_SIZE_COL = '고객수'
+
+_EPOCH_MONDAY_OFFSET = 3  # 1970-01-01 은 목요일 - 일 번호 + 3 을 7로 나누면 월요일 경계
+
+
+def period_numbers(values, freq='W'):
+    # datetime64 배열 -> 정수 기간 번호 (W: 월요일 시작 주, M: 달력 월)
+    if freq == 'W':
+        days = values.astype('datetime64[D]').astype(np.int64)
+        return (days + _EPOCH_MONDAY_OFFSET) // 7
+    return values.astype('datetime64[M]').astype(np.int64)
+
+
+def period_starts(periods, freq='W'):
+    # 기간 번호 -> 기간 시작일 (datetime64[ns])
+    if freq == 'W':
+        days = periods * 7 - _EPOCH_MONDAY_OFFSET
+        return days.astype('datetime64[D]').astype('datetime64[ns]')
+    return periods.astype('datetime64[M]').astype('datetime64[ns]')
+
+
+def cohort_matrix(f_df, freq='W', split=None):
+    # 코호트(x 분할값)별 고객수와 경과 기간(0, 1, 2, ...)별 활성 고객 수
+    # 인덱스: [분할 컬럼,] '코호트'(기간 시작일) / 컬럼: '고객수', 0, 1, 2, ...
+    ordered = customer_order(f_df)
+    if ordered['주문일'].hasnans:
+        # 주문일이 없는 주문은 기간을 매길 수 없으므로 제외 (같은 고객의 다른 주문은 그대로)
+        ordered = ordered[ordered['주문일'].notna()]
+    _, new_cust, starts = customer_runs(ordered)
+    cust = np.cumsum(new_cust) - 1  # 행별 고객 순번
+
+    first_days = pd.to_datetime(ordered['최초주문일'].to_numpy()[starts]).to_numpy()
+    cohorts = period_numbers(first_days, freq)
+    age = period_numbers(ordered['주문일'].to_numpy(), freq) - cohorts[cust]
+    # 고객 안에서 주문일 순이므로 경과 기간이 바뀌는 행 = (고객, 경과) 첫 행
+    prev_idx = np.maximum(np.arange(len(age)) - 1, 0)
+    active = new_cust | (age != age[prev_idx])
+
+    customers = pd.DataFrame({'코호트': period_starts(cohorts, freq)})
+    dims = ['코호트']
+    if split is not None:
+        customers.insert(0, split, ordered[split].array.take(starts))
+        dims = [split, '코호트']
+    activity = customers.iloc[cust[active]].reset_index(drop=True)
+    activity['경과'] = age[active]
+
+    sizes = customers.groupby(dims, observed=True).size().rename(COHORT_SIZE_COL).to_frame()
+    if activity.empty:
+        return sizes
+    counts = activity.groupby(dims + ['경과'], observed=True).size().unstack('경과', fill_value=0)
+    matrix = sizes.join(counts.set_axis(counts.columns.astype(int), axis=1)).fillna(0).astype('Int64')
+    # 데이터 마지막 기간 이후(아직 오지 않은 경과 기간)는 0 이 아니라 결측
+    last = period_numbers(ordered['주문일'].to_numpy(), freq).max()
+    horizon = last - period_numbers(matrix.index.get_level_values('코호트').to_numpy(), freq)
+    periods = counts.columns.to_numpy(dtype=np.int64)
+    matrix[list(counts.columns)] = matrix[list(counts.columns)].mask(periods[None, :] > horizon[:, None])
+    return matrix
+
+
+def cohort_rates(matrix):
+    # 활성 고객 수 -> 코호트 고객수 대비 비율(%)
+    periods = [col for col in matrix.columns if col != COHORT_SIZE_COL]
+    return (matrix[periods].div(matrix[COHORT_SIZE_COL], axis=0) * 100).round(1)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 주문 집계 큐브 (그룹 x 날짜 x 셀러 x 경로 x 지역 x 품종 x 구매목적)
+# 로드 시 한 번 만들어 두고, 탭의 합계/건수 집계는 원본 행 대신 큐브를 다시 묶어서 구합니다.
+# 합산 가능한 측정값만 담습니다 (고객 수 같은 nunique 는 원본에서 계산).
+# 팩트는 주문날짜 순으로 정렬해 두고, 기간 슬라이스는 datetime64 날짜 배열에서 이진 탐색으로 잘라냅니다.
+# ----------------------------------------------------------------
+
+CUBE_DIMENSIONS = ['그룹', '주문날짜', '셀러명', '주문경로', '광역지역(정식)', '품종', '구매목적']
+
+# 측정값: 매출 합계 / 금액이 있는 행 수(평균용) / 주문번호 수 / 전체 행 수 / 재구매 행 수
+CUBE_MEASURES = ['실결제 금액', '결제건수', '주문건수', '행수', '재구매건수']
+
+
+class OrderCube:
+    def __init__(self, facts, days=None):
+        # days: facts 행 순서와 같은 datetime64 주문날짜 배열 (정렬됨, 결측은 맨 뒤) - 없으면 여기서 한 번 만듦
+        if days is None:
+            days = pd.to_datetime(facts['주문날짜']).to_numpy()
+            order = np.argsort(days, kind='stable')
+            if (order != np.arange(len(order))).any():
+                facts, days = facts.iloc[order], days[order]
+        self.facts = facts
+        self.days = days
+
+    @classmethod
+    def build(cls, df):
+        # 결측 차원값도 하나의 셀로 보존해야 다른 차원으로 묶었을 때 합계가 원본과 일치합니다.
+        facts = df.groupby(CUBE_DIMENSIONS, observed=True, dropna=False, sort=False).agg(
+            **{
+                '실결제 금액': ('실결제 금액', 'sum'),
+                '결제건수': ('실결제 금액', 'count'),
+                '주문건수': ('주문번호', 'count'),
+                '행수': ('실결제 금액', 'size'),
+                '재구매건수': ('재구매여부', 'sum'),
+            }
+        ).reset_index()
+        return cls(facts)
+
+    def __len__(self):
+        return len(self.facts)
+
+    def slice(self, groups):
+        # 그룹 필터 = 큐브 행 슬라이스 (원본 df['그룹'].isin(...) 스캔 대신)
+        mask = self.facts['그룹'].isin(groups).to_numpy()
+        return OrderCube(self.facts[mask], self.days[mask])
+
+    def where(self, **conditions):
+        # 차원 값 조건으로 추가 슬라이스: cube.where(품종=['감귤'])
+        mask = pd.Series(True, index=self.facts.index)
+        for dim, values in conditions.items():
+            mask &= self.facts[dim].isin(values)
+        mask = mask.to_numpy()
+        return OrderCube(self.facts[mask], self.days[mask])
+
+    def between(self, start, end):
+        # 주문날짜 기간 [start, end] 슬라이스 (날짜 결측 셀은 정렬상 맨 뒤라 제외됨)
+        first = np.searchsorted(self.days, np.datetime64(pd.Timestamp(start)), side='left')
+        last = np.searchsorted(self.days, np.datetime64(pd.Timestamp(end)), side='right')
+        return OrderCube(self.facts.iloc[first:last], self.days[first:last])
+
+    def rollup(self, dims, measures=None, dropna=True):
+        # 지정한 차원으로 다시 합산 (dropna 는 pandas groupby 기본값과 동일하게 결측 키 제외)
+        measures = measures or CUBE_MEASURES
+        return self.facts.groupby(dims, observed=True, dropna=dropna)[measures].sum()
+
+    def nbytes(self):
+        return int(self.facts.memory_usage(deep=True).sum())
+
+
+def order_cube(df):
+    # 주문 프레임(또는 필터링된 f_df) -> OrderCube (큐브 차원에 없는 조건으로 거른 선택용, 집계 캐시 키로 함수 이름 사용)
+    return OrderCube.build(df)
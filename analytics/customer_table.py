@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+from .customers import CUSTOMER_KEY_COL
+
+# ----------------------------------------------------------------
+# 고객 테이블 (고객키 1행 = 고객 1명)
+# 주문 프레임을 (고객키, 주문일) 순서로 한 번 훑어 고객별 사실(첫/마지막 주문일, 방문일수, 주문 수, 결제 합계,
+# 주 구매목적 / 주 품종 / 거주 지역, 첫 주문의 셀러 / 유입경로 / 그룹)을 만들어 둡니다.
+# 신규 고객 추이 / 재구매 퍼널 / 신규·재구매 비중처럼 고객 단위 지표는 주문 행 대신 이 테이블에서 계산합니다.
+# 연락처(고객키)가 없는 주문은 고객으로 세지 않습니다.
+# ----------------------------------------------------------------
+
+# 주문 중 가장 많이 나온 값 (같은 횟수면 값 순서상 앞의 값)
+DOMINANT_COLUMNS = {'주구매목적': '구매목적', '주품종': '품종', '거주지역': '광역지역(정식)'}
+# 첫 주문의 값
+ACQUISITION_COLUMNS = {'유입셀러': '셀러명', '유입경로': '주문경로', '유입그룹': '그룹'}
+
+
+def customer_order(df):
+    # (고객키, 주문일) 순서의 프레임 - 재구매 엔진을 거친 프레임과 그 행 슬라이스는 이미 이 순서라 그대로 사용
+    # 고객키가 없는 주문은 제외
+    keys = df[CUSTOMER_KEY_COL]
+    if len(df) and keys.is_monotonic_increasing and not keys.hasnans:
+        codes = keys.to_numpy(dtype=np.int64)
+        days = df['주문일'].to_numpy()
+        if not ((codes[1:] == codes[:-1]) & (days[1:] < days[:-1])).any():
+            return df
+    ordered = df.sort_values([CUSTOMER_KEY_COL, '주문일'], kind='stable')
+    # 고객키 결측은 정렬 끝에 모임
+    return ordered.iloc[:int(keys.notna().sum())]
+
+
+def customer_runs(ordered):
+    # customer_order 결과의 고객 구간: (행별 고객키, 고객 첫 행 여부, 고객 첫 행 위치)
+    codes = ordered[CUSTOMER_KEY_COL].to_numpy(dtype=np.int64)
+    new_cust = np.ones(len(codes), dtype=bool)
+    new_cust[1:] = codes[1:] != codes[:-1]
+    return codes, new_cust, np.flatnonzero(new_cust)
+
+
+def _customer_sums(values, starts):
+    # 정렬된 값의 고객 구간별 합계 (결측은 0으로 - pandas sum 과 동일)
+    if not len(starts):
+        return np.zeros(0, dtype=values.dtype)
+    return np.add.reduceat(np.nan_to_num(values), starts)
+
+
+def _customer_last_days(values, starts):
+    # 정렬된 datetime64 의 고객 구간별 최댓값 (NaT 는 int64 최솟값이라 주문일이 있는 주문이 하나라도 있으면 무시됨)
+    if not len(starts):
+        return values[:0]
+    return np.maximum.reduceat(values.view(np.int64), starts).view(values.dtype)
+
+
+def _dominant(df, col):
+    counts = df.groupby([CUSTOMER_KEY_COL, col], observed=True).size().reset_index(name='n')
+    counts = counts.sort_values([CUSTOMER_KEY_COL, 'n'], ascending=[True, False], kind='stable')
+    return counts.drop_duplicates(CUSTOMER_KEY_COL).set_index(CUSTOMER_KEY_COL)[col]
+
+
+class CustomerTable:
+    def __init__(self, facts, group_orders):
+        self.facts = facts  # 고객키 인덱스, 고객별 사실
+        self.group_orders = group_orders  # (고객키, 그룹) 인덱스, 주문수 / 재구매주문수
+
+    @classmethod
+    def build(cls, df):
+        ordered = customer_order(df)
+        n = len(ordered)
+        codes, new_cust, starts = customer_runs(ordered)
+        day = ordered['주문일'].to_numpy().astype('datetime64[D]')
+        prev_idx = np.maximum(np.arange(n) - 1, 0)
+        # 빈 프레임(조건에 맞는 주문 없음)이면 starts 가 비어 있으므로 ends 도 빈 배열 -> 고객 0명 테이블
+        ends = np.append(starts[1:], n)[:len(starts)] - 1
+        # 방문일수: 고객 안에서 날짜가 바뀌는 행 수 (재구매 엔진의 날짜 순서와 같은 기준)
+        # 주문일이 없는 주문은 고객 구간 끝에 모이며 방문일로 세지 않음
+        new_day = (new_cust | (day != day[prev_idx])) & ~np.isnat(day)
+
+        first_rows = ordered.iloc[starts]
+        facts = pd.DataFrame({
+            '첫주문일': first_rows['주문일'].to_numpy(),
+            '마지막주문일': _customer_last_days(ordered['주문일'].to_numpy(), starts),
+            '방문일수': _customer_sums(new_day.astype(np.int64), starts),
+            '주문수': ends - starts + 1,
+            '총결제금액': _customer_sums(ordered['실결제 금액'].to_numpy(dtype=np.float64), starts),
+        }, index=pd.Index(codes[starts], name=CUSTOMER_KEY_COL))
+        for name, col in DOMINANT_COLUMNS.items():
+            facts[name] = _dominant(ordered, col).reindex(facts.index).array
+        for name, col in ACQUISITION_COLUMNS.items():
+            facts[name] = first_rows[col].array
+
+        group_orders = ordered.groupby([CUSTOMER_KEY_COL, '그룹'], observed=True).agg(
+            주문수=('재구매여부', 'size'), 재구매주문수=('재구매여부', 'sum'))
+        return cls(facts, group_orders)
+
+    def __len__(self):
+        return len(self.facts)
+
+    def first_order_days(self):
+        # 고객별 첫 주문 날짜 (주문날짜 컬럼과 같은 date 값)
+        return self.facts['첫주문일'].dt.date.rename('주문날짜')
+
+    def visit_reach(self):
+        # 방문 회차(0부터)별 그 회차까지 방문한 고객 수: reach[k] = 방문일수 > k 인 고객 수
+        visits = np.bincount(self.facts['방문일수'].to_numpy())
+        return visits[::-1].cumsum()[::-1][1:]
+
+    def group_repeat_orders(self, group):
+        # 그룹 주문의 (주문수, 재구매주문수) 합계
+        if group not in self.group_orders.index.get_level_values('그룹'):
+            return 0, 0
+        totals = self.group_orders.xs(group, level='그룹').sum()
+        return int(totals['주문수']), int(totals['재구매주문수'])
+
+    def nbytes(self):
+        return int(self.facts.memory_usage(deep=True).sum() + self.group_orders.memory_usage(deep=True).sum())
+
+
+def customer_table(df):
+    # 주문 프레임(또는 필터링된 f_df) -> CustomerTable (집계 캐시 키로 함수 이름 사용)
+    return CustomerTable.build(df)
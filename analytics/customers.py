@@ -0,0 +1,110 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 고객 키 사전 (주문자연락처 -> 정수 고객키)
+# 고객 단위 연산(정렬 / groupby / nunique / drop_duplicates)은 연락처 문자열 대신
+# 조밀한 정수 키(Int32, 연락처 결측은 NA)로 합니다.
+# 사전은 Parquet 로 저장해 두고 새 연락처에만 다음 번호를 붙이므로, 재적재 / 증분 적재 후에도 키가 유지됩니다.
+# ORDER_CUSTOMER_SALT 를 지정하면 연락처 대신 솔트 해시를 사전에 저장하고, 프레임에서도 원본 연락처를 지웁니다.
+# ----------------------------------------------------------------
+
+CUSTOMER_COL = '주문자연락처'
+CUSTOMER_KEY_COL = '고객키'
+CUSTOMER_SALT_ENV = 'ORDER_CUSTOMER_SALT'
+KEY_DTYPE = 'Int32'
+
+
+def _salt_tag(salt):
+    # 솔트별로 사전 파일을 분리 (솔트 자체는 파일명에 남기지 않음)
+    return hashlib.blake2b(salt.encode('utf-8'), digest_size=4).hexdigest()
+
+
+def customer_salt_tag(salt=None):
+    # 현재 솔트(없으면 ORDER_CUSTOMER_SALT)의 태그 - 솔트를 쓰지 않으면 None
+    # 전처리 캐시 지문에 넣어, 솔트를 켜거나 바꾸면 연락처가 남은 이전 캐시를 쓰지 않도록 합니다.
+    salt = salt if salt is not None else os.environ.get(CUSTOMER_SALT_ENV) or None
+    return _salt_tag(salt) if salt else None
+
+
+def keymap_path(cache_dir, salt=None):
+    name = 'customer_keys.parquet' if not salt else f'customer_keys-{_salt_tag(salt)}.parquet'
+    return os.path.join(cache_dir, name)
+
+
+def _to_keys(codes, ids):
+    # factorize 코드(-1 = 결측) -> 고객키 (결측은 NA)
+    keys = ids[np.maximum(codes, 0)].astype(np.int32) if len(ids) else np.zeros(len(codes), dtype=np.int32)
+    return pd.arrays.IntegerArray(keys, codes < 0)
+
+
+def customer_keys(customers):
+    # 사전 없이 이 프레임 안에서만 쓰는 키 (등장 순서대로 0부터)
+    codes, uniques = pd.factorize(customers)
+    return pd.Series(_to_keys(codes, np.arange(len(uniques))), index=customers.index, name=CUSTOMER_KEY_COL)
+
+
+class CustomerKeyMap:
+    def __init__(self, tokens=None, salt=None, path=None):
+        # tokens: 키 순서대로의 연락처(또는 솔트 해시) - 위치가 곧 고객키
+        self.tokens = pd.Index(tokens if tokens is not None else [], dtype=object)
+        self.salt = salt
+        self.path = path
+        self._dirty = False
+
+    @classmethod
+    def load(cls, cache_dir, salt=None):
+        # 저장된 사전이 있으면 이어서 사용, 없거나 읽을 수 없으면 빈 사전
+        salt = salt if salt is not None else os.environ.get(CUSTOMER_SALT_ENV) or None
+        path = keymap_path(cache_dir, salt)
+        try:
+            tokens = pd.read_parquet(path, engine='pyarrow')['token'].astype(object)
+        except Exception:
+            tokens = None
+        return cls(tokens, salt, path)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def _tokenize(self, values):
+        if not self.salt:
+            return values
+        prefix = self.salt.encode('utf-8')
+        return [hashlib.blake2b(prefix + str(v).encode('utf-8'), digest_size=16).hexdigest() for v in values]
+
+    def encode(self, customers):
+        # 연락처 Series -> 고객키 Series (처음 보는 연락처는 사전 끝에 추가)
+        codes, uniques = pd.factorize(customers)
+        tokens = pd.Index(self._tokenize(np.asarray(uniques, dtype=object)), dtype=object)
+        ids = self.tokens.get_indexer(tokens)
+        new = ids < 0
+        if new.any():
+            ids[new] = len(self.tokens) + np.arange(int(new.sum()))
+            self.tokens = self.tokens.append(tokens[new])
+            self._dirty = True
+        return pd.Series(_to_keys(codes, ids), index=customers.index, name=CUSTOMER_KEY_COL)
+
+    def save(self):
+        # 새 키가 생겼을 때만 기록
+        if not self._dirty or not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        pd.DataFrame({'token': self.tokens.astype(str)}).to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def add_customer_keys(df, keymap=None):
+    # 고객키 컬럼 추가 (keymap 이 없으면 프레임 한정 키)
+    # 솔트를 쓰는 사전이면 원본 연락처 컬럼은 프레임에서 제거
+    if keymap is None:
+        df[CUSTOMER_KEY_COL] = customer_keys(df[CUSTOMER_COL])
+        return df
+    df[CUSTOMER_KEY_COL] = keymap.encode(df[CUSTOMER_COL])
+    if keymap.salt:
+        df = df.drop(columns=CUSTOMER_COL)
+    return df
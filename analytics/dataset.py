@@ -0,0 +1,138 @@
+import json
+import logging
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from .cube import CUBE_DIMENSIONS, CUBE_MEASURES, OrderCube
+from .export import arrow_schema
+
+# ----------------------------------------------------------------
+# 합산 가능한 집계용 큐브 전용 파티션 Parquet 백엔드 (선택 사항)
+# 처리된 주문을 그룹=/주문월= 하이브 파티션 Parquet 로 저장하고,
+# 큐브는 pyarrow dataset 을 배치 단위로 스캔하면서 부분 합계를 모아 만듭니다 (큐브를 만들 때 전체 프레임을 쓰지 않음).
+# 그룹 조건은 파티션 디렉터리 선택으로, 날짜 조건은 주문월 파티션 + row group 통계로 걸러집니다.
+# 결과는 OrderCube 이므로 대시보드의 큐브 기반 집계(합산 가능한 측정값)만 이 백엔드를 씁니다 -
+# 고객 / 행 단위 집계와 필터, 전체데이터 탭은 여전히 메모리에 적재한 주문 프레임을 사용합니다.
+# 기록할 때 원본 프레임의 지문(attrs['fingerprint'])을 _source.json 에 남겨 두고, from_env 는 적재된 프레임과
+# 지문이 다른(예전 데이터로 만든) 데이터셋은 쓰지 않습니다 - 데이터셋 집계가 프레임 집계와 어긋나지 않도록.
+# ----------------------------------------------------------------
+
+DATASET_DIR_ENV = 'ORDER_DATASET_DIR'
+MONTH_COLUMN = '주문월'
+PARTITIONING = ds.partitioning(pa.schema([('그룹', pa.string()), (MONTH_COLUMN, pa.string())]), flavor='hive')
+SCAN_BATCH_ROWS = 256 * 1024
+# 배치별 부분 합계가 이 행 수를 넘으면 한 번 더 합쳐서 메모리를 제한
+COMPACT_ROWS = 1_000_000
+# 원본 프레임 지문 파일 ('_' 로 시작하므로 pyarrow dataset 스캔에서는 제외됨)
+SOURCE_FILE = '_source.json'
+
+logger = logging.getLogger(__name__)
+
+_SCAN_COLUMNS = CUBE_DIMENSIONS + ['실결제 금액', '주문번호', '재구매여부']
+
+
+def _with_month(frame):
+    # 파티션 키: 주문일의 연-월 (주문일 결측은 하이브 기본 파티션으로)
+    return frame.assign(**{MONTH_COLUMN: frame['주문일'].dt.strftime('%Y-%m')})
+
+
+def write_order_dataset(frames, root, existing_data_behavior='delete_matching', fingerprint=None):
+    # 처리된 주문 프레임(하나 또는 여러 개)을 파티션 Parquet 로 기록
+    # 프레임을 하나씩 쓰므로 증분 파티션을 읽는 대로 넘기면 전체를 메모리에 모을 필요가 없음
+    # fingerprint 를 주지 않으면 첫 프레임의 attrs['fingerprint'] (load_or_build / ingest_partitions 결과)를 기록
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+    schema = None
+    for i, frame in enumerate(frames):
+        if schema is None and fingerprint is None:
+            fingerprint = frame.attrs.get('fingerprint')
+        frame = _with_month(frame)
+        if schema is None:
+            schema = arrow_schema(frame, frame)
+        table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+        ds.write_dataset(table, root, format='parquet', partitioning=PARTITIONING,
+                         basename_template=f'part-{i}-{{i}}.parquet',
+                         existing_data_behavior=existing_data_behavior if i == 0 else 'overwrite_or_ignore')
+    with open(os.path.join(root, SOURCE_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint}, f)
+    return root
+
+
+class OrderDataset:
+    def __init__(self, root):
+        self.root = root
+        self.dataset = ds.dataset(root, format='parquet', partitioning=PARTITIONING)
+
+    @classmethod
+    def from_env(cls, fingerprint=None):
+        # ORDER_DATASET_DIR 가 지정되어 있고 데이터가 있으면 백엔드 사용, 아니면 None
+        # fingerprint 가 주어지면 그 프레임으로 기록한 데이터셋만 사용 (다르거나 기록이 없으면 경고 후 None)
+        root = os.environ.get(DATASET_DIR_ENV)
+        if not root or not os.path.isdir(root):
+            return None
+        dataset = cls(root)
+        if fingerprint is not None and dataset.source_fingerprint() != fingerprint:
+            logger.warning('%s=%s 데이터셋의 원본 지문(%s)이 적재된 프레임(%s)과 달라 사용하지 않습니다',
+                           DATASET_DIR_ENV, root, dataset.source_fingerprint(), fingerprint)
+            return None
+        return dataset
+
+    def source_fingerprint(self):
+        # 데이터셋을 기록한 원본 프레임의 지문 (기록이 없으면 None)
+        try:
+            with open(os.path.join(self.root, SOURCE_FILE), encoding='utf-8') as f:
+                return json.load(f).get('fingerprint')
+        except (OSError, ValueError):
+            return None
+
+    def filter_expression(self, groups=None, start=None, end=None):
+        # 그룹 / 기간 [start, end] 조건 (start, end 는 날짜, 끝 날짜 포함)
+        conditions = []
+        if groups is not None:
+            conditions.append(ds.field('그룹').isin(list(groups)))
+        if start is not None:
+            start = pd.Timestamp(start).normalize()
+            conditions.append(ds.field(MONTH_COLUMN) >= start.strftime('%Y-%m'))
+            conditions.append(ds.field('주문일') >= pa.scalar(start, pa.timestamp('ns')))
+        if end is not None:
+            end = pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+            conditions.append(ds.field(MONTH_COLUMN) <= (end - pd.Timedelta(days=1)).strftime('%Y-%m'))
+            conditions.append(ds.field('주문일') < pa.scalar(end, pa.timestamp('ns')))
+        expr = None
+        for cond in conditions:
+            expr = cond if expr is None else expr & cond
+        return expr
+
+    def iter_batches(self, columns, groups=None, start=None, end=None, batch_rows=SCAN_BATCH_ROWS):
+        # 조건에 맞는 행을 필요한 컬럼만 배치 단위 pandas 프레임으로
+        scanner = self.dataset.scanner(columns=columns, filter=self.filter_expression(groups, start, end),
+                                       batch_size=batch_rows)
+        for batch in scanner.to_batches():
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def build_cube(self, groups=None, start=None, end=None, batch_rows=SCAN_BATCH_ROWS):
+        # OrderCube.build 와 같은 팩트 테이블을 배치별 부분 합계로 계산
+        partials = []
+        pending = 0
+        for batch in self.iter_batches(_SCAN_COLUMNS, groups, start, end, batch_rows):
+            partials.append(OrderCube.build(batch).facts)
+            pending += len(partials[-1])
+            if pending > COMPACT_ROWS:
+                partials = [_combine(partials)]
+                pending = len(partials[0])
+        if not partials:
+            return OrderCube(pd.DataFrame(columns=CUBE_DIMENSIONS + CUBE_MEASURES))
+        return OrderCube(_combine(partials))
+
+    def rollup(self, dims, measures=None, groups=None, start=None, end=None):
+        # 자주 쓰는 단축형: 조건으로 걸러 스캔한 뒤 dims 로 합산
+        return self.build_cube(groups, start, end).rollup(dims, measures)
+
+
+def _combine(partials):
+    facts = pd.concat(partials, ignore_index=True)
+    return facts.groupby(CUBE_DIMENSIONS, observed=True, dropna=False, sort=False)[CUBE_MEASURES].sum().reset_index()
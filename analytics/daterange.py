@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 주문일 기간 필터용 정렬 인덱스
+# 로드 시 '주문일' 오름차순 행 위치를 한 번 만들어 두고, 기간 [start, end] 는
+# 정렬된 날짜 배열에서 이진 탐색(searchsorted)으로 구간 경계만 찾아 잘라냅니다 (전체 마스크 스캔 없음).
+# ----------------------------------------------------------------
+
+
+def _day_bounds(start, end):
+    # 날짜 단위 기간 -> [start 00:00, end 다음날 00:00) 타임스탬프
+    lo = None if start is None else np.datetime64(pd.Timestamp(start).normalize(), 'ns')
+    hi = None if end is None else np.datetime64(pd.Timestamp(end).normalize() + pd.Timedelta(days=1), 'ns')
+    return lo, hi
+
+
+class DateIndex:
+    def __init__(self, order_dt):
+        values = order_dt.to_numpy(dtype='datetime64[ns]')
+        valid = np.flatnonzero(~np.isnat(values))
+        # 오름차순 행 위치 / 정렬된 날짜 / 날짜 결측 행 위치
+        self.order = valid[np.argsort(values[valid], kind='stable')]
+        self.sorted_values = values[self.order]
+        self.missing = np.flatnonzero(np.isnat(values))
+
+    def __len__(self):
+        return len(self.order) + len(self.missing)
+
+    def bounds(self):
+        # (첫 주문일, 마지막 주문일) - 날짜가 하나도 없으면 (None, None)
+        if not len(self.sorted_values):
+            return None, None
+        return pd.Timestamp(self.sorted_values[0]).date(), pd.Timestamp(self.sorted_values[-1]).date()
+
+    def window(self, start=None, end=None):
+        # 기간에 해당하는 정렬 위치 구간 [lo, hi) (end 는 그날 포함)
+        lo_ts, hi_ts = _day_bounds(start, end)
+        lo = 0 if lo_ts is None else int(np.searchsorted(self.sorted_values, lo_ts, side='left'))
+        hi = len(self.order) if hi_ts is None else int(np.searchsorted(self.sorted_values, hi_ts, side='left'))
+        return lo, max(lo, hi)
+
+    def positions(self, start=None, end=None):
+        # 기간에 해당하는 행 위치 (원본 행 순서)
+        lo, hi = self.window(start, end)
+        return np.sort(self.order[lo:hi])
+
+    def covers(self, start, end):
+        # 기간이 전체 주문일 범위를 포함하는지 (포함하면 슬라이스 없이 원본을 그대로 사용)
+        first, last = self.bounds()
+        return first is None or ((start is None or start <= first) and (end is None or end >= last))
+
+    def slice(self, df, start=None, end=None):
+        # 기간 안의 행만 원본 순서대로 (날짜 결측 행은 제외)
+        return df.iloc[self.positions(start, end)]
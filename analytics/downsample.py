@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 시계열 차트 다운샘플링 (Largest-Triangle-Three-Buckets)
+# 일자별 시계열이 수년치로 길어져도 차트에는 max_points 개까지만 보냅니다.
+# 구간마다 모양을 가장 많이 바꾸는 점(삼각형 넓이 최대)을 골라 스파이크/골이 유지됩니다.
+# ----------------------------------------------------------------
+
+DEFAULT_MAX_POINTS = 1000
+
+
+def lttb_indices(x, y, n_out):
+    # x 오름차순 (float), 반환: 남길 행 위치 (첫/마지막 점 포함)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (n_out - 2)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        # 다음 구간의 평균점 (마지막 구간이면 마지막 점)
+        next_end = min(int((i + 2) * every) + 1, n)
+        if next_end <= end:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        else:
+            avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    keep[-1] = n - 1
+    return keep
+
+
+def downsample_series(df, x, y, max_points=DEFAULT_MAX_POINTS):
+    # x(날짜) 순으로 정렬된 df 를 max_points 행 이하로 줄임 (짧으면 그대로 반환)
+    if len(df) <= max_points:
+        return df
+    xs = pd.to_datetime(df[x]).to_numpy(dtype='datetime64[ns]').astype('int64').astype('float64')
+    ys = df[y].to_numpy(dtype='float64', na_value=0.0)
+    return df.iloc[lttb_indices(xs, ys, max_points)]
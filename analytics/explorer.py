@@ -0,0 +1,89 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .daterange import DateIndex
+
+# ----------------------------------------------------------------
+# 주문 데이터 페이지 탐색기
+# 로드 시 '주문일' 정렬 인덱스(DateIndex)를 한 번 만들어 두고,
+# 페이지를 넘길 때는 요청한 페이지의 행만 iloc 으로 꺼냅니다 (매번 전체 정렬 없음).
+# 기간 조건은 정렬 위치의 연속 구간이므로 이진 탐색으로 잘라내고,
+# 필터 조합별 정렬 위치는 처음 한 번만 계산해 작은 LRU 에 보관합니다.
+# ----------------------------------------------------------------
+
+SORT_COLUMN = '주문일'
+DEFAULT_PAGE_SIZE = 100
+
+
+def _filter_key(filters):
+    # {컬럼: 값 목록} -> 순서와 무관한 해시 가능 키
+    return tuple(sorted((col, tuple(sorted(map(str, values)))) for col, values in (filters or {}).items()))
+
+
+class OrderExplorer:
+    def __init__(self, df, date_index=None, filter_index=None, sort_col=SORT_COLUMN, max_views=16):
+        self.df = df
+        self.filter_index = filter_index
+        self.sort_col = sort_col
+        self.max_views = max_views
+        # 날짜 결측은 정렬 방향과 관계없이 항상 마지막 (sort_values 와 동일)
+        self.index = date_index if date_index is not None else DateIndex(df[sort_col])
+        self._views = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _view(self, filters, start=None, end=None):
+        # 필터 조합 + 기간의 (정렬된 위치, 결측 위치) - 처음 요청 시 O(n), 이후 재사용
+        # 기간을 지정하면 날짜 결측 행은 제외
+        key = (_filter_key(filters), start, end)
+        if key == ((), None, None):
+            return self.index.order, self.index.missing
+        with self._lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                return self._views[key]
+        if start is None and end is None:
+            ordered, missing = self.index.order, self.index.missing
+        else:
+            lo, hi = self.index.window(start, end)
+            ordered, missing = self.index.order[lo:hi], self.index.missing[:0]
+        if filters:
+            if self.filter_index is not None:
+                # 값별 행 위치 인덱스로 조건 행을 구해 마스크로 표시
+                mask = np.zeros(len(self.df), dtype=bool)
+                mask[self.filter_index.resolve(filters)] = True
+            else:
+                mask = np.ones(len(self.df), dtype=bool)
+                for col, values in filters.items():
+                    mask &= self.df[col].isin(values).to_numpy()
+            ordered, missing = ordered[mask[ordered]], missing[mask[missing]]
+        view = ordered, missing
+        with self._lock:
+            self._views[key] = view
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+        return view
+
+    def count(self, filters=None, start=None, end=None):
+        ordered, missing = self._view(filters, start, end)
+        return len(ordered) + len(missing)
+
+    def page_count(self, filters=None, page_size=DEFAULT_PAGE_SIZE, start=None, end=None):
+        return max(1, -(-self.count(filters, start, end) // page_size))
+
+    def page(self, page=0, page_size=DEFAULT_PAGE_SIZE, filters=None, descending=True, start=None, end=None):
+        # page 번째(0부터) 페이지의 행만 꺼내 반환
+        ordered, missing = self._view(filters, start, end)
+        if descending:
+            ordered = ordered[::-1]
+        first = page * page_size
+        last = first + page_size
+        n = len(ordered)
+        positions = np.concatenate([ordered[first:last], missing[max(first - n, 0):max(last - n, 0)]])
+        return self.df.iloc[positions]
+
+    def iter_batches(self, filters=None, descending=True, batch_rows=DEFAULT_PAGE_SIZE, start=None, end=None):
+        # 화면과 같은 정렬/필터 순서로 전체 결과를 batch_rows 행씩 (내보내기용)
+        for page in range(self.page_count(filters, batch_rows, start, end)):
+            yield self.page(page, batch_rows, filters, descending, start, end)
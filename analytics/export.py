@@ -0,0 +1,84 @@
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# ----------------------------------------------------------------
+# 필터링된 주문 / 집계 표 내보내기 (CSV, Parquet)
+# 프레임 전체를 한 번에 문자열/Arrow 테이블로 바꾸지 않고 batch_rows 행씩 변환해 sink 에 씁니다.
+# 변환 중간 메모리는 배치 하나 크기입니다 (CSV: 배치별 인코딩, Parquet: 배치 = row group).
+# 단, 대시보드 다운로드는 Streamlit 이 완성된 파일 전체를 메모리에 보관하므로
+# 한 번에 내보낼 수 있는 행 수를 EXPORT_MAX_ROWS 로 제한합니다.
+# ----------------------------------------------------------------
+
+EXPORT_BATCH_ROWS = 100_000
+EXPORT_MAX_ROWS = 1_000_000
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+
+def frame_batches(df, batch_rows=EXPORT_BATCH_ROWS):
+    # 행 구간 단위로 나눈 프레임 (iloc 슬라이스라 배치마다 원본을 복사하지 않음)
+    for start in range(0, max(len(df), 1), batch_rows):
+        yield df.iloc[start:start + batch_rows]
+
+
+def iter_csv_chunks(batches, index=False):
+    # 배치마다 인코딩한 CSV 바이트 (헤더는 첫 배치에만, 엑셀 한글 호환을 위해 UTF-8 BOM)
+    header = True
+    for batch in batches:
+        chunk = batch.to_csv(index=index, header=header)
+        yield (('\ufeff' if header else '') + chunk).encode('utf-8')
+        header = False
+
+
+def arrow_schema(batch, df=None, index=False):
+    # 첫 배치로 스키마를 정하되, 첫 배치에서 전부 결측인 컬럼은 전체 프레임의 첫 유효값으로 타입 추론
+    schema = pa.Schema.from_pandas(batch, preserve_index=index)
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type) and df is not None and field.name in df.columns:
+            first = df[field.name].first_valid_index()
+            if first is not None:
+                schema = schema.set(i, field.with_type(pa.array([df[field.name].loc[first]]).type))
+    return schema
+
+
+def write_parquet(batches, sink, df=None, index=False):
+    # 배치마다 row group 하나로 기록 (df: 스키마 보정용 전체 프레임, 선택)
+    writer = None
+    try:
+        for batch in batches:
+            if writer is None:
+                schema = arrow_schema(batch, df, index)
+                writer = pq.ParquetWriter(sink, schema)
+            writer.write_table(pa.Table.from_pandas(batch, schema=schema, preserve_index=index))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_batches(batches, fmt, sink, df=None, index=False):
+    # batches 를 fmt('csv' / 'parquet') 형식으로 sink(파일 경로 또는 바이너리 파일 객체)에 기록
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+    if fmt == 'parquet':
+        write_parquet(batches, sink, df, index)
+        return
+    if isinstance(sink, (str, bytes)) or hasattr(sink, '__fspath__'):
+        with open(sink, 'wb') as f:
+            write_batches(batches, fmt, f, df, index)
+        return
+    for chunk in iter_csv_chunks(batches, index):
+        sink.write(chunk)
+
+
+def export_frame(df, fmt, sink=None, batch_rows=EXPORT_BATCH_ROWS, index=False):
+    # df 를 배치 단위로 내보냄 - sink 가 없으면 메모리 버퍼에 써서 bytes 반환 (작은 집계 표용)
+    if sink is None:
+        buffer = io.BytesIO()
+        write_batches(frame_batches(df, batch_rows), fmt, buffer, df, index)
+        return buffer.getvalue()
+    write_batches(frame_batches(df, batch_rows), fmt, sink, df, index)
+    return sink
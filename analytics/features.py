@@ -0,0 +1,85 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 파생 컬럼 (벡터화 버전)
+# 기존 df.apply(..., axis=1) 행 단위 루프를 컬럼 연산으로 대체합니다.
+# 결과는 기존 classify_purpose / classify_time_cluster 와 동일해야 합니다.
+# ----------------------------------------------------------------
+
+INFLUENCER_NAME = '킹댕즈'
+GENERAL_GROUP = '일반 셀러'
+
+# 구매 목적 분류 기준 (과수 크기 키워드 또는 고단가)
+GIFT_KEYWORDS = ['선물', '명품', '로얄', '특']
+GIFT_PRICE_THRESHOLD = 35000
+
+# 구매 시점 클러스터 (요일 x 시간)
+DAWN_END_HOUR = 7  # 0시 ~ 6시 = 새벽
+CLUSTER_WEEKEND_DAWN = 0
+CLUSTER_WEEKDAY_PEAK = 1
+CLUSTER_WEEKEND_PEAK = 2
+CLUSTER_WEEKDAY_DAWN = 3
+
+# 요일 표시 순서 (요일 컬럼의 ordered category 순서)
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def derive_group(sellers):
+    # 인플루언서 그룹핑 (셀러명 == 킹댕즈 여부)
+    return pd.Series(np.where(sellers == INFLUENCER_NAME, INFLUENCER_NAME, GENERAL_GROUP),
+                     index=sellers.index, dtype=object)
+
+
+def derive_purpose(sizes, prices):
+    # 과수 크기는 고유값 단위로만 키워드를 검사한 뒤 코드로 펼칩니다 (수백만 행에서도 고유값은 수십 개).
+    # 기존 로직의 str(NaN) == 'nan' 은 키워드를 포함하지 않으므로 결측은 False 로 처리됩니다.
+    codes, uniques = pd.factorize(sizes, use_na_sentinel=True)
+    pattern = '|'.join(re.escape(k) for k in GIFT_KEYWORDS)
+    has_keyword = pd.Series(uniques).astype(str).str.contains(pattern, regex=True).to_numpy(dtype=bool)
+    if len(uniques):
+        keyword_mask = np.where(codes >= 0, has_keyword[codes], False)
+    else:
+        keyword_mask = np.zeros(len(codes), dtype=bool)
+
+    gift_mask = keyword_mask | (prices >= GIFT_PRICE_THRESHOLD).to_numpy()
+    return pd.Series(np.where(gift_mask, '선물용', '자기소비용'), index=sizes.index, dtype=object)
+
+
+def derive_time_cluster(order_dt):
+    # NaT 는 hour/dayofweek 가 NaN 이 되어 모든 비교가 False -> 기존과 동일하게 평일 피크(1)로 떨어집니다.
+    hr = order_dt.dt.hour
+    dy = order_dt.dt.dayofweek  # 0:월, 5:토, 6:일
+    is_weekend = (dy >= 5).to_numpy()
+    is_dawn = ((hr >= 0) & (hr < DAWN_END_HOUR)).to_numpy()
+
+    cluster = np.select(
+        [is_weekend & is_dawn, is_weekend, is_dawn],
+        [CLUSTER_WEEKEND_DAWN, CLUSTER_WEEKEND_PEAK, CLUSTER_WEEKDAY_DAWN],
+        default=CLUSTER_WEEKDAY_PEAK,
+    ).astype('int64')
+    return pd.Series(cluster, index=order_dt.index)
+
+
+def derive_time_columns(order_dt):
+    # 탭마다 f_df 에 붙이던 시간 파생 컬럼(주차 / 요일 / 주문시간)을 로드 시 한 번만 계산합니다.
+    # 주차는 그 주 월요일 날짜 (ISO 주 번호는 해가 바뀌면 겹치고 연말->연초 순서가 뒤집힘)
+    # 요일 / 주문시간은 작은 dtype (category / Int8) 으로 담아 전체 프레임 메모리 증가를 최소화합니다.
+    return pd.DataFrame({
+        '주차': order_dt.dt.normalize() - pd.to_timedelta(order_dt.dt.weekday, unit='D'),
+        '요일': pd.Categorical(order_dt.dt.day_name(), categories=DAY_ORDER, ordered=True),
+        '주문시간': order_dt.dt.hour.astype('Int8'),
+    }, index=order_dt.index)
+
+
+def add_derived_features(df):
+    # 그룹 / 구매목적 / time_cluster / 고객유형 / 시간 파생 컬럼을 한 번에 추가합니다.
+    df['그룹'] = derive_group(df['셀러명'])
+    df['구매목적'] = derive_purpose(df['과수 크기'], df['실결제 금액'])
+    df['time_cluster'] = derive_time_cluster(df['주문일'])
+    # 원본 '재구매 횟수' 기준 신규/재구매 고객 구분 (여러 탭에서 공통 사용)
+    df['고객유형'] = np.where(df['재구매 횟수'] > 0, '재구매 고객', '신규 고객').astype(object)
+    df[['주차', '요일', '주문시간']] = derive_time_columns(df['주문일'])
+    return df
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 사이드바 다차원 필터용 값별 행 위치 인덱스 (비트맵 대신 정렬된 행 id 목록)
+# 로드 시 필터 컬럼마다 값을 정수 코드로 바꾸고(factorize), 값별 행 위치 목록을
+# CSR 형태(코드순 정렬 위치 + 값별 시작 오프셋)로 한 번 만들어 둡니다.
+# 조건 조합은 가장 작은 행 집합에서 시작해 나머지 컬럼의 코드만 확인하며 좁히므로
+# 매번 전체 행에 대해 isin 마스크를 만들지 않습니다.
+# ----------------------------------------------------------------
+
+FILTER_COLUMNS = ['그룹', '셀러명', '주문경로', '광역지역(정식)', '품종', '구매목적']
+
+
+class _ColumnIndex:
+    def __init__(self, values):
+        codes, uniques = pd.factorize(values, sort=True)
+        self.codes = codes.astype(np.int32)
+        self.lookup = {value: code for code, value in enumerate(uniques)}
+        self.values = list(uniques)
+        # 코드순(같은 코드 안에서는 행 순서) 정렬 위치와 코드별 구간 경계 (결측 코드 -1 은 앞쪽에 모임)
+        self.order = np.argsort(self.codes, kind='stable')
+        self.offsets = np.searchsorted(self.codes[self.order], np.arange(len(uniques) + 1), side='left')
+
+    def selected_codes(self, values):
+        return np.array(sorted({self.lookup[v] for v in values if v in self.lookup}), dtype=np.int32)
+
+    def rows(self, codes):
+        # 선택한 값들의 행 위치 (오름차순)
+        parts = [self.order[self.offsets[c]:self.offsets[c + 1]] for c in codes]
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        return parts[0] if len(parts) == 1 else np.sort(np.concatenate(parts))
+
+    def size(self, codes):
+        return int(sum(self.offsets[c + 1] - self.offsets[c] for c in codes))
+
+
+class FilterIndex:
+    def __init__(self, df, columns=FILTER_COLUMNS):
+        self.n_rows = len(df)
+        self.columns = {col: _ColumnIndex(df[col]) for col in columns}
+
+    def add_column(self, name, values):
+        # 프레임 밖에서 만든 행 단위 값(예: 고객 세그먼트)도 같은 방식으로 필터 컬럼에 추가
+        self.columns[name] = _ColumnIndex(values)
+        return self
+
+    def values(self, column):
+        # 필터 선택지 (정렬된 고유값, 결측 제외)
+        return self.columns[column].values
+
+    def resolve(self, conditions, within=None):
+        # {컬럼: 값 목록} 조건을 모두 만족하는 행 위치 (오름차순)
+        # within: 미리 좁힌 후보 행 위치 (예: 기간 필터 결과, 오름차순) / 조건도 within 도 없으면 None (= 전체 행)
+        conditions = {col: values for col, values in (conditions or {}).items() if values is not None}
+        if not conditions:
+            return within
+        selected = {col: self.columns[col].selected_codes(values) for col, values in conditions.items()}
+        rows = within
+        if rows is None:
+            # 가장 작은 값 목록의 행에서 출발
+            base = min(selected, key=lambda col: self.columns[col].size(selected[col]))
+            rows = self.columns[base].rows(selected.pop(base))
+        for col, codes in selected.items():
+            rows = rows[np.isin(self.columns[col].codes[rows], codes)]
+        return rows
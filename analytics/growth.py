@@ -0,0 +1,101 @@
+from .features import GENERAL_GROUP, INFLUENCER_NAME
+
+# ----------------------------------------------------------------
+# 셀러 성장 전략 보고서 지표
+# 보고서 탭의 표/차트 데이터를 계산하는 순수 함수 (입력은 growth_orders 로 정제한 프레임)
+# ----------------------------------------------------------------
+
+INFLUENCER_LABEL = '인플루언서(킹댕즈)'
+MIN_CHANNEL_SHARE = 1.0  # 비중(%) 미만 유입경로는 '기타'로 묶음
+CUSTOMER_MIX_COLUMNS = ['신규 고객(선물용)', '신규 고객(자기소비용)', '재구매 고객(선물용)', '재구매 고객(자기소비용)']
+
+
+def growth_orders(f_df):
+    # [데이터 클리닝] 결측치 및 0원 데이터를 하나의 마스크로 제외 (중간 복사본 없음)
+    # 1. 가격 데이터가 없거나 0원인 경우 / 2. 주요 분석 컬럼 결측 / 3. 빈 주문경로
+    valid = f_df['실결제 금액'] > 0
+    valid &= f_df[['실결제 금액', '그룹', '주문경로', '주문날짜', '고객유형']].notna().all(axis=1)
+    valid &= f_df['주문경로'].astype(str).str.strip() != ""
+    return f_df[valid]
+
+
+def variety_price_premium(df, variety='감귤'):
+    # 같은 품종 안에서 킹댕즈 평균 결제액이 일반 셀러보다 몇 % 높은지 (두 그룹이 모두 있어야 계산, 없으면 None)
+    means = df[df['품종'] == variety].groupby('그룹', observed=True)['실결제 금액'].mean()
+    if INFLUENCER_NAME not in means.index or GENERAL_GROUP not in means.index:
+        return None
+    return round((means[INFLUENCER_NAME] - means[GENERAL_GROUP]) / means[GENERAL_GROUP] * 100, 1)
+
+
+def group_summary(df):
+    # 그룹별 총 매출액 / 총 주문건수 / 참여 셀러 수 / 셀러 1인당 평균 매출
+    summary_stats = df.groupby('그룹', observed=True).agg({
+        '실결제 금액': 'sum',
+        '주문번호': 'count',
+        '셀러명': 'nunique'
+    }).reset_index()
+    summary_stats['그룹'] = summary_stats['그룹'].replace(INFLUENCER_NAME, INFLUENCER_LABEL)
+    summary_stats.columns = ['그룹', '총 매출액', '총 주문건수', '참여 셀러 수']
+    summary_stats['셀러 1인당 평균 매출'] = summary_stats['총 매출액'] / summary_stats['참여 셀러 수']
+    return summary_stats
+
+
+def channel_share(df, min_share=MIN_CHANNEL_SHARE):
+    # 그룹별 유입 경로 주문 건수와 비중(%) - min_share 미만 경로는 '기타'로 합산
+    channel_comp = df.groupby(['그룹', '주문경로'], observed=True).size().reset_index(name='주문건수')
+    group_totals = channel_comp.groupby('그룹', observed=True)['주문건수'].transform('sum')
+    channel_comp['비중(%)'] = (channel_comp['주문건수'] / group_totals * 100).round(1)
+    channel_comp['주문경로_집계'] = channel_comp['주문경로'].astype(object).where(
+        channel_comp['비중(%)'] >= min_share, '기타')
+    return channel_comp.groupby(['그룹', '주문경로_집계'], observed=True).agg(
+        {'주문건수': 'sum', '비중(%)': 'sum'}).reset_index()
+
+
+def customer_type_counts(df, group):
+    counts = df[df['그룹'] == group]['고객유형'].value_counts().reset_index()
+    counts.columns = ['고객유형', '건수']
+    return counts
+
+
+def daily_revenue_spike(kd_only):
+    # 일자별 매출과 최고 매출일 행
+    kd_daily = kd_only.groupby('주문날짜', observed=True)['실결제 금액'].sum().reset_index()
+    return kd_daily, kd_daily.loc[kd_daily['실결제 금액'].idxmax()]
+
+
+def daily_customer_mix(kd_only):
+    # 일자별 (신규/재구매 x 선물/자기소비) 주문 건수 - 없는 조합은 0으로 채움
+    kd_detail = kd_only.groupby(['주문날짜', '고객유형', '구매목적'], observed=True).size().unstack(
+        level=[1, 2], fill_value=0)
+    kd_detail.columns = [f"{col[0]}({col[1]})" for col in kd_detail.columns]
+    kd_detail = kd_detail.reset_index()
+    for col in CUSTOMER_MIX_COLUMNS:
+        if col not in kd_detail.columns:
+            kd_detail[col] = 0
+    kd_detail['총 주문건수'] = kd_detail[CUSTOMER_MIX_COLUMNS].sum(axis=1)
+    return kd_detail[['주문날짜'] + CUSTOMER_MIX_COLUMNS + ['총 주문건수']].sort_values('주문날짜')
+
+
+def daily_repeat_trend(kd_only):
+    # 일자별 신규 / 재구매 고객 주문 건수와 재구매 비중(%)
+    kd_trend = kd_only.groupby(['주문날짜', '고객유형'], observed=True).size().unstack(fill_value=0).reset_index()
+    for col in ['신규 고객', '재구매 고객']:
+        if col not in kd_trend.columns:
+            kd_trend[col] = 0
+    kd_trend['재구매 비중(%)'] = (kd_trend['재구매 고객'] / (kd_trend['신규 고객'] + kd_trend['재구매 고객']) * 100).round(1)
+    return kd_trend
+
+
+def customer_type_channels(kd_only):
+    # 고객유형별 유입 경로 주문 건수와 비중(%)
+    path_type = kd_only.groupby(['고객유형', '주문경로'], observed=True).size().reset_index(name='주문건수')
+    path_type['비중(%)'] = path_type.groupby('고객유형', observed=True)['주문건수'].transform(
+        lambda x: (x / x.sum() * 100).round(1))
+    return path_type
+
+
+def common_item_aov(df):
+    # 두 그룹이 모두 판매한 품종만 골라 품종 x 그룹 평균 결제액 비교
+    common_items = df.groupby(['품종', '그룹'], observed=True).size().unstack().dropna().index.tolist()
+    aov_item_df = df[df['품종'].isin(common_items)]
+    return aov_item_df.groupby(['품종', '그룹'], observed=True)['실결제 금액'].mean().reset_index()
@@ -0,0 +1,156 @@
+import hashlib
+import os
+
+import pandas as pd
+
+from .customers import CUSTOMER_KEY_COL, CustomerKeyMap, add_customer_keys, customer_salt_tag
+from .features import add_derived_features
+from .repurchase import add_repurchase_columns
+from .schema import read_orders
+from .store import PIPELINE_VERSION, cache_dir_for, cache_paths, file_fingerprint, fingerprint_key, is_fresh, \
+    read_meta, write_cached_frame, write_meta
+
+# ----------------------------------------------------------------
+# 일자별 주문 파티션 증분 적재
+# 데이터 폴더의 *.csv (예: orders_2025-10-01.csv) 중 아직 적재하지 않은 파일만 읽어
+# 처리된 프레임(Parquet)에 이어 붙입니다. 재구매 컬럼은 새 주문에 등장한 고객의 행만 다시 계산하고,
+# 값이 실제로 바뀐 행이 속한 그룹의 버전만 올려 그 그룹을 포함한 집계 캐시만 무효화합니다.
+# 이미 적재한 파일이 바뀌거나 삭제되면 전체를 다시 만듭니다.
+# ----------------------------------------------------------------
+
+PARTITION_SUFFIX = '.csv'
+REPURCHASE_COLUMNS = ['재구매_날짜순서', '재구매여부', '최초주문일', '이전주문일', '구매간격']
+
+
+def list_partitions(data_dir):
+    # 파일명 순서 = 적재 순서 (날짜가 들어간 파일명 기준)
+    return sorted(e.name for e in os.scandir(data_dir) if e.is_file() and e.name.endswith(PARTITION_SUFFIX))
+
+
+def partition_signature(data_dir):
+    # (이름, 크기, 수정시각) 목록 - 매 rerun 계산해도 가벼워서 st.cache_data 키로 사용
+    if not data_dir or not os.path.isdir(data_dir):
+        return None
+    signature = []
+    for name in list_partitions(data_dir):
+        stat = os.stat(os.path.join(data_dir, name))
+        signature.append((name, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def prepare_partition(file_path, start_index=0, keymap=None):
+    # 행 단위로 끝나는 전처리(타입 적재 / 고객키 / 날짜 / 그룹 / 구매목적 / 시간 파생)만 수행
+    # 인덱스는 기존 행과 겹치지 않도록 start_index 부터 매깁니다.
+    df = read_orders(file_path)
+    df.index = pd.RangeIndex(start_index, start_index + len(df))
+    df = add_customer_keys(df, keymap)
+    df['주문날짜'] = df['주문일'].dt.date
+    return add_derived_features(df)
+
+
+def _concat(frames):
+    # category 컬럼은 카테고리를 합친 뒤 이어 붙여야 object 로 풀리지 않습니다.
+    first = frames[0]
+    for col in first.columns:
+        if not isinstance(first[col].dtype, pd.CategoricalDtype):
+            continue
+        if all(f[col].dtype == first[col].dtype for f in frames[1:]):
+            continue
+        categories = first[col].cat.categories
+        for f in frames[1:]:
+            categories = categories.append(f[col].astype('category').cat.categories)
+        categories = categories.unique()
+        frames = [f.assign(**{col: f[col].astype('category').cat.set_categories(categories)}) for f in frames]
+    return pd.concat(frames)
+
+
+def merge_orders(base, delta, customer_col=CUSTOMER_KEY_COL):
+    # 새 주문(delta)을 처리된 프레임(base)에 붙이고 재구매 컬럼이 바뀐 그룹 집합을 함께 반환
+    if base is None or base.empty:
+        merged = add_repurchase_columns(delta, customer_col)
+        return merged, set(merged['그룹'].dropna().unique())
+
+    # 새 주문에 등장한 고객의 기존 행만 꺼내서 새 주문과 함께 다시 계산
+    touched = base[customer_col].isin(delta[customer_col].dropna().unique()).to_numpy()
+    old_rows = base[touched]
+    recomputed = add_repurchase_columns(_concat([old_rows.drop(columns=REPURCHASE_COLUMNS), delta]), customer_col)
+
+    before = old_rows[REPURCHASE_COLUMNS]
+    after = recomputed.loc[old_rows.index, REPURCHASE_COLUMNS]
+    changed = ~((before == after) | (before.isna() & after.isna())).all(axis=1)
+    affected = set(delta['그룹'].dropna().unique()) | set(old_rows.loc[changed, '그룹'].dropna().unique())
+
+    return _concat([base[~touched], recomputed]), affected
+
+
+def _dataset_hash(partitions):
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(partitions):
+        h.update(f"{name}:{partitions[name]['hash']}".encode('utf-8'))
+    return h.hexdigest()
+
+
+def _load_store(data_dir, names):
+    # 이미 적재한 파티션이 그대로일 때만 저장된 프레임을 재사용
+    parquet_path, meta_path = cache_paths(data_dir)
+    meta = read_meta(meta_path)
+    if meta is None or meta.get('version') != PIPELINE_VERSION or meta.get('salt') != customer_salt_tag() or \
+            not os.path.exists(parquet_path):
+        return None, None
+    partitions = meta.get('partitions', {})
+    mtimes = {name: fp.get('mtime_ns') for name, fp in partitions.items()}
+    for name, fp in partitions.items():
+        if name not in names or not is_fresh(fp, os.path.join(data_dir, name)):
+            return None, None
+    try:
+        df = pd.read_parquet(parquet_path, engine='pyarrow')
+    except Exception:
+        return None, None
+    if any(fp.get('mtime_ns') != mtimes[name] for name, fp in partitions.items()):
+        # 내용은 같고 수정시각만 바뀐 파티션 - 새 수정시각을 기록해 다음 시작부터 해시 계산 생략
+        write_meta(meta_path, meta)
+    return df, meta
+
+
+def ingest_partitions(data_dir):
+    # 새 파티션만 적재한 프레임을 반환 (파티션이 없으면 None)
+    # attrs: fingerprint(내용 지문) / store_key(저장소 식별자) / group_versions(그룹별 버전)
+    data_dir = os.path.abspath(data_dir)
+    names = list_partitions(data_dir)
+    if not names:
+        return None
+
+    # 고객키 사전은 저장된 프레임보다 오래 유지 (전체 재생성 시에도 같은 연락처는 같은 키)
+    keymap = CustomerKeyMap.load(cache_dir_for(data_dir))
+    df, meta = _load_store(data_dir, names)
+    if df is not None and (len(keymap) < meta.get('customer_keys', 0) or CUSTOMER_KEY_COL not in df.columns):
+        # 사전이 지워졌거나 맞지 않으면 저장된 키를 믿을 수 없으므로 전체 재생성
+        df = None
+    if df is None:
+        meta = {'version': PIPELINE_VERSION, 'salt': customer_salt_tag(), 'partitions': {}, 'group_versions': {},
+                'next_index': 0}
+
+    new_names = [name for name in names if name not in meta['partitions']]
+    if new_names:
+        deltas = []
+        for name in new_names:
+            path = os.path.join(data_dir, name)
+            fp = file_fingerprint(path)
+            deltas.append(prepare_partition(path, meta['next_index'], keymap))
+            meta['next_index'] += len(deltas[-1])
+            meta['partitions'][name] = fp
+
+        df, affected = merge_orders(df, _concat(deltas))
+        for group in affected:
+            meta['group_versions'][group] = meta['group_versions'].get(group, 0) + 1
+        meta['hash'] = _dataset_hash(meta['partitions'])
+        # 전체 재생성 시에는 저장소 식별자도 새로 발급 (이전 그룹 버전 키와 섞이지 않도록)
+        meta.setdefault('store_id', meta['hash'])
+        keymap.save()
+        meta['customer_keys'] = len(keymap)
+        write_cached_frame(data_dir, df, meta)
+
+    df.attrs['fingerprint'] = fingerprint_key(meta)
+    df.attrs['store_key'] = f"{meta['store_id']}-v{PIPELINE_VERSION}"
+    df.attrs['group_versions'] = dict(meta['group_versions'])
+    return df
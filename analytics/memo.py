@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .shared import session_view
+
+# ----------------------------------------------------------------
+# 집계 결과 LRU 캐시
+# 키 = (데이터셋 지문, 선택된 그룹 튜플) + 집계 함수 이름
+# 원본 프레임을 해싱하지 않으므로 st.cache_data 보다 조회 비용이 작습니다.
+# ----------------------------------------------------------------
+
+
+def selection_key(data_key, selected_groups, group_versions=None, date_range=None, filters=None, revision=None):
+    # 선택 순서와 무관하게 같은 조합이면 같은 키
+    # 증분 적재 데이터는 선택한 그룹의 버전도 키에 넣어, 새 주문이 들어온 그룹을 포함한 선택만 다시 계산
+    # 기간(date_range = (시작일, 종료일)) / 상세 필터({컬럼: 값 목록})가 걸려 있으면 함께 키에 포함
+    # revision: 데이터셋 전체에 따라 바뀌는 조건(RFM 세그먼트 등)을 쓰는 선택이면 데이터셋 지문 -
+    # 선택한 그룹의 버전이 그대로여도 새 파티션이 들어오면 다른 키
+    groups = tuple(sorted(selected_groups))
+    versions = None if group_versions is None else tuple(group_versions.get(g, 0) for g in groups)
+    if date_range is not None or filters or revision is not None:
+        scope = (None if date_range is None else tuple(date_range),
+                 tuple(sorted((col, tuple(sorted(map(str, values)))) for col, values in (filters or {}).items())),
+                 revision)
+        return (data_key, groups, versions, scope)
+    if versions is None:
+        return (data_key, groups)
+    return (data_key, groups, versions)
+
+
+def stale_selections(data_key, group_versions, revision=None):
+    # AggregateCache.invalidate 조건: 같은 데이터셋에서 그룹 버전이 바뀐 선택의 항목
+    # revision(현재 데이터셋 지문)을 주면 다른 지문으로 만든 선택(RFM 세그먼트 필터 등)의 항목도 제거
+    def predicate(key):
+        if key[0] != data_key or len(key) < 3 or key[2] is None:
+            return False
+        if key[2] != tuple(group_versions.get(g, 0) for g in key[1]):
+            return True
+        return revision is not None and len(key) == 4 and key[3][2] not in (None, revision)
+    return predicate
+
+
+class AggregateCache:
+    def __init__(self, max_entries=128, ttl=3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, full_key):
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None and (self.ttl is None or time.monotonic() - entry[0] < self.ttl):
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[full_key]
+            self.misses += 1
+            return False, None
+
+    def _store(self, full_key, value):
+        with self._lock:
+            self._entries[full_key] = (time.monotonic(), value)
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key, func, *args, variant=(), **kwargs):
+        # 캐시된 집계를 반환하고, 없으면 func(*args) 로 계산해 저장합니다.
+        # 같은 함수를 다른 파라미터로 부르는 경우 variant(해시 가능한 튜플)로 구분합니다.
+        # 호출하는 쪽에서 결과에 컬럼을 추가해도 캐시가 오염되지 않도록 복사본을 돌려줍니다
+        # (Copy-on-Write 가 켜져 있으면 데이터 복사 없는 얕은 복사).
+        full_key = (key, func.__name__) + tuple(variant)
+        found, value = self._lookup(full_key)
+        if not found:
+            value = func(*args, **kwargs)
+            self._store(full_key, value)
+        return session_view(value)
+
+    def put(self, key, func, value):
+        # 미리 계산한 집계 저장 (get 과 같은 키 규칙: (key, 함수 이름))
+        self._store((key, func.__name__), value)
+
+    def invalidate(self, predicate=None):
+        # predicate(key) 가 참인 항목만 제거 (없으면 전체 제거)
+        with self._lock:
+            for full_key in list(self._entries):
+                if predicate is None or predicate(full_key[0]):
+                    del self._entries[full_key]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'hit_rate': self.hits / total if total else 0.0,
+            }
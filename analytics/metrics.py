@@ -0,0 +1,242 @@
+import numpy as np
+import pandas as pd
+
+from .aggregates import seller_revenue, time_cluster_stats, weekday_seller_stats
+from .customers import CUSTOMER_KEY_COL
+from .features import DAY_ORDER, INFLUENCER_NAME
+
+# ----------------------------------------------------------------
+# 탭별 지표 계산 (Streamlit 과 무관한 순수 함수)
+# dashboard.py 의 render_* 함수는 여기서 계산한 표를 그리기만 합니다.
+# 필터링된 주문 프레임(f_df) 또는 그룹 슬라이스된 OrderCube 를 받아 새 프레임을 반환하며
+# 입력은 변경하지 않습니다. (AggregateCache 키로 함수 이름을 쓰므로 이름이 곧 캐시 키)
+# ----------------------------------------------------------------
+
+# 상품 페이지 유형 (킹댕즈 참여 여부)
+INFLUENCER_PAGE = '킹댕즈 참여 페이지'
+COMPETITIVE_PAGE = '일반셀러 경쟁 페이지'
+
+# 구매 시점 클러스터 해석 / 요일 번호 -> 한글 요일
+CLUSTER_MEANINGS = {
+    1: '평일 오후 피크',
+    2: '주말 저녁 피크',
+    0: '새벽 저강도 (주말)',
+    3: '새벽 저강도 (평일)',
+}
+WEEKDAY_NAMES = {0: '월요일', 1: '화요일', 2: '수요일', 3: '목요일', 4: '금요일', 5: '토요일', 6: '일요일'}
+
+REGION_PATH = ['광역지역(정식)', '주문경로', '셀러명']
+DETAIL_PATHS = ['기타', '크롬']
+
+
+# --- 공통 KPI ---
+def headline_kpis(f_df):
+    # 총 매출 / 주문 건수 / 평균 결제액 / 활성 고객 수 / 재구매 비중(%)
+    revenue = f_df['실결제 금액']
+    return {
+        'revenue': revenue.sum(),
+        'orders': len(f_df),
+        'aov': revenue.mean(),
+        'customers': f_df[CUSTOMER_KEY_COL].nunique(),
+        'repeat_rate': f_df['재구매여부'].mean() * 100,
+    }
+
+
+def true_aov(data, group_col):
+    # 정확한 AOV (주문번호 기준): 매출 합계 / 고유 주문번호 수
+    stats = data.groupby(group_col, observed=True).agg({
+        '실결제 금액': 'sum',
+        '주문번호': 'nunique'
+    }).reset_index()
+    stats['AOV'] = stats['실결제 금액'] / stats['주문번호']
+    return stats
+
+
+# --- Dashboard ---
+def customer_growth(customers):
+    # 일자별 신규 고객 수와 누적 고객 수 (고객 테이블의 첫 주문 날짜)
+    daily_new_cust = customers.first_order_days().to_frame().groupby('주문날짜').size().reset_index(name='신규고객')
+    daily_new_cust['누적고객'] = daily_new_cust['신규고객'].cumsum()
+    return daily_new_cust
+
+
+def cancel_by_option(f_df, top=10):
+    # 취소 건수 상위 (상품명, 과수 크기) 옵션 - 취소가 없으면 빈 프레임
+    cancel_df = f_df[f_df['취소여부'] == 'Y']
+    option_cancel = cancel_df.groupby(['상품명', '과수 크기'], observed=True).size().reset_index(name='취소건수')
+    return option_cancel.sort_values('취소건수', ascending=False).head(top)
+
+
+# --- 매출 & 채널 ---
+def weekday_seller_productivity(cube):
+    # 요일별 매출 / 활동 셀러 수에 셀러 1인당 매출(인당매출)을 더한 표
+    stats = weekday_seller_stats(cube)
+    stats['인당매출'] = stats['실결제 금액'] / stats['셀러명']
+    return stats
+
+
+def seller_pareto(cube):
+    # 셀러 매출 파레토 곡선: 셀러 상위 % 대비 누적 매출 비중(%)
+    sel_contri = seller_revenue(cube).reset_index()
+    sel_contri['누적매출비중'] = (sel_contri['실결제 금액'].cumsum() / sel_contri['실결제 금액'].sum()) * 100
+    sel_contri['셀러순위비중'] = (sel_contri.index + 1) / len(sel_contri) * 100
+    return sel_contri
+
+
+def revenue_by_customer_type(f_df):
+    # 일자별 신규 vs 재구매 고객 매출
+    return f_df.groupby(['주문날짜', '고객유형'], observed=True)['실결제 금액'].sum().reset_index()
+
+
+# --- 셀러 & 로열티 ---
+def citrus_orders(f_df):
+    return f_df[f_df['품종'] == '감귤']
+
+
+def purpose_option_counts(df, option_col):
+    # 구매목적 x 옵션(과수 크기 / 무게 구분 / 가격대) 주문 건수
+    return df.groupby(['구매목적', option_col], observed=True).size().reset_index(name='주문건수')
+
+
+def purpose_best_options(df):
+    # 구매목적별 평균 객단가와 가장 많이 팔린 무게 / 크기
+    def top_value(x):
+        mode = x.mode()
+        return mode[0] if not mode.empty else 'N/A'
+
+    return df.groupby('구매목적', observed=True).agg({
+        '실결제 금액': 'mean',
+        '무게 구분': top_value,
+        '과수 크기': top_value,
+    }).rename(columns={'실결제 금액': '평균 객단가', '무게 구분': '가장 많이 팔린 무게',
+                       '과수 크기': '대표 선호 크기'}).reset_index()
+
+
+def loyal_sellers(f_df, min_orders=30, top=10):
+    # 주문 min_orders 건 이상 셀러 중 재구매 주문 비율(%) 상위
+    counts = f_df.groupby('셀러명', observed=True).size()
+    repeats = f_df[f_df['재구매여부'] == True].groupby('셀러명', observed=True).size()  # noqa: E712
+    r_ratio = (repeats / counts * 100).fillna(0).loc[counts[counts >= min_orders].index].nlargest(top).reset_index()
+    r_ratio.columns = ['셀러명', '재구매율(%)']
+    return r_ratio
+
+
+# --- 상품 페이지 분석 ---
+def product_page_stats(pages):
+    # 상품페이지(상품명)별 매출 / 주문 수 / 판매 셀러 수와 페이지 유형 (PageIndex 페이지 구간 합계)
+    # 판매 셀러에 킹댕즈가 있으면 참여 페이지, 아니면 일반셀러 경쟁 페이지
+    return pd.DataFrame({
+        '상품명': pages.pages.to_numpy(),
+        '실결제 금액': pages.page_revenue(),
+        '주문번호': pages.page_orders(),
+        '셀러수': pages.seller_counts(),
+        '페이지 유형': np.where(pages.has_seller(INFLUENCER_NAME), INFLUENCER_PAGE, COMPETITIVE_PAGE),
+    })
+
+
+def top_product_pages(pages, n=5):
+    return product_page_stats(pages).nlargest(n, '실결제 금액')
+
+
+def page_option_breakdown(pages, f_df, page):
+    # 한 상품 페이지의 (품종, 크기) / (무게, 가격대) 주문 건수와 셀러별 매출 - 각각 내림차순
+    # 페이지 주문 행과 셀러별 합계는 PageIndex 조회 (f_df 는 pages 를 만든 프레임)
+    p_df = pages.page_rows(f_df, page, ['품종', '과수 크기', '무게 구분', '가격대'])
+    opt_size = p_df.groupby(['품종', '과수 크기'], observed=True).size().reset_index(name='주문건수')
+    opt_weight = p_df.groupby(['무게 구분', '가격대'], observed=True).size().reset_index(name='주문건수')
+    return (opt_size.sort_values('주문건수', ascending=False),
+            opt_weight.sort_values('주문건수', ascending=False),
+            pages.page_sellers(page))
+
+
+# --- 재구매 퍼널 ---
+def retention_funnel(customers):
+    # 구매 회차(방문일 순서)별 고객 수, 첫 구매 대비 잔존율, 전단계 대비 전환율
+    # 회차는 고객 테이블의 방문일수 기준 (선택한 주문 안에서 k+1 번째 방문일이 있는 고객 수)
+    reach = customers.visit_reach()
+    funnel_data = pd.DataFrame({'단계': np.arange(len(reach)), '고객수': reach})
+    # 고객이 없으면(조건에 맞는 주문 없음) 빈 퍼널
+    first_purchase_count = reach[0] if len(reach) else 0
+    funnel_data['잔존율(%)'] = (funnel_data['고객수'] / first_purchase_count * 100).round(1)
+    funnel_data['전단계 대비 전환율(%)'] = (funnel_data['고객수'] / funnel_data['고객수'].shift(1) * 100).fillna(100).round(1)
+    funnel_data['구매회차'] = (funnel_data['단계'].astype(int) + 1).astype(str) + '회차 구매자'
+    return funnel_data
+
+
+def aov_by_purchase_round(f_df):
+    order_aov = f_df.groupby('재구매_날짜순서', observed=True)['실결제 금액'].mean().reset_index()
+    order_aov['구매회차'] = order_aov['재구매_날짜순서'] + 1
+    return order_aov
+
+
+def variety_mix_first_vs_repeat(f_df, top=5):
+    # 첫 구매 vs 재구매 주문의 품종 비중 상위
+    def mix(rows, label):
+        counts = rows['품종'].value_counts(normalize=True).loc[lambda s: s > 0].head(top).reset_index()
+        counts.columns = ['품종', '비중']
+        counts['유형'] = label
+        return counts
+
+    return pd.concat([mix(f_df[f_df['재구매_날짜순서'] == 0], '첫 구매'),
+                      mix(f_df[f_df['재구매_날짜순서'] > 0], '재구매')])
+
+
+# --- 지역별 분석 ---
+def region_hierarchy(path_rev, regions):
+    # 선버스트용 지역 > 경로 > 셀러 매출 (결측은 '<컬럼> 정보없음', 0 이하 제외)
+    hierarchy_df = path_rev[path_rev['광역지역(정식)'].isin(regions)].copy()
+    for col in REGION_PATH:
+        hierarchy_df[col] = hierarchy_df[col].astype(object).fillna(f"{col} 정보없음")
+    sunburst_df = hierarchy_df.groupby(REGION_PATH, observed=True)['실결제 금액'].sum().reset_index()
+    return sunburst_df[sunburst_df['실결제 금액'] > 0]
+
+
+def best_region_combos(path_rev):
+    # 지역별로 매출이 가장 높은 [경로 x 셀러] 조합
+    best_combi_all = path_rev.dropna(subset=REGION_PATH)
+    idx = best_combi_all.groupby('광역지역(정식)', observed=True)['실결제 금액'].idxmax()
+    best = best_combi_all.loc[idx].sort_values(by='실결제 금액', ascending=False)
+    best.columns = ['지역', '베스트 경로', '베스트 셀러', '매출합계']
+    return best
+
+
+# --- 구매 시점 분석 ---
+def time_cluster_summary(f_df):
+    # 클러스터별 총 주문수 / 평균주문금액 / 대표요일 / 대표시간 / 해석 (주문수 내림차순)
+    cluster_stats = time_cluster_stats(f_df)
+    cluster_stats['해석'] = cluster_stats['time_cluster'].map(CLUSTER_MEANINGS)
+    cluster_stats['대표요일'] = cluster_stats['주문일'].map(WEEKDAY_NAMES)
+    cluster_stats.columns = ['cluster', '총 주문수', '평균주문금액', '요일번호', '대표시간', '해석', '대표요일']
+    disp_table = cluster_stats[['cluster', '총 주문수', '평균주문금액', '대표요일', '대표시간', '해석']]
+    return disp_table.sort_values('총 주문수', ascending=False)
+
+
+def weekday_hour_matrix(f_df):
+    # 요일(월~일) x 주문시간(0~23시) 주문 건수 피벗 - 주문이 없는 요일 / 시간도 0 으로 채워 항상 7 x 24
+    pivot_df = f_df.groupby(['요일', '주문시간'], observed=True).size().unstack(fill_value=0)
+    return pivot_df.reindex(index=DAY_ORDER, columns=range(24), fill_value=0)
+
+
+def hourly_orders(f_df):
+    return f_df.groupby('주문시간', observed=True).size().reset_index(name='주문건수')
+
+
+# --- 경로 상세분석 ---
+def path_visit_mix(f_df, paths=DETAIL_PATHS):
+    # 경로별 신규 / 기존(재구매) 주문 건수
+    detail_paths = f_df[f_df['주문경로'].isin(paths)]
+    visit_type = detail_paths['재구매여부'].map({True: '기존', False: '신규'}).rename('유형')
+    return detail_paths.groupby([detail_paths['주문경로'], visit_type], observed=True).size().unstack(fill_value=0)
+
+
+def path_member_mix(f_df, paths=DETAIL_PATHS):
+    detail_paths = f_df[f_df['주문경로'].isin(paths)]
+    return detail_paths.groupby(['주문경로', '회원구분'], observed=True).size().reset_index(name='건수')
+
+
+# --- 마케팅 전략 ---
+def repeat_split(customers, group):
+    # 그룹 주문의 신규 / 재구매 건수 (건수 내림차순, 0건 유형 제외)
+    orders, repeats = customers.group_repeat_orders(group)
+    split = pd.Series({'재구매': repeats, '신규': orders - repeats}, name='count')
+    return split[split > 0].sort_values(ascending=False, kind='stable')
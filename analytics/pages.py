@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 상품 페이지 x 셀러 희소 인덱스
+# 상품명 x 셀러명 조합 중 주문이 있는 칸만 (셀러, 매출, 주문 수) 목록으로 담고 페이지 순으로 정렬해
+# 페이지별 구간 포인터(CSR 형식)를 둡니다. 페이지별 매출 / 주문 수 / 셀러 수 / 참여 셀러와 한 페이지의
+# 주문 행 위치는 구간 조회로 얻으므로 페이지마다 프레임을 다시 훑지 않습니다. (scipy 없이 numpy 배열)
+# ----------------------------------------------------------------
+
+
+# 칸(페이지 x 셀러) 전체 개수가 이 이하이면 np.unique 정렬 대신 밀집 bincount 로 칸을 셉니다
+DENSE_CELL_LIMIT = 1 << 22
+
+
+def _codes(values):
+    # 값 -> (정수 코드, 코드 순서의 값) - 결측은 -1, 범주형은 관측된 범주만 범주 순서로
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        codes = values.cat.codes.to_numpy().astype(np.int64)
+        observed = np.flatnonzero(np.bincount(codes[codes >= 0], minlength=len(categories)))
+        # 코드 -1(결측)은 remap 의 마지막 칸(-1)으로
+        remap = np.full(len(categories) + 1, -1, dtype=np.int64)
+        remap[observed] = np.arange(len(observed))
+        return remap[codes], pd.Index(categories.take(observed), dtype=object)
+    codes, uniques = pd.factorize(values, sort=True)
+    return codes.astype(np.int64), pd.Index(np.asarray(uniques, dtype=object))
+
+
+def _cells(keys, n_cells):
+    # 칸 번호 배열 -> (주문이 있는 칸 번호, 행별 칸 순번)
+    if n_cells <= DENSE_CELL_LIMIT:
+        present = np.bincount(keys, minlength=n_cells) > 0
+        slots = np.cumsum(present) - 1
+        return np.flatnonzero(present), slots[keys]
+    return np.unique(keys, return_inverse=True)
+
+
+def _page_sums(values, indptr):
+    # 칸 값의 페이지 구간별 합계 (모든 페이지는 칸이 1개 이상)
+    if len(indptr) < 2:
+        return np.zeros(0, dtype=values.dtype)
+    return np.add.reduceat(values, indptr[:-1])
+
+
+class PageIndex:
+    def __init__(self, pages, sellers, indptr, cell_sellers, cell_revenue, cell_orders, row_ptr, rows):
+        self.pages = pages  # 페이지 코드 -> 상품명
+        self.sellers = sellers  # 셀러 코드 -> 셀러명
+        self.indptr = indptr  # 페이지 i 의 칸 = [indptr[i], indptr[i+1])
+        self.cell_sellers = cell_sellers  # 칸의 셀러 코드 (-1 = 셀러명 결측)
+        self.cell_revenue = cell_revenue
+        self.cell_orders = cell_orders
+        self.row_ptr = row_ptr  # 페이지 i 의 주문 행 위치 = rows[row_ptr[i]:row_ptr[i+1]]
+        self.rows = rows
+
+    @classmethod
+    def build(cls, df):
+        page_codes, pages = _codes(df['상품명'])
+        seller_codes, sellers = _codes(df['셀러명'])
+        # 상품명이 없는 주문은 제외, 페이지 안에서는 원래 행 순서
+        rows = np.flatnonzero(page_codes >= 0)
+        # 페이지 코드가 작은 정수이므로 좁은 dtype 으로 바꿔 안정 정렬(기수 정렬)
+        rows = rows[np.argsort(page_codes[rows].astype(np.min_scalar_type(len(pages))), kind='stable')]
+        row_pages = page_codes[rows]
+        row_ptr = np.searchsorted(row_pages, np.arange(len(pages) + 1))
+
+        # 칸 = (페이지, 셀러) 쌍 - 셀러 결측(-1)은 페이지의 0 번 자리
+        width = len(sellers) + 1
+        cells, inverse = _cells(row_pages * width + seller_codes[rows] + 1, len(pages) * width)
+        revenue = np.nan_to_num(df['실결제 금액'].to_numpy(dtype=np.float64)[rows])
+        has_order = df['주문번호'].notna().to_numpy()[rows]
+        return cls(
+            pages=pages,
+            sellers=sellers,
+            indptr=np.searchsorted(cells // width, np.arange(len(pages) + 1)),
+            cell_sellers=cells % width - 1,
+            cell_revenue=np.bincount(inverse, weights=revenue, minlength=len(cells)),
+            cell_orders=np.bincount(inverse, weights=has_order, minlength=len(cells)).astype(np.int64),
+            row_ptr=row_ptr,
+            rows=rows,
+        )
+
+    def __len__(self):
+        return len(self.pages)
+
+    def locate(self, page):
+        # 상품명 -> 페이지 코드 (없으면 KeyError)
+        return self.pages.get_loc(page)
+
+    def page_revenue(self):
+        return _page_sums(self.cell_revenue, self.indptr)
+
+    def page_orders(self):
+        # 페이지별 주문번호가 있는 행 수
+        return _page_sums(self.cell_orders, self.indptr)
+
+    def seller_counts(self):
+        # 페이지별 판매 셀러 수 (셀러명 결측 제외)
+        return _page_sums((self.cell_sellers >= 0).astype(np.int64), self.indptr)
+
+    def has_seller(self, seller):
+        # 페이지별 seller 참여 여부 (bool 배열)
+        if seller not in self.sellers:
+            return np.zeros(len(self.pages), dtype=bool)
+        code = self.sellers.get_loc(seller)
+        return _page_sums((self.cell_sellers == code).astype(np.int64), self.indptr) > 0
+
+    def page_sellers(self, page):
+        # 한 페이지의 셀러별 매출액 / 주문건수 (매출액 내림차순)
+        code = self.locate(page)
+        cells = slice(self.indptr[code], self.indptr[code + 1])
+        sellers = self.cell_sellers[cells]
+        known = sellers >= 0
+        opt_seller = pd.DataFrame({
+            '셀러명': self.sellers.take(sellers[known]),
+            '매출액': self.cell_revenue[cells][known],
+            '주문건수': self.cell_orders[cells][known],
+        })
+        return opt_seller.sort_values('매출액', ascending=False, kind='stable')
+
+    def page_rows(self, df, page, columns=None):
+        # 한 페이지의 주문 행 (df 는 인덱스를 만든 프레임과 같은 행 순서여야 함, columns 로 필요한 컬럼만)
+        code = self.locate(page)
+        rows = self.rows[self.row_ptr[code]:self.row_ptr[code + 1]]
+        if columns is None:
+            return df.iloc[rows]
+        return df.iloc[rows, df.columns.get_indexer(columns)]
+
+    def nbytes(self):
+        arrays = [self.indptr, self.cell_sellers, self.cell_revenue, self.cell_orders, self.row_ptr, self.rows]
+        return int(sum(a.nbytes for a in arrays))
+
+
+def page_index(df):
+    # 주문 프레임(또는 필터링된 f_df) -> PageIndex (집계 캐시 키로 함수 이름 사용)
+    return PageIndex.build(df)
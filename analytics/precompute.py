@@ -0,0 +1,140 @@
+import itertools
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pyarrow as pa
+
+from . import aggregates, metrics
+from .cube import OrderCube
+from .customer_table import customer_table
+from .pages import page_index
+
+# ----------------------------------------------------------------
+# 시작 시 탭 집계 일괄 계산 (프로세스 풀)
+# 그룹 선택지가 정해져 있으므로 (비어 있지 않은 조합 = 2^n - 1개) 모든 조합 x 모든 탭 집계를
+# 여러 코어에서 미리 계산해 AggregateCache 에 넣어 둡니다.
+# 원본 프레임은 Arrow IPC 파일로 한 번 쓰고 각 워커가 memory-map 으로 읽어 공유합니다
+# (프레임을 작업마다 pickle 로 보내지 않음). 큐브는 작으므로 워커 초기화 인자로 전달합니다.
+# spawn 워커는 부모의 __main__ 을 다시 실행하므로, 대시보드는 스크립트 맨 앞에서
+# __spec__ 을 이름 '__main__' 으로 지정해 워커가 스크립트를 다시 실행하지 않게 합니다.
+# ----------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# dashboard.py 에서 cached_agg 로 조회하는 집계
+# (함수, 입력: 'frame' = f_df / 'cube' = 그룹 슬라이스 큐브 / 'customers' = 선택 주문의 고객 테이블
+#  / 'pages' = 선택 주문의 상품 페이지 인덱스)
+TAB_AGGREGATES = [
+    (metrics.headline_kpis, 'frame'),
+    (aggregates.weekly_stats, 'frame'),
+    (aggregates.daily_revenue, 'cube'),
+    (metrics.customer_growth, 'customers'),
+    (metrics.cancel_by_option, 'frame'),
+    (metrics.weekday_seller_productivity, 'cube'),
+    (aggregates.channel_aov, 'cube'),
+    (metrics.seller_pareto, 'cube'),
+    (metrics.revenue_by_customer_type, 'frame'),
+    (aggregates.channel_summary, 'cube'),
+    (aggregates.variety_counts, 'cube'),
+    (aggregates.seller_revenue, 'cube'),
+    (metrics.loyal_sellers, 'frame'),
+    (metrics.top_product_pages, 'pages'),
+    (metrics.retention_funnel, 'customers'),
+    (metrics.aov_by_purchase_round, 'frame'),
+    (metrics.variety_mix_first_vs_repeat, 'frame'),
+    (aggregates.region_stats, 'cube'),
+    (aggregates.region_path_revenue, 'cube'),
+    (metrics.time_cluster_summary, 'frame'),
+    (metrics.weekday_hour_matrix, 'frame'),
+    (aggregates.purpose_repeat_stats, 'cube'),
+    (metrics.path_visit_mix, 'frame'),
+    (metrics.path_member_mix, 'frame'),
+    (metrics.hourly_orders, 'frame'),
+    (aggregates.region_channel_counts, 'cube'),
+    (aggregates.variety_revenue, 'cube'),
+]
+_AGGREGATES_BY_NAME = {func.__name__: (func, source) for func, source in TAB_AGGREGATES}
+
+# 워커 프로세스 상태 (초기화 시 한 번 적재)
+_worker_df = None
+_worker_cube = None
+_worker_slices = {}
+
+
+def group_selections(options):
+    # 비어 있지 않은 모든 그룹 조합 (정렬된 튜플)
+    options = sorted(options)
+    return [combo for n in range(1, len(options) + 1) for combo in itertools.combinations(options, n)]
+
+
+def _slice(df, cube, groups):
+    # dashboard.py 와 같은 방식: 전체 선택이면 원본 그대로, 아니면 마스크 슬라이스
+    mask = df['그룹'].isin(groups)
+    f_df = df if mask.all() else df[mask]
+    return {'frame': f_df, 'cube': cube.slice(groups), 'customers': customer_table(f_df), 'pages': page_index(f_df)}
+
+
+def _init_worker(arrow_path, cube_facts):
+    global _worker_df, _worker_cube
+    with pa.memory_map(arrow_path) as source:
+        _worker_df = pa.ipc.open_file(source).read_all().to_pandas()
+    _worker_cube = OrderCube(cube_facts)
+    _worker_slices.clear()
+
+
+def _run_task(groups, name):
+    # 같은 그룹 조합의 필터링 결과는 워커 안에서 재사용
+    if groups not in _worker_slices:
+        _worker_slices[groups] = _slice(_worker_df, _worker_cube, groups)
+    func, source = _AGGREGATES_BY_NAME[name]
+    return groups, name, func(_worker_slices[groups][source])
+
+
+def _write_arrow(df, path):
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _precompute_serial(df, cube, selections):
+    for groups in selections:
+        inputs = _slice(df, cube, groups)
+        for func, source in TAB_AGGREGATES:
+            yield groups, func.__name__, func(inputs[source])
+
+
+def _precompute_parallel(df, cube, selections, max_workers):
+    tasks = [(groups, func.__name__) for groups in selections for func, _ in TAB_AGGREGATES]
+    with tempfile.TemporaryDirectory() as tmp:
+        arrow_path = os.path.join(tmp, 'orders.arrow')
+        _write_arrow(df, arrow_path)
+        # Streamlit 서버는 스레드를 쓰므로 fork 대신 spawn 으로 워커 생성
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker, initargs=(arrow_path, cube.facts)) as pool:
+            futures = [pool.submit(_run_task, groups, name) for groups, name in tasks]
+            return [f.result() for f in futures]
+
+
+def precompute_aggregates(df, cube, options, max_workers=None):
+    # 모든 그룹 조합의 탭 집계를 계산해 [(groups, 함수 이름, 결과)] 로 반환
+    # max_workers=1 이거나 프로세스 풀을 쓸 수 없는 환경이면 현재 프로세스에서 순서대로 계산
+    selections = group_selections(options)
+    max_workers = max_workers or min(os.cpu_count() or 1, len(selections) * len(TAB_AGGREGATES))
+    if max_workers > 1:
+        try:
+            return _precompute_parallel(df, cube, selections, max_workers)
+        except Exception:
+            # 워커 생성 실패, 워커 비정상 종료, 워커 안의 집계 오류 모두 순차 계산으로 대체
+            logger.warning("탭 집계 병렬 계산 실패 - 순차 계산으로 대체합니다", exc_info=True)
+    return list(_precompute_serial(df, cube, selections))
+
+
+def warm_cache(cache, df, cube, options, key_for, max_workers=None):
+    # 미리 계산한 집계를 cache 에 저장 (key_for(groups) = dashboard 의 selection_key 와 같은 키)
+    results = precompute_aggregates(df, cube, options, max_workers)
+    for groups, name, value in results:
+        cache.put(key_for(groups), _AGGREGATES_BY_NAME[name][0], value)
+    return len(results)
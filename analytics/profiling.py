@@ -0,0 +1,113 @@
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# ----------------------------------------------------------------
+# rerun 구간별 시간 측정
+# 대시보드 한 번의 실행(rerun)마다 RerunProfile 을 만들고, 로드 / 필터 / 탭 / 집계 / 차트 구간을
+# profile.section(이름) 으로 감싸 경과 시간을 기록합니다 (중첩 가능, 깊이 함께 기록).
+# 끝나면 구간별 시간을 JSON 한 줄 로그로 남기고, 프로세스 공용 LatencyStats 에 넣어 p50/p95 를 계산합니다.
+# ----------------------------------------------------------------
+
+PERF_LOGGER = 'order_dashboard.perf'
+DEFAULT_HISTORY = 500
+
+logger = logging.getLogger(PERF_LOGGER)
+
+
+def process_memory_mb():
+    # 현재 프로세스 상주 메모리(MB) - /proc 이 없으면 최대 상주 메모리, 둘 다 없으면 None
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+class RerunProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sections = []  # (이름, ms, 깊이) - 끝난 순서가 아니라 시작 순서
+        self.meta = {}
+        self._depth = 0
+
+    @contextlib.contextmanager
+    def section(self, name):
+        slot = len(self.sections)
+        self.sections.append((name, None, self._depth))
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.sections[slot] = (name, (time.perf_counter() - start) * 1000, self._depth)
+
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def breakdown(self):
+        # 같은 이름 구간은 합산 (같은 집계를 여러 번 조회하는 경우) - 최상위 구간부터 시작 순서대로
+        merged = {}
+        for name, ms, depth in self.sections:
+            if ms is None:
+                continue
+            total, calls, first_depth = merged.get(name, (0.0, 0, depth))
+            merged[name] = (total + ms, calls + 1, first_depth)
+        return [{'section': name, 'ms': round(ms, 2), 'calls': calls, 'depth': depth}
+                for name, (ms, calls, depth) in merged.items()]
+
+    def record(self, **fields):
+        # 로그에 함께 남길 부가 정보 (탭 이름, 캐시 적중 수 등)
+        self.meta.update(fields)
+
+    def finish(self, stats=None):
+        # 구조화 로그 1줄 + LatencyStats 기록, 로그 레코드(dict) 반환
+        entry = {'event': 'rerun', 'total_ms': round(self.total_ms(), 2), **self.meta,
+                 'sections': {s['section']: s['ms'] for s in self.breakdown()}}
+        logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+        if stats is not None:
+            stats.add(entry['total_ms'])
+        return entry
+
+
+class LatencyStats:
+    # 최근 rerun 시간(ms) 링 버퍼 - 여러 세션이 함께 기록하므로 잠금 사용
+    def __init__(self, history=DEFAULT_HISTORY):
+        self._values = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def add(self, ms):
+        with self._lock:
+            self._values.append(ms)
+
+    def summary(self):
+        with self._lock:
+            values = np.array(self._values)
+        if not len(values):
+            return {'count': 0, 'p50': None, 'p95': None, 'max': None}
+        p50, p95 = np.percentile(values, [50, 95])
+        return {'count': len(values), 'p50': float(p50), 'p95': float(p95), 'max': float(values.max())}
+
+
+def configure_perf_logging(path=None, level=logging.INFO):
+    # 성능 로그 핸들러를 한 번만 연결 (path 가 없으면 stderr, 있으면 파일에 JSON 한 줄씩)
+    if logger.handlers:
+        return logger
+    handler = logging.FileHandler(path, encoding='utf-8') if path else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
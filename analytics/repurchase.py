@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from .customers import CUSTOMER_COL, CUSTOMER_KEY_COL, customer_keys
+
+# ----------------------------------------------------------------
+# 재구매 엔진 (정렬 1회 + 누적합 기반 dense rank)
+# 고객별 dict/sort 를 만드는 transform(lambda) 대신, (고객키, 주문일) 정렬 후
+# '고객이 바뀌었는가 / 날짜가 바뀌었는가' 플래그의 누적합으로 날짜 순서를 매깁니다.
+# 재구매 정의: 주문일이 다른 날짜인 경우만 재구매로 인정 (첫 방문일=0, 이후 방문날짜마다 +1)
+# ----------------------------------------------------------------
+
+
+def _customer_boundaries(customers):
+    # 정렬된 고객 키에서 각 행이 속한 고객의 첫 행 위치를 구합니다.
+    codes = pd.factorize(customers, use_na_sentinel=True)[0]
+    n = len(codes)
+    new_cust = np.ones(n, dtype=bool)
+    if n > 1:
+        new_cust[1:] = codes[1:] != codes[:-1]
+    start_idx = np.maximum.accumulate(np.where(new_cust, np.arange(n), 0)) if n else np.zeros(0, dtype=np.intp)
+    return codes, new_cust, start_idx
+
+
+def add_repurchase_columns(df, customer_col=CUSTOMER_KEY_COL):
+    # 재구매_날짜순서 / 재구매여부 / 최초주문일 과 함께
+    # 고객별 주문 인덱스(이전주문일, 구매간격)를 한 번의 정렬로 계산합니다.
+    # 고객키 컬럼이 아직 없으면 이 프레임 한정 키를 붙여서 계산 (정수 키 정렬이 문자열 정렬보다 빠름)
+    if customer_col == CUSTOMER_KEY_COL and customer_col not in df.columns:
+        df = df.assign(**{CUSTOMER_KEY_COL: customer_keys(df[CUSTOMER_COL])})
+    df = df.sort_values(by=[customer_col, '주문일'])
+
+    codes, new_cust, start_idx = _customer_boundaries(df[customer_col])
+    day = df['주문일'].to_numpy().astype('datetime64[D]')
+    order_dates = df['주문날짜'].to_numpy()
+    has_prev = ~new_cust
+    prev_idx = np.maximum(np.arange(len(df)) - 1, 0)
+
+    # 날짜 순서: 고객/날짜가 바뀌는 지점의 누적합을 고객 첫 행 기준으로 0부터 다시 셈
+    new_day = new_cust | (day != day[prev_idx])
+    day_seq = np.cumsum(new_day)
+    date_rank = day_seq - day_seq[start_idx]
+    first_dates = order_dates[start_idx]
+
+    # 직전 주문 (같은 고객의 바로 앞 행), 첫 주문은 결측
+    prev_dates = np.where(has_prev, order_dates[prev_idx], np.nan)
+    gap_days = np.where(has_prev, (day - day[prev_idx]).astype('float64'), np.nan)
+
+    # 주문일이 없는 주문은 고객별 정렬에서 맨 뒤라 다른 행의 순서/간격에는 영향이 없고, 그 행만 결측 처리
+    known = (codes >= 0) & ~np.isnat(day)
+    if not known.all():
+        # 연락처가 없는 주문은 고객 단위 계산에서 제외 (기존 groupby 결과와 동일하게 결측)
+        date_rank = np.where(known, date_rank, np.nan)
+        first_dates = np.where(known, first_dates, np.nan)
+        prev_dates = np.where(known, prev_dates, np.nan)
+        gap_days = np.where(known, gap_days, np.nan)
+
+    df['재구매_날짜순서'] = date_rank
+    df['재구매여부'] = df['재구매_날짜순서'] > 0
+    df['최초주문일'] = first_dates
+    df['이전주문일'] = prev_dates
+    df['구매간격'] = gap_days
+    return df
+
+
+def repurchase_intervals(df):
+    # 재구매 주기 분석용: 이전 구매가 있고 날짜가 다른 주문의 간격(일)
+    gaps = df['구매간격']
+    return gaps[gaps > 0]
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+from .customers import CUSTOMER_KEY_COL
+
+# ----------------------------------------------------------------
+# RFM 고객 세그먼트
+# 고객 테이블(전체 고객)에서 최근성(마지막 주문 후 경과일) / 빈도(방문일수) / 금액(총결제금액)을
+# 백분위 순위로 1~5점으로 나누고(동점은 같은 점수), R x F 점수 격자로 세그먼트를 붙입니다.
+# 고객 수만큼의 배열 연산 1회이므로 고객 수가 많아도 그대로 계산하고, 결과는 데이터셋마다 한 번 캐시합니다.
+# ----------------------------------------------------------------
+
+SEGMENT_COL = '세그먼트'
+RFM_BINS = 5
+
+# 표시 순서 (가치가 높은 세그먼트부터)
+SEGMENTS = ['챔피언', '충성 고객', '잠재 충성', '신규 고객', '유망 고객',
+            '관심 필요', '이탈 직전', '이탈 위험', '놓치면 안 될 고객', '휴면']
+
+# 행 = R 점수 1~5, 열 = F 점수 1~5
+SEGMENT_GRID = [
+    ['휴면', '휴면', '이탈 위험', '이탈 위험', '놓치면 안 될 고객'],
+    ['휴면', '휴면', '이탈 위험', '이탈 위험', '놓치면 안 될 고객'],
+    ['이탈 직전', '이탈 직전', '관심 필요', '충성 고객', '충성 고객'],
+    ['유망 고객', '잠재 충성', '잠재 충성', '충성 고객', '충성 고객'],
+    ['신규 고객', '잠재 충성', '잠재 충성', '챔피언', '챔피언'],
+]
+_GRID_CODES = np.array([[SEGMENTS.index(label) for label in row] for row in SEGMENT_GRID], dtype=np.int8)
+
+
+def quantile_scores(values, bins=RFM_BINS, ascending=True):
+    # 백분위 순위 -> 1..bins 점수 (ascending=False 면 값이 작을수록 높은 점수)
+    # 결측(주문일이 있는 주문이 없는 고객의 최근성)은 가장 낮은 1점
+    pct = pd.Series(values).rank(method='average', pct=True, ascending=ascending).fillna(0).to_numpy()
+    return np.clip(np.ceil(pct * bins), 1, bins).astype(np.int8)
+
+
+def rfm_segments(customers, as_of=None):
+    # CustomerTable -> 고객키 인덱스의 최근성(일) / 구매빈도 / 구매금액 / R / F / M / RFM점수 / 세그먼트
+    # as_of: 최근성 기준일 (없으면 데이터의 마지막 주문일)
+    facts = customers.facts
+    last_day = facts['마지막주문일'].dt.normalize()
+    as_of = pd.Timestamp(as_of).normalize() if as_of is not None else last_day.max()
+    recency = (as_of - last_day).dt.days.to_numpy()
+    frequency = facts['방문일수'].to_numpy()
+    monetary = facts['총결제금액'].to_numpy()
+
+    r = quantile_scores(recency, ascending=False)
+    f = quantile_scores(frequency)
+    m = quantile_scores(monetary)
+    segments = pd.Categorical.from_codes(_GRID_CODES[r - 1, f - 1], categories=SEGMENTS)
+    return pd.DataFrame({
+        '최근성(일)': recency,
+        '구매빈도': frequency,
+        '구매금액': monetary,
+        'R': r,
+        'F': f,
+        'M': m,
+        'RFM점수': (r.astype(np.int16) * 100 + f * 10 + m).astype(np.int16),
+        SEGMENT_COL: segments,
+    }, index=facts.index)
+
+
+def row_segments(df, segments):
+    # 주문 행마다 고객의 세그먼트 (고객키가 없거나 세그먼트가 없는 고객은 결측)
+    return segments[SEGMENT_COL].reindex(df[CUSTOMER_KEY_COL]).array
+
+
+def segment_summary(segments, customers=None):
+    # 세그먼트별 고객 수 / 비중(%) / 평균 최근성 / 평균 빈도 / 평균 금액 (표시 순서, 고객 없는 세그먼트 제외)
+    # customers: 선택 주문의 CustomerTable 이면 그 고객만 (점수는 전체 고객 기준 그대로)
+    if customers is not None:
+        segments = segments.reindex(customers.facts.index)
+    summary = segments.groupby(SEGMENT_COL, observed=True).agg(
+        고객수=('R', 'size'), 평균최근성=('최근성(일)', 'mean'), 평균빈도=('구매빈도', 'mean'),
+        평균금액=('구매금액', 'mean')).reset_index()
+    summary.insert(2, '비중(%)', (summary['고객수'] / summary['고객수'].sum() * 100).round(1))
+    return summary
+
+
+def segment_mix(f_df, segments, by):
+    # by(그룹 / 셀러명 / ...) 값별 고객의 세그먼트 분포: 주문이 있는 (고객, by 값) 쌍을 한 번씩 셈
+    pairs = f_df[[CUSTOMER_KEY_COL, by]].dropna().drop_duplicates()
+    pairs[SEGMENT_COL] = row_segments(pairs, segments)
+    mix = pairs.groupby([by, SEGMENT_COL], observed=True).size().reset_index(name='고객수')
+    totals = mix.groupby(by, observed=True)['고객수'].transform('sum')
+    mix['비중(%)'] = (mix['고객수'] / totals * 100).round(1)
+    mix['전체고객수'] = totals
+    return mix
@@ -0,0 +1,70 @@
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 주문 CSV 적재 스키마
+# 대시보드에서 쓰는 컬럼만 읽고(usecols), 반복되는 문자열은 category,
+# 식별자는 Arrow 문자열, 금액은 float 으로 바로 적재합니다.
+# ----------------------------------------------------------------
+
+DATE_COLUMNS = ['주문일']
+PRICE_COLUMNS = ['실결제 금액', '결제금액', '판매단가', '공급단가']
+
+# 값 종류가 적고 반복되는 컬럼 (셀러/지역/경로/품종/옵션 등)
+CATEGORY_COLUMNS = [
+    '셀러명', '광역지역(정식)', '주문경로', '품종', '상품명',
+    '과수 크기', '무게 구분', '가격대', '취소여부', '회원구분', '상품성등급_그룹',
+]
+
+# 행마다 거의 고유한 식별자
+STRING_COLUMNS = ['주문번호', '주문자연락처']
+
+NUMERIC_COLUMNS = ['재구매 횟수']
+
+ORDER_COLUMNS = DATE_COLUMNS + PRICE_COLUMNS + CATEGORY_COLUMNS + STRING_COLUMNS + NUMERIC_COLUMNS
+
+ARROW_STRING = 'string[pyarrow]'
+
+
+def _present_columns(file_path):
+    # 헤더만 읽어 실제 파일에 있는 컬럼으로 usecols / dtype 을 맞춥니다.
+    header = pd.read_csv(file_path, nrows=0).columns
+    return [c for c in ORDER_COLUMNS if c in header]
+
+
+def _dtype_map(columns):
+    dtypes = {}
+    for col in columns:
+        if col in CATEGORY_COLUMNS:
+            dtypes[col] = 'category'
+        elif col in STRING_COLUMNS:
+            dtypes[col] = ARROW_STRING
+    return dtypes
+
+
+def _clean_prices(df, columns):
+    # pyarrow 엔진은 thousands 옵션을 지원하지 않으므로 '35,000' 형태는 Arrow 문자열 연산으로 정리
+    for col in columns:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].astype(ARROW_STRING).str.replace(',', '', regex=False).astype(float)
+        elif col in df.columns:
+            df[col] = df[col].astype(float)
+    return df
+
+
+def read_orders(file_path):
+    columns = _present_columns(file_path)
+    dtypes = _dtype_map(columns)
+    dates = [c for c in DATE_COLUMNS if c in columns]
+    prices = [c for c in PRICE_COLUMNS if c in columns]
+
+    try:
+        df = pd.read_csv(file_path, engine='pyarrow', usecols=columns,
+                         dtype={**dtypes, **{c: ARROW_STRING for c in prices}}, parse_dates=dates)
+    except (ValueError, TypeError):
+        # pyarrow 엔진이 처리하지 못하는 파일(깨진 행 등)은 C 엔진 + thousands 로 재시도
+        df = pd.read_csv(file_path, usecols=columns, dtype=dtypes, thousands=',', parse_dates=dates)
+
+    df = _clean_prices(df, prices)
+    for col in dates:
+        df[col] = pd.to_datetime(df[col]).astype('datetime64[ns]')
+    return df
@@ -0,0 +1,33 @@
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 세션 간 공유 데이터셋 (읽기 전용)
+# 처리된 주문 프레임은 프로세스에 하나만 두고(st.cache_resource) 모든 세션이 같은 객체를 읽습니다.
+# pandas Copy-on-Write 를 켜 두면 얕은 복사본(view)은 데이터를 공유하다가 쓰기가 일어날 때만
+# 해당 컬럼을 복사하므로, 세션이 view 에 컬럼을 추가/수정해도 공유 원본은 바뀌지 않습니다.
+# ----------------------------------------------------------------
+
+
+def enable_copy_on_write():
+    pd.set_option('mode.copy_on_write', True)
+
+
+def copy_on_write_enabled():
+    # 옵션 값은 True / False / 'warn'
+    return pd.get_option('mode.copy_on_write') is True
+
+
+def session_view(value):
+    # 공유 객체를 세션에 넘길 때: Copy-on-Write 면 데이터 복사 없는 얕은 복사, 아니면 깊은 복사
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not copy_on_write_enabled())
+    return value
+
+
+def select_rows(df, rows):
+    # 필터 결과 행 위치(rows, 오름차순)의 프레임 - rows 가 None 이면 전체 (그대로 반환)
+    return df if rows is None else df.iloc[rows]
+
+
+def frame_nbytes(df):
+    return int(df.memory_usage(deep=True, index=True).sum())
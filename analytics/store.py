@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from .customers import customer_salt_tag
+
+# ----------------------------------------------------------------
+# 전처리 결과 Parquet 캐시
+# 원본 CSV 의 (크기, 수정시각, 해시) 지문이 같으면 파생 컬럼까지 계산된 프레임을
+# Parquet 에서 바로 읽습니다. 프로세스 재시작 / 다중 레플리카에서도 재사용됩니다.
+# 고객 연락처 솔트(ORDER_CUSTOMER_SALT) 태그도 지문에 들어가므로 솔트가 바뀌면 캐시를 다시 만듭니다.
+# ----------------------------------------------------------------
+
+# 전처리 로직이 바뀌면 올려서 기존 캐시를 무효화
+PIPELINE_VERSION = 6
+
+CACHE_DIR_ENV = 'ORDER_CACHE_DIR'
+DEFAULT_CACHE_DIRNAME = '.order_cache'
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def cache_dir_for(source_path):
+    # 환경변수로 공유 볼륨을 지정하면 여러 레플리카가 같은 캐시를 씁니다.
+    return os.environ.get(CACHE_DIR_ENV) or os.path.join(os.path.dirname(os.path.abspath(source_path)),
+                                                         DEFAULT_CACHE_DIRNAME)
+
+
+def file_hash(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_fingerprint(path, with_hash=True):
+    stat = os.stat(path)
+    fp = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'version': PIPELINE_VERSION, 'salt': customer_salt_tag()}
+    if with_hash:
+        fp['hash'] = file_hash(path)
+    return fp
+
+
+def cache_paths(source_path):
+    base = os.path.splitext(os.path.basename(source_path))[0]
+    cache_dir = cache_dir_for(source_path)
+    return os.path.join(cache_dir, f'{base}.parquet'), os.path.join(cache_dir, f'{base}.meta.json')
+
+
+def read_meta(meta_path):
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_meta(meta_path, meta):
+    # 다른 프로세스가 읽는 중일 수 있으므로 임시 파일에 쓰고 교체 (실패하면 갱신 없이 동작)
+    tmp_meta = f'{meta_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, meta_path)
+    except OSError:
+        return False
+    return True
+
+
+def is_fresh(meta, source_path):
+    # 1) 크기 + 수정시각이 같으면 해시 계산 없이 사용
+    # 2) 수정시각만 다른 경우(복사/배포) 해시를 비교해 내용이 같으면 사용하고,
+    #    meta 의 크기 / 수정시각을 현재 값으로 바꿔 둠 (호출한 쪽이 저장하면 다음 시작부터 해시 생략)
+    # 솔트 태그가 다르면(솔트를 새로 켠 경우 포함) 원본 연락처나 다른 사전의 고객키가 남아 있으므로 사용하지 않음
+    if meta is None or meta.get('version') != PIPELINE_VERSION or meta.get('salt') != customer_salt_tag():
+        return False
+    current = file_fingerprint(source_path, with_hash=False)
+    if current['size'] != meta.get('size'):
+        return False
+    if current['mtime_ns'] == meta.get('mtime_ns'):
+        return True
+    if file_hash(source_path) != meta.get('hash'):
+        return False
+    meta['size'], meta['mtime_ns'] = current['size'], current['mtime_ns']
+    return True
+
+
+def fingerprint_key(fp):
+    # 집계 캐시 등에서 쓰는 데이터셋 식별 문자열 (솔트를 쓰면 솔트 태그 포함)
+    salt = fp.get('salt')
+    return f"{fp.get('hash')}-v{fp.get('version')}" + (f"-s{salt}" if salt else "")
+
+
+def read_cached_frame(source_path):
+    parquet_path, meta_path = cache_paths(source_path)
+    meta = read_meta(meta_path)
+    mtime_ns = meta and meta.get('mtime_ns')
+    if not os.path.exists(parquet_path) or not is_fresh(meta, source_path):
+        return None
+    try:
+        df = pd.read_parquet(parquet_path, engine='pyarrow')
+    except Exception:
+        # 손상된 캐시는 무시하고 다시 생성
+        return None
+    if meta['mtime_ns'] != mtime_ns:
+        # 내용은 같고 수정시각만 바뀐 원본 - 새 수정시각을 기록해 다음 시작부터 해시 계산 생략
+        write_meta(meta_path, meta)
+    df.attrs['fingerprint'] = fingerprint_key(meta)
+    return df
+
+
+def write_cached_frame(source_path, df, fp=None):
+    parquet_path, meta_path = cache_paths(source_path)
+    fp = fp or file_fingerprint(source_path)
+    try:
+        os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+        # 다른 프로세스가 읽는 중일 수 있으므로 임시 파일에 쓰고 교체
+        tmp_parquet = f'{parquet_path}.{os.getpid()}.tmp'
+        tmp_meta = f'{meta_path}.{os.getpid()}.tmp'
+        df.to_parquet(tmp_parquet, engine='pyarrow', compression='zstd')
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(fp, f)
+        os.replace(tmp_parquet, parquet_path)
+        os.replace(tmp_meta, meta_path)
+    except OSError:
+        # 읽기 전용 배포 환경 등에서는 캐시 없이 동작
+        return False
+    return True
+
+
+def load_or_build(source_path, build):
+    # 캐시가 유효하면 Parquet 에서 읽고, 아니면 build(source_path) 결과를 저장 후 반환
+    # 반환 프레임의 attrs['fingerprint'] 에 데이터셋 지문을 남깁니다.
+    df = read_cached_frame(source_path)
+    if df is not None:
+        return df
+    df = build(source_path)
+    fp = file_fingerprint(source_path)
+    df.attrs['fingerprint'] = fingerprint_key(fp)
+    write_cached_frame(source_path, df, fp)
+    return df
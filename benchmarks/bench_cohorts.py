@@ -0,0 +1,91 @@
+import argparse
+import time
+
+import pandas as pd
+
+from analytics.cohorts import COHORT_SIZE_COL, cohort_matrix
+from analytics.features import add_derived_features
+from analytics.repurchase import add_repurchase_columns
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 코호트 리텐션 매트릭스 벤치마크: 코호트별 반복 groupby vs 기간 번호 산술 + groupby 1회
+# 1년치 주문(주 단위 코호트 약 52개)으로 측정
+# 실행: python -m benchmarks.bench_cohorts --sizes 100000 1000000 3000000
+# ----------------------------------------------------------------
+
+
+# --- 코호트마다 프레임을 잘라 경과 기간별 nunique 를 구하는 방식 (비교 기준) ---
+def legacy_cohorts(df, freq='W', split=None):
+    df = df.copy()
+    first_day = pd.to_datetime(df['최초주문일'])
+    if freq == 'W':
+        df['코호트'] = first_day - pd.to_timedelta(first_day.dt.weekday, unit='D')
+        order_day = df['주문일'].dt.normalize()
+        order_week = order_day - pd.to_timedelta(order_day.dt.weekday, unit='D')
+        df['경과'] = (order_week - df['코호트']).dt.days // 7
+    else:
+        df['코호트'] = first_day.dt.to_period('M').dt.to_timestamp()
+        order_month = df['주문일'].dt.to_period('M').dt.to_timestamp()
+        df['경과'] = (order_month.dt.year - df['코호트'].dt.year) * 12 + order_month.dt.month - df['코호트'].dt.month
+    if split is not None:
+        acquired = df.sort_values('주문일', kind='stable').drop_duplicates('고객키').set_index('고객키')[split]
+        df[split] = df['고객키'].map(acquired)
+    dims = ['코호트'] if split is None else [split, '코호트']
+
+    rows = {}
+    for key, cohort in df.groupby(dims, observed=True):
+        row = cohort.groupby('경과')['고객키'].nunique()
+        row[COHORT_SIZE_COL] = cohort['고객키'].nunique()
+        rows[key if split is not None else key[0]] = row
+    return rows
+
+
+def check_identical(df):
+    for freq in ['W', 'M']:
+        for split in [None, '그룹', '주문경로']:
+            matrix = cohort_matrix(df, freq, split)
+            for key, row in legacy_cohorts(df, freq, split).items():
+                got = matrix.loc[key]
+                for col, value in row.items():
+                    assert got[col] == value, (freq, split, key, col, got[col], value)
+                # 기준 구현에 없는 경과 기간은 0 이거나 아직 오지 않은 기간(결측)
+                rest = got.drop(row.index)
+                assert (rest.fillna(0) == 0).all(), (freq, split, key)
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000, 3_000_000])
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--legacy-max', type=int, default=1_000_000,
+                        help='이 행 수를 넘으면 코호트별 반복 구현은 건너뜁니다')
+    args = parser.parse_args()
+
+    def prepare(n, seed=0):
+        return add_derived_features(add_repurchase_columns(parse_orders(make_orders(n, seed=seed, days=args.days))))
+
+    check_identical(prepare(20_000, seed=3))
+    print('정합성 검사 통과: 주 / 월 코호트 x (전체 / 그룹 / 주문경로) 활성 고객 수 동일')
+
+    print(f"{'rows':>12} {'split':>8} {'cohorts':>8} {'legacy(s)':>10} {'matrix(s)':>10} {'speedup':>9}")
+    for n in args.sizes:
+        df = prepare(n)
+        for split in [None, '셀러명']:
+            mat_t, matrix = _timed(cohort_matrix, df, 'W', split)
+            label = split or '전체'
+            if n <= args.legacy_max:
+                leg_t, _ = _timed(legacy_cohorts, df, 'W', split)
+                print(f'{n:>12,} {label:>8} {len(matrix):>8,} {leg_t:>10.3f} {mat_t:>10.3f} {leg_t / mat_t:>8.1f}x')
+            else:
+                print(f"{n:>12,} {label:>8} {len(matrix):>8,} {'-':>10} {mat_t:>10.3f} {'-':>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import time
+
+import pandas as pd
+
+from analytics import aggregates as agg
+from analytics.cube import OrderCube
+from analytics.features import add_derived_features
+from analytics.repurchase import add_repurchase_columns
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 집계 큐브 검증/벤치마크: 원본 행 groupby vs 큐브 rollup
+# 실행: python -m benchmarks.bench_cube --sizes 100000 1000000
+# ----------------------------------------------------------------
+
+GROUP_SELECTIONS = [['킹댕즈', '일반 셀러'], ['킹댕즈'], ['일반 셀러']]
+
+
+# --- 기존 dashboard.py 의 원본 행 집계 (비교 기준) ---
+def raw_views(f_df):
+    weekday = f_df.assign(요일=f_df['주문일'].dt.day_name()).groupby(['요일', '그룹'], observed=True).agg({
+        '실결제 금액': 'sum', '셀러명': 'nunique'}).reindex(agg.DAY_ORDER, level=0).reset_index()
+    reg_stats = f_df.groupby('광역지역(정식)', observed=True).agg({
+        '실결제 금액': 'sum', '재구매여부': lambda x: x.mean() * 100, '주문번호': 'count'}).reset_index()
+    reg_stats.columns = ['지역', '총매출', '재구매율', '주문건수']
+    ch_sum = f_df.groupby('주문경로', observed=True).agg({
+        '실결제 금액': 'sum', '주문번호': 'count', '재구매여부': lambda x: x.mean() * 100
+    }).rename(columns={'실결제 금액': '매출', '주문번호': '건수', '재구매여부': '재구매비중(%)'}).reset_index()
+    return {
+        'daily_revenue': f_df.groupby('주문날짜', observed=True)['실결제 금액'].sum().reset_index(),
+        'seller_revenue': f_df.groupby('셀러명', observed=True)['실결제 금액'].sum().sort_values(ascending=False),
+        'channel_aov': f_df.groupby('주문경로', observed=True)['실결제 금액'].mean().sort_values(ascending=False).reset_index(),
+        'channel_summary': ch_sum,
+        'weekday_seller_stats': weekday,
+        'region_stats': reg_stats,
+        'region_channel_counts': f_df.groupby(['광역지역(정식)', '주문경로'], observed=True).size().unstack(fill_value=0),
+        'variety_counts': f_df['품종'].value_counts().loc[lambda s: s > 0],
+        'variety_revenue': f_df.groupby('품종', observed=True)['실결제 금액'].sum().sort_values(ascending=False),
+        'purpose_repeat_stats': f_df.groupby('구매목적', observed=True).agg({
+            '재구매여부': 'mean', '주문번호': 'count'}).reset_index(),
+    }
+
+
+def cube_views(cube):
+    return {name: getattr(agg, name)(cube) for name in [
+        'daily_revenue', 'seller_revenue', 'channel_aov', 'channel_summary', 'weekday_seller_stats',
+        'region_stats', 'region_channel_counts', 'variety_counts', 'variety_revenue', 'purpose_repeat_stats']}
+
+
+def check_identical(df, cube):
+    for groups in GROUP_SELECTIONS:
+        expected = raw_views(df[df['그룹'].isin(groups)])
+        actual = cube_views(cube.slice(groups))
+        for name, exp in expected.items():
+            compare = pd.testing.assert_frame_equal if isinstance(exp, pd.DataFrame) else pd.testing.assert_series_equal
+            compare(exp, actual[name], check_dtype=False, check_names=False, check_index_type=False,
+                    check_categorical=False)
+
+
+def prepare(n, seed=0):
+    return add_derived_features(add_repurchase_columns(parse_orders(make_orders(n, seed=seed))))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    small = prepare(20_000, seed=3)
+    check_identical(small, OrderCube.build(small))
+    print('정합성 검사 통과: 큐브 rollup == 원본 groupby (그룹 선택 3가지)')
+
+    print(f"{'rows':>10} {'cells':>10} {'build(s)':>9} {'raw views(s)':>13} {'cube views(s)':>14}")
+    for n in args.sizes:
+        df = prepare(n)
+        start = time.perf_counter()
+        cube = OrderCube.build(df)
+        build_t = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for groups in GROUP_SELECTIONS:
+            raw_views(df[df['그룹'].isin(groups)])
+        raw_t = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for groups in GROUP_SELECTIONS:
+            cube_views(cube.slice(groups))
+        cube_t = time.perf_counter() - start
+        print(f'{n:>10,} {len(cube):>10,} {build_t:>9.2f} {raw_t:>13.2f} {cube_t:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
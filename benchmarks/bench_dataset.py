@@ -0,0 +1,82 @@
+import argparse
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from analytics.cube import OrderCube
+from analytics.dataset import OrderDataset, write_order_dataset
+from analytics.features import add_derived_features
+from analytics.repurchase import add_repurchase_columns
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 파티션 Parquet 쿼리 백엔드 검증/벤치마크
+# 같은 주문으로 pandas 큐브(OrderCube.build)와 데이터셋 배치 스캔 큐브를 만들어
+# 차원별 합산 결과가 같은지 확인하고, 그룹/기간 조건별 스캔 시간을 비교합니다 (Arrow 최대 할당량도 출력).
+# 실행: python -m benchmarks.bench_dataset --rows 1000000 --chunks 8
+# ----------------------------------------------------------------
+
+ROLLUPS = [['그룹'], ['주문날짜'], ['셀러명'], ['주문경로'], ['광역지역(정식)', '주문경로', '셀러명'],
+           ['품종', '구매목적'], ['그룹', '주문날짜']]
+
+
+def check_identical(expected, actual):
+    for dims in ROLLUPS:
+        pd.testing.assert_frame_equal(expected.rollup(dims), actual.rollup(dims), check_dtype=False,
+                                      check_index_type=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunks', type=int, default=8, help='데이터셋을 나눠 쓰는 프레임 수')
+    args = parser.parse_args()
+
+    df = add_derived_features(add_repurchase_columns(parse_orders(make_orders(args.rows))))
+    days = df['주문일'].dropna().sort_values()
+    mid = days.iloc[len(days) // 2]
+    queries = {
+        '전체': {},
+        '킹댕즈': {'groups': ['킹댕즈']},
+        '최근 30일': {'start': days.iloc[-1] - pd.Timedelta(days=29), 'end': days.iloc[-1]},
+        '일반 셀러 + 14일': {'groups': ['일반 셀러'], 'start': mid, 'end': mid + pd.Timedelta(days=13)},
+    }
+
+    root = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        write_order_dataset((df.iloc[idx] for idx in np.array_split(np.arange(len(df)), args.chunks)), root)
+        print(f'데이터셋 기록: {time.perf_counter() - start:.2f}s')
+        dataset = OrderDataset(root)
+
+        print(f"{'query':<16} {'rows':>10} {'pandas(s)':>10} {'dataset(s)':>11}")
+        for name, cond in queries.items():
+            mask = pd.Series(True, index=df.index)
+            if 'groups' in cond:
+                mask &= df['그룹'].isin(cond['groups'])
+            if 'start' in cond:
+                mask &= (df['주문일'] >= cond['start'].normalize()) & \
+                        (df['주문일'] < cond['end'].normalize() + pd.Timedelta(days=1))
+
+            start = time.perf_counter()
+            expected = OrderCube.build(df[mask])
+            pandas_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = dataset.build_cube(**cond)
+            dataset_time = time.perf_counter() - start
+
+            check_identical(expected, actual)
+            print(f'{name:<16} {int(mask.sum()):>10,} {pandas_time:>10.2f} {dataset_time:>11.2f}')
+        print(f'데이터셋 스캔 중 Arrow 최대 할당: {pa.default_memory_pool().max_memory() / 1e6:.1f} MB')
+        print('정합성 검사 통과: 모든 조건에서 pandas 큐브와 데이터셋 큐브 결과 동일')
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
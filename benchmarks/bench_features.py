@@ -0,0 +1,79 @@
+import argparse
+import time
+
+import pandas as pd
+
+from analytics.features import add_derived_features
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 파생 컬럼 벤치마크: 기존 row-wise apply vs 벡터화
+# 실행: python -m benchmarks.bench_features --sizes 10000 100000 1000000 10000000
+# ----------------------------------------------------------------
+
+
+# --- 기존 dashboard.py 구현 (비교 기준) ---
+def classify_purpose(row):
+    size = str(row['과수 크기'])
+    price = row['실결제 금액']
+    if any(keyword in size for keyword in ['선물', '명품', '로얄', '특']) or (price >= 35000):
+        return '선물용'
+    else:
+        return '자기소비용'
+
+
+def classify_time_cluster(row):
+    hr = row['주문일'].hour
+    dy = row['주문일'].dayofweek
+    if dy >= 5:
+        if 0 <= hr < 7: return 0
+        else: return 2
+    else:
+        if 0 <= hr < 7: return 3
+        else: return 1
+
+
+def legacy_features(df):
+    df['그룹'] = df['셀러명'].apply(lambda x: '킹댕즈' if x == '킹댕즈' else '일반 셀러')
+    df['구매목적'] = df.apply(classify_purpose, axis=1)
+    df['time_cluster'] = df.apply(classify_time_cluster, axis=1)
+    return df
+
+
+def check_identical(df):
+    legacy = legacy_features(df.copy())
+    vector = add_derived_features(df.copy())
+    for col in ['그룹', '구매목적', 'time_cluster']:
+        pd.testing.assert_series_equal(legacy[col], vector[col], check_names=True)
+
+
+def _timed(func, df):
+    start = time.perf_counter()
+    func(df)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument('--legacy-max', type=int, default=1_000_000,
+                        help='이 행 수를 넘으면 기존 apply 구현은 건너뜁니다 (수 분 이상 소요)')
+    args = parser.parse_args()
+
+    # 정합성 검사는 작은 표본으로 먼저 수행
+    check_identical(parse_orders(make_orders(20_000, seed=1)))
+    print('정합성 검사 통과: 그룹 / 구매목적 / time_cluster 동일')
+
+    print(f"{'rows':>12} {'legacy(s)':>12} {'vector(s)':>12} {'speedup':>10}")
+    for n in args.sizes:
+        df = parse_orders(make_orders(n))
+        vec_t = _timed(add_derived_features, df.copy())
+        if n <= args.legacy_max:
+            leg_t = _timed(legacy_features, df.copy())
+            print(f'{n:>12,} {leg_t:>12.3f} {vec_t:>12.3f} {leg_t / vec_t:>9.1f}x')
+        else:
+            print(f"{n:>12,} {'-':>12} {vec_t:>12.3f} {'-':>10}")
+
+
+if __name__ == '__main__':
+    main()
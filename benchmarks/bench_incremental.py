@@ -0,0 +1,83 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from analytics.incremental import ingest_partitions
+from benchmarks.synthetic import make_orders
+
+# ----------------------------------------------------------------
+# 증분 적재 검증/벤치마크
+# 합성 주문을 일자별 CSV 로 나눠 두고, 마지막 하루를 제외한 이력을 먼저 적재한 뒤
+# 하루치 파일을 추가했을 때의 증분 적재 시간과 전체 재적재 시간을 비교합니다.
+# 실행: python -m benchmarks.bench_incremental --rows 1000000
+# ----------------------------------------------------------------
+
+
+def write_partitions(df, data_dir):
+    # 주문일 기준 일자별 파일 (orders_YYYY-MM-DD.csv)
+    days = df['주문일'].dt.strftime('%Y-%m-%d')
+    paths = []
+    for day, part in df.groupby(days, sort=True):
+        path = os.path.join(data_dir, f'orders_{day}.csv')
+        part.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def check_identical(incremental, full):
+    # 행 순서는 다를 수 있으므로 인덱스(원본 적재 순서) 기준으로 비교
+    pd.testing.assert_frame_equal(incremental.sort_index(), full.sort_index()[incremental.columns],
+                                  check_categorical=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    raw = make_orders(args.rows).sort_values('주문일', kind='stable')
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = os.path.join(tmp, 'source')
+        os.makedirs(source_dir)
+        paths = write_partitions(raw, source_dir)
+
+        # 1) 마지막 하루를 뺀 이력 적재
+        data_dir = os.path.join(tmp, 'orders')
+        os.makedirs(data_dir)
+        for path in paths[:-1]:
+            shutil.copy(path, data_dir)
+        start = time.perf_counter()
+        ingest_partitions(data_dir)
+        history_t = time.perf_counter() - start
+        versions_before = dict(ingest_partitions(data_dir).attrs['group_versions'])
+
+        # 2) 하루치 파일 추가 후 증분 적재
+        shutil.copy(paths[-1], data_dir)
+        start = time.perf_counter()
+        incremental = ingest_partitions(data_dir)
+        append_t = time.perf_counter() - start
+
+        # 3) 같은 파일 전체를 처음부터 적재 (비교 기준)
+        full_dir = os.path.join(tmp, 'full')
+        shutil.copytree(data_dir, full_dir)
+        start = time.perf_counter()
+        ingest_partitions(full_dir)
+        full_t = time.perf_counter() - start
+
+        # 저장소에서 다시 읽은 프레임끼리 비교 (Parquet 왕복 후 결측 표현을 맞춤)
+        check_identical(ingest_partitions(data_dir), ingest_partitions(full_dir))
+        print('정합성 검사 통과: 증분 적재 == 전체 재적재')
+
+    versions_after = incremental.attrs['group_versions']
+    bumped = sorted(g for g in versions_after if versions_after[g] != versions_before.get(g))
+    print(f"{'rows':>10} {'partitions':>11} {'history(s)':>11} {'append 1 day(s)':>16} {'full rebuild(s)':>16}")
+    print(f'{len(raw):>10,} {len(paths):>11} {history_t:>11.2f} {append_t:>16.2f} {full_t:>16.2f}')
+    print(f'버전이 바뀐 그룹: {bumped}')
+
+
+if __name__ == '__main__':
+    main()
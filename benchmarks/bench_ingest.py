@@ -0,0 +1,71 @@
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from analytics.schema import read_orders
+from benchmarks.synthetic import write_orders_csv
+
+# ----------------------------------------------------------------
+# 적재 메모리 리포트: 기존 read_csv(추론) vs 타입 지정 스키마
+# 실행: python -m benchmarks.bench_ingest --csv project1-preprocessed_data.csv
+#       python -m benchmarks.bench_ingest --rows 1000000
+# ----------------------------------------------------------------
+
+
+def legacy_read(file_path):
+    # 기존 dashboard.py 적재 방식
+    df = pd.read_csv(file_path)
+    for col in ['실결제 금액', '결제금액', '판매단가', '공급단가']:
+        if col in df.columns and df[col].dtype == 'object':
+            df[col] = df[col].str.replace(',', '').astype(float)
+    df['주문일'] = pd.to_datetime(df['주문일'])
+    return df
+
+
+def _mb(nbytes):
+    return nbytes / 1024 ** 2
+
+
+def memory_report(file_path):
+    start = time.perf_counter()
+    legacy = legacy_read(file_path)
+    legacy_t = time.perf_counter() - start
+
+    start = time.perf_counter()
+    typed = read_orders(file_path)
+    typed_t = time.perf_counter() - start
+
+    legacy_mem = legacy.memory_usage(deep=True)
+    typed_mem = typed.memory_usage(deep=True)
+
+    print(f'파일: {file_path} ({_mb(os.path.getsize(file_path)):.1f} MB, {len(legacy):,} rows)')
+    print(f"{'column':<16} {'legacy dtype':<16} {'legacy MB':>10} {'typed dtype':<18} {'typed MB':>10}")
+    for col in legacy.columns:
+        if col in typed.columns:
+            print(f'{col:<16} {str(legacy[col].dtype):<16} {_mb(legacy_mem[col]):>10.2f} '
+                  f'{str(typed[col].dtype):<18} {_mb(typed_mem[col]):>10.2f}')
+        else:
+            print(f"{col:<16} {str(legacy[col].dtype):<16} {_mb(legacy_mem[col]):>10.2f} {'(usecols 제외)':<18} {0:>10.2f}")
+    print(f"{'TOTAL':<16} {'':<16} {_mb(legacy_mem.sum()):>10.2f} {'':<18} {_mb(typed_mem.sum()):>10.2f}")
+    print(f'적재 시간: legacy {legacy_t:.2f}s / typed {typed_t:.2f}s, '
+          f'메모리 {legacy_mem.sum() / typed_mem.sum():.1f}배 감소')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--csv', help='측정할 주문 CSV (없으면 합성 데이터 생성)')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    if args.csv:
+        memory_report(args.csv)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        memory_report(write_orders_csv(os.path.join(tmp, 'orders.csv'), args.rows))
+
+
+if __name__ == '__main__':
+    main()
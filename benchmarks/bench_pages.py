@@ -0,0 +1,102 @@
+import argparse
+import time
+
+import pandas as pd
+
+from analytics.features import INFLUENCER_NAME, add_derived_features
+from analytics.metrics import COMPETITIVE_PAGE, INFLUENCER_PAGE, page_option_breakdown, product_page_stats
+from analytics.pages import page_index
+from analytics.repurchase import add_repurchase_columns
+from analytics.schema import ARROW_STRING, CATEGORY_COLUMNS
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 상품 페이지 분석 벤치마크: 셀러 목록 lambda + apply 분류 + 페이지별 전체 프레임 재스캔
+# vs 상품명 x 셀러명 희소 인덱스 1회 생성 + 구간 조회
+# 상세 조회는 모든 페이지를 한 번씩 고른 평균 (선택 상자로 어느 페이지든 볼 수 있으므로)
+# 실행: python -m benchmarks.bench_pages --sizes 100000 1000000 3000000
+# ----------------------------------------------------------------
+
+
+# --- 기존 tab_prod 구현 (비교 기준) ---
+def legacy_page_stats(f_df):
+    page_stats = f_df.groupby('상품명', observed=True).agg({
+        '실결제 금액': 'sum',
+        '주문번호': 'count',
+        '셀러명': lambda x: sorted(set(x.dropna().astype(str)))
+    }).reset_index()
+    page_stats['페이지 유형'] = page_stats['셀러명'].apply(
+        lambda sellers: INFLUENCER_PAGE if INFLUENCER_NAME in sellers else COMPETITIVE_PAGE)
+    return page_stats
+
+
+def legacy_drilldown(f_df, p_name):
+    p_df = f_df[f_df['상품명'] == p_name]
+    opt_size = p_df.groupby(['품종', '과수 크기'], observed=True).size().reset_index(name='주문건수')
+    opt_weight = p_df.groupby(['무게 구분', '가격대'], observed=True).size().reset_index(name='주문건수')
+    opt_seller = p_df.groupby('셀러명', observed=True).agg({'실결제 금액': 'sum', '주문번호': 'count'}).reset_index()
+    opt_seller.columns = ['셀러명', '매출액', '주문건수']
+    return (opt_size.sort_values('주문건수', ascending=False),
+            opt_weight.sort_values('주문건수', ascending=False),
+            opt_seller.sort_values('매출액', ascending=False))
+
+
+def _sorted(frame, keys):
+    return frame.sort_values(keys, kind='stable').reset_index(drop=True)
+
+
+def check_identical(df):
+    for f_df in [df, df[df['그룹'] == INFLUENCER_NAME]]:
+        legacy = legacy_page_stats(f_df)
+        pages = page_index(f_df)
+        engine = product_page_stats(pages)
+        assert list(legacy['상품명'].astype(str)) == list(engine['상품명'])
+        assert (legacy['실결제 금액'].to_numpy() == engine['실결제 금액'].to_numpy()).all()
+        assert (legacy['주문번호'].to_numpy() == engine['주문번호'].to_numpy()).all()
+        assert (legacy['셀러명'].map(len).to_numpy() == engine['셀러수'].to_numpy()).all()
+        assert (legacy['페이지 유형'].to_numpy() == engine['페이지 유형'].to_numpy()).all()
+        for p_name in engine['상품명']:
+            old, new = legacy_drilldown(f_df, p_name), page_option_breakdown(pages, f_df, p_name)
+            pd.testing.assert_frame_equal(old[0], new[0])
+            pd.testing.assert_frame_equal(old[1], new[1])
+            old_seller = old[2].assign(셀러명=old[2]['셀러명'].astype(str))
+            pd.testing.assert_frame_equal(_sorted(old_seller, ['셀러명']), _sorted(new[2], ['셀러명']),
+                                          check_dtype=False)
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000, 3_000_000])
+    args = parser.parse_args()
+
+    def prepare(n, seed=0):
+        # 대시보드 적재와 같은 dtype (read_orders: 반복 문자열은 category, 주문번호는 Arrow 문자열)
+        df = parse_orders(make_orders(n, seed=seed))
+        df = df.astype({col: 'category' for col in CATEGORY_COLUMNS if col in df.columns} | {'주문번호': ARROW_STRING})
+        return add_derived_features(add_repurchase_columns(df))
+
+    check_identical(prepare(20_000, seed=3))
+    print('정합성 검사 통과: 페이지별 매출 / 주문 수 / 셀러 수 / 유형과 페이지 상세 3표 동일 (전체 / 킹댕즈 선택)')
+
+    print(f"{'rows':>12} {'pages':>6} {'legacy stats(s)':>16} {'index stats(s)':>15} "
+          f"{'legacy detail(ms)':>18} {'index detail(ms)':>17}")
+    for n in args.sizes:
+        df = prepare(n)
+        leg_stats_t, page_stats = _timed(legacy_page_stats, df)
+        idx_stats_t, pages = _timed(page_index, df)
+        idx_stats_t += _timed(product_page_stats, pages)[0]
+        # 상세 조회 1회 평균 (모든 페이지를 한 번씩) - 인덱스는 이미 만든 것을 재사용
+        names = list(page_stats['상품명'])
+        leg_detail_t, _ = _timed(lambda: [legacy_drilldown(df, p_name) for p_name in names])
+        idx_detail_t, _ = _timed(lambda: [page_option_breakdown(pages, df, p_name) for p_name in names])
+        print(f'{n:>12,} {len(names):>6,} {leg_stats_t:>16.3f} {idx_stats_t:>15.3f} '
+              f'{leg_detail_t / len(names) * 1000:>18.1f} {idx_detail_t / len(names) * 1000:>17.1f}')
+
+if __name__ == '__main__':
+    main()
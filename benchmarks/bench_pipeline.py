@@ -0,0 +1,156 @@
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+
+import pandas as pd
+
+from analytics import aggregates as agg
+from analytics import growth, metrics
+from analytics.cube import OrderCube
+from analytics.customer_table import customer_table
+from analytics.features import add_derived_features
+from analytics.pages import page_index
+from analytics.repurchase import add_repurchase_columns, repurchase_intervals
+from analytics.schema import read_orders
+from benchmarks.synthetic import write_orders_csv
+
+# ----------------------------------------------------------------
+# 데이터 파이프라인 / 탭별 집계 벤치마크 (Streamlit 없이 실행)
+# 합성 주문 CSV 를 데이터 규모별로 만들어 적재 -> 재구매 -> 파생 컬럼 -> 큐브 생성 단계와
+# 각 탭의 집계 블록을 따로 측정하고, 결과를 JSON 으로 저장해 회귀 추적에 씁니다.
+# 실행: python -m benchmarks.bench_pipeline --sizes 10000 100000 1000000 --output bench_pipeline.json
+# ----------------------------------------------------------------
+
+GROUP_SELECTIONS = [['킹댕즈', '일반 셀러'], ['킹댕즈'], ['일반 셀러']]
+
+# 탭 이름 -> 그 탭이 호출하는 집계 함수
+# (cube: 그룹 슬라이스된 큐브 / frame: 필터링된 f_df / customers: 고객 테이블 / pages: 상품 페이지 인덱스)
+TAB_BLOCKS = {
+    'Dashboard': [('frame', metrics.headline_kpis), ('frame', agg.weekly_stats), ('cube', agg.daily_revenue),
+                  ('customers', metrics.customer_growth), ('frame', metrics.cancel_by_option)],
+    '매출 & 채널': [('cube', metrics.weekday_seller_productivity), ('cube', agg.channel_aov),
+                 ('cube', metrics.seller_pareto), ('frame', metrics.revenue_by_customer_type),
+                 ('cube', agg.channel_summary)],
+    '셀러 & 로열티': [('cube', agg.variety_counts), ('cube', agg.seller_revenue),
+                  ('frame', lambda f_df: metrics.purpose_best_options(metrics.citrus_orders(f_df))),
+                  ('frame', metrics.loyal_sellers)],
+    '상품 페이지 분석': [('pages', metrics.top_product_pages)],
+    '재구매 퍼널': [('customers', metrics.retention_funnel), ('frame', repurchase_intervals),
+               ('frame', metrics.aov_by_purchase_round), ('frame', metrics.variety_mix_first_vs_repeat)],
+    '구매 시점 분석': [('frame', metrics.time_cluster_summary), ('frame', metrics.weekday_hour_matrix)],
+    '등급별 분석': [('frame', lambda f_df: metrics.true_aov(f_df, '상품성등급_그룹')),
+               ('frame', lambda f_df: metrics.true_aov(f_df, '구매목적')), ('cube', agg.purpose_repeat_stats)],
+    '지역별 분석': [('cube', agg.region_stats),
+               ('cube', lambda cube: metrics.best_region_combos(agg.region_path_revenue(cube)))],
+    '경로 상세분석': [('frame', metrics.path_visit_mix), ('frame', metrics.path_member_mix)],
+    '셀러 성장 전략': [('frame', lambda f_df: growth.group_summary(growth.growth_orders(f_df))),
+                 ('frame', lambda f_df: growth.channel_share(growth.growth_orders(f_df))),
+                 ('frame', lambda f_df: growth.common_item_aov(growth.growth_orders(f_df)))],
+    '마케팅 전략': [('frame', lambda f_df: metrics.true_aov(f_df, '그룹')), ('frame', metrics.hourly_orders),
+               ('customers', lambda customers: metrics.repeat_split(customers, '킹댕즈')),
+               ('cube', agg.region_channel_counts), ('cube', agg.variety_revenue)],
+}
+
+
+def timed(func, *args, repeat=1):
+    # repeat 회 중 가장 빠른 시간(초)과 마지막 결과
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def prepare_orders(df):
+    # dashboard.process_order_file 과 같은 순서 (적재 이후 단계)
+    df['주문날짜'] = df['주문일'].dt.date
+    return df
+
+
+def run_tab(blocks, inputs):
+    for kind, func in blocks:
+        func(inputs[kind])
+
+
+def selection_inputs(df, cube):
+    # 그룹 선택마다 탭 집계의 입력 (대시보드처럼 선택당 한 번: f_df 필터링 / 큐브 슬라이스 / 고객 테이블 / 페이지 인덱스)
+    inputs = []
+    for groups in GROUP_SELECTIONS:
+        mask = df['그룹'].isin(groups)
+        f_df = df if mask.all() else df[mask]
+        inputs.append({'frame': f_df, 'cube': cube.slice(groups), 'customers': customer_table(f_df),
+                       'pages': page_index(f_df)})
+    return inputs
+
+
+def bench_size(csv_path, n_rows, repeat):
+    stages = {}
+    stages['ingest'], df = timed(read_orders, csv_path)
+    df = prepare_orders(df)
+    stages['repurchase'], df = timed(add_repurchase_columns, df)
+    stages['features'], df = timed(add_derived_features, df)
+    stages['cube_build'], cube = timed(OrderCube.build, df)
+    stages['customer_table'], _ = timed(customer_table, df)
+    stages['page_index'], _ = timed(page_index, df)
+    # 선택 입력은 선택마다 한 번만 만들고 모든 탭이 공유 (생성 시간은 selections 단계로 따로 기록)
+    stages['selections'], inputs = timed(selection_inputs, df, cube)
+
+    # 탭 블록: 그룹 선택 3가지의 집계만 계산한 시간 (입력 생성 제외)
+    tabs = {}
+    for tab, blocks in TAB_BLOCKS.items():
+        def run_all(blocks=blocks):
+            for selection in inputs:
+                run_tab(blocks, selection)
+        tabs[tab], _ = timed(run_all, repeat=repeat)
+
+    return {
+        'rows': n_rows,
+        'cube_cells': len(cube),
+        'frame_mb': round(df.memory_usage(deep=True).sum() / 1024 ** 2, 1),
+        'stages': stages,
+        'tabs': tabs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3, help='탭 블록 반복 횟수 (최소값 기록)')
+    parser.add_argument('--output', default='bench_pipeline.json')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            csv_path = write_orders_csv(os.path.join(tmp, f'orders_{n}.csv'), n)
+            results.append(bench_size(csv_path, n, args.repeat))
+            os.remove(csv_path)
+
+    report = {
+        'created': pd.Timestamp.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    stage_names = list(results[0]['stages'])
+    print(f"{'rows':>10} " + ' '.join(f'{s:>11}' for s in stage_names))
+    for r in results:
+        print(f"{r['rows']:>10,} " + ' '.join(f"{r['stages'][s]:>11.3f}" for s in stage_names))
+    print()
+    print(f"{'tab':<16} " + ' '.join(f"{r['rows']:>11,}" for r in results))
+    for tab in TAB_BLOCKS:
+        print(f'{tab:<16} ' + ' '.join(f"{r['tabs'][tab]:>11.3f}" for r in results))
+    print(f'결과 저장: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
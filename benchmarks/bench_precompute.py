@@ -0,0 +1,58 @@
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from analytics.cube import OrderCube
+from analytics.features import add_derived_features
+from analytics.precompute import TAB_AGGREGATES, group_selections, precompute_aggregates
+from analytics.repurchase import add_repurchase_columns
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 시작 시 탭 집계 일괄 계산 검증/벤치마크: 순차 계산 vs 프로세스 풀
+# 실행: python -m benchmarks.bench_precompute --rows 1000000 --workers 1 4 8
+# ----------------------------------------------------------------
+
+GROUP_OPTIONS = ['킹댕즈', '일반 셀러']
+
+
+def check_identical(serial, parallel):
+    expected = {(groups, name): value for groups, name, value in serial}
+    for groups, name, value in parallel:
+        exp = expected[(groups, name)]
+        if isinstance(exp, pd.DataFrame):
+            pd.testing.assert_frame_equal(exp, value, check_categorical=False)
+        elif isinstance(exp, pd.Series):
+            pd.testing.assert_series_equal(exp, value, check_categorical=False)
+        else:
+            assert exp == value, (groups, name)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    df = add_derived_features(add_repurchase_columns(parse_orders(make_orders(args.rows))))
+    cube = OrderCube.build(df)
+    n_tasks = len(group_selections(GROUP_OPTIONS)) * len(TAB_AGGREGATES)
+
+    print(f"{'rows':>10} {'tasks':>6} {'workers':>8} {'elapsed(s)':>11}")
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = precompute_aggregates(df, cube, GROUP_OPTIONS, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = results
+        else:
+            check_identical(baseline, results)
+        print(f'{len(df):>10,} {n_tasks:>6} {workers:>8} {elapsed:>11.2f}')
+    print('정합성 검사 통과: 모든 워커 수에서 결과 동일')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import write_orders_csv
+
+# ----------------------------------------------------------------
+# rerun 당 최대 메모리 측정 (탭별)
+# Streamlit AppTest 로 대시보드를 headless 실행하고, 데이터 로드가 끝난 뒤
+# 각 탭을 선택했을 때 한 번의 rerun 동안 추가로 할당된 최대 메모리(tracemalloc peak)를 기록합니다.
+# 실행: python -m benchmarks.bench_rerun_memory --rows 200000
+# ----------------------------------------------------------------
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'dashboard.py')
+
+
+def measure(dashboard_path):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(dashboard_path, default_timeout=900)
+    at.run()  # 데이터 로드 / 큐브 생성은 측정에서 제외
+    tab_radio = [r for r in at.radio if r.label == '분석 탭']
+    tabs = list(tab_radio[0].options) if tab_radio else [None]
+
+    results = []
+    for tab in tabs:
+        if tab is not None:
+            [r for r in at.radio if r.label == '분석 탭'][0].set_value(tab)
+        tracemalloc.start()
+        start = time.perf_counter()
+        at.run()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append((tab or '(all tabs)', peak / 1024 ** 2, elapsed, bool(at.exception)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--csv', help='측정할 주문 CSV (없으면 합성 데이터 생성)')
+    parser.add_argument('--dashboard', default=DASHBOARD)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['ORDER_DATA_FILE'] = args.csv or write_orders_csv(os.path.join(tmp, 'orders.csv'), args.rows)
+        results = measure(args.dashboard)
+
+    print(f"{'tab':<20} {'peak MB':>10} {'rerun(s)':>10}")
+    for tab, peak_mb, elapsed, failed in results:
+        print(f"{tab:<20} {peak_mb:>10.1f} {elapsed:>10.2f}{'  (exception)' if failed else ''}")
+
+
+if __name__ == '__main__':
+    main()
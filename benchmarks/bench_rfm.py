@@ -0,0 +1,84 @@
+import argparse
+import math
+import time
+
+import pandas as pd
+
+from analytics.customer_table import customer_table
+from analytics.features import add_derived_features
+from analytics.repurchase import add_repurchase_columns
+from analytics.rfm import RFM_BINS, SEGMENT_COL, SEGMENT_GRID, rfm_segments
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# RFM 세그먼트 벤치마크: 주문 groupby 집계 + 행별 apply 점수 / 라벨 vs 고객 테이블 + 배열 연산 1회
+# 고객 수가 많아지도록 행 수의 절반을 고객 풀로 사용
+# 실행: python -m benchmarks.bench_rfm --sizes 100000 1000000 3000000 6000000
+# ----------------------------------------------------------------
+
+
+# --- 고객별 groupby 집계 후 점수 / 세그먼트를 행마다 apply 로 붙이는 방식 (비교 기준) ---
+def legacy_rfm(df):
+    df = df.dropna(subset=['고객키'])
+    rfm = df.groupby('고객키').agg(마지막주문일=('주문일', 'max'), 구매빈도=('주문날짜', 'nunique'),
+                                 구매금액=('실결제 금액', 'sum'))
+    rfm['최근성(일)'] = (rfm['마지막주문일'].max().normalize() - rfm['마지막주문일'].dt.normalize()).dt.days
+
+    def score(p):
+        return min(max(math.ceil(p * RFM_BINS), 1), RFM_BINS)
+
+    rfm['R'] = rfm['최근성(일)'].rank(pct=True, ascending=False).apply(score)
+    rfm['F'] = rfm['구매빈도'].rank(pct=True).apply(score)
+    rfm['M'] = rfm['구매금액'].rank(pct=True).apply(score)
+    rfm[SEGMENT_COL] = rfm.apply(lambda row: SEGMENT_GRID[row['R'] - 1][row['F'] - 1], axis=1)
+    return rfm
+
+
+def vectorized_rfm(df):
+    return rfm_segments(customer_table(df))
+
+
+def check_identical(df):
+    legacy = legacy_rfm(df)
+    engine = vectorized_rfm(df)
+    pd.testing.assert_index_equal(legacy.index.astype('int64'), engine.index.astype('int64'), check_names=False)
+    for col in ['최근성(일)', '구매빈도', '구매금액', 'R', 'F', 'M']:
+        assert (legacy[col].to_numpy() == engine[col].to_numpy()).all(), col
+    assert (legacy[SEGMENT_COL].to_numpy() == engine[SEGMENT_COL].astype(str).to_numpy()).all()
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000, 3_000_000, 6_000_000])
+    parser.add_argument('--legacy-max', type=int, default=1_000_000,
+                        help='이 행 수를 넘으면 행별 apply 구현은 건너뜁니다')
+    args = parser.parse_args()
+
+    def prepare(n, seed=0):
+        raw = make_orders(n, seed=seed, n_customers=max(1, n // 2))
+        return add_derived_features(add_repurchase_columns(parse_orders(raw)))
+
+    check_identical(prepare(20_000, seed=3))
+    print('정합성 검사 통과: 최근성 / 빈도 / 금액 / R / F / M / 세그먼트 동일')
+
+    print(f"{'rows':>12} {'customers':>10} {'legacy(s)':>10} {'table(s)':>9} {'rfm(s)':>8} {'speedup':>9}")
+    for n in args.sizes:
+        df = prepare(n)
+        table_t, customers = _timed(customer_table, df)
+        rfm_t, _ = _timed(rfm_segments, customers)
+        total = table_t + rfm_t
+        if n <= args.legacy_max:
+            leg_t, _ = _timed(legacy_rfm, df)
+            print(f'{n:>12,} {len(customers):>10,} {leg_t:>10.3f} {table_t:>9.3f} {rfm_t:>8.3f} {leg_t / total:>8.1f}x')
+        else:
+            print(f"{n:>12,} {len(customers):>10,} {'-':>10} {table_t:>9.3f} {rfm_t:>8.3f} {'-':>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import pickle
+import time
+import tracemalloc
+
+import numpy as np
+
+from analytics.features import add_derived_features
+from analytics.repurchase import add_repurchase_columns
+from analytics.shared import enable_copy_on_write, frame_nbytes, select_rows, session_view
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 세션 간 공유 데이터셋 메모리 벤치마크
+# 세션 N개가 데이터를 받는 방식별 추가 메모리 / 시간 비교:
+#   cache_data  - 세션(rerun)마다 직렬화 복사본 (이전 방식, st.cache_data 와 동일한 pickle 왕복)
+#   shared view - 공유 원본의 Copy-on-Write 얕은 복사 (+ 세션이 컬럼 하나를 추가하는 경우)
+# 실행: python -m benchmarks.bench_shared --rows 1000000 --sessions 50
+# ----------------------------------------------------------------
+
+
+def measure(make_session, sessions):
+    tracemalloc.start()
+    start = time.perf_counter()
+    views = [make_session() for _ in range(sessions)]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del views
+    return peak / 1e6, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--sessions', type=int, default=50)
+    args = parser.parse_args()
+
+    enable_copy_on_write()
+    df = add_derived_features(add_repurchase_columns(parse_orders(make_orders(args.rows))))
+    payload = pickle.dumps(df)
+
+    def shared_view_with_column():
+        view = session_view(select_rows(df, None))
+        view['세션 컬럼'] = np.zeros(len(view))
+        # 공유 원본은 그대로
+        assert '세션 컬럼' not in df.columns
+        return view
+
+    print(f'공유 데이터셋: {frame_nbytes(df) / 1e6:,.1f} MB, 세션 {args.sessions}개')
+    print(f"{'mode':<24} {'extra(MB)':>10} {'elapsed(s)':>11}")
+    for name, make_session in [
+        ('cache_data (pickle)', lambda: pickle.loads(payload)),
+        ('shared view', lambda: session_view(select_rows(df, None))),
+        ('shared view + column', shared_view_with_column),
+    ]:
+        extra, elapsed = measure(make_session, args.sessions)
+        print(f'{name:<24} {extra:>10,.1f} {elapsed:>11.2f}')
+
+
+if __name__ == '__main__':
+    main()
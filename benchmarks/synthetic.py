@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------
+# 합성 주문 데이터 생성기
+# project1-preprocessed_data.csv 와 같은 컬럼 구성/값 형태를 흉내 냅니다.
+# (가격은 '35,000' 형태의 문자열, 연락처는 '010-xxxx-xxxx' 문자열)
+# ----------------------------------------------------------------
+
+SELLERS = ['킹댕즈'] + [f'셀러{i:03d}' for i in range(1, 240)]
+REGIONS = ['서울특별시', '경기도', '부산광역시', '인천광역시', '대구광역시', '대전광역시', '광주광역시',
+           '울산광역시', '세종특별자치시', '강원특별자치도', '충청북도', '충청남도', '전북특별자치도',
+           '전라남도', '경상북도', '경상남도', '제주특별자치도']
+CHANNELS = ['카카오톡', '인스타그램', '네이버', '크롬', '기타', '밴드', '페이스북']
+VARIETIES = ['감귤', '황금향', '레드향', '천혜향', '한라봉', '유라실생', '카라향']
+SIZES = ['로얄과', '특대과', '대과', '중과', '소과', '선물용 혼합', '명품과', '가정용', '못난이']
+WEIGHTS = ['2kg', '3kg', '5kg', '10kg']
+PRICE_BANDS = ['1만원 미만', '1-2만원', '2-3만원', '3-4만원', '4-5만원', '5만원 이상']
+MEMBER_TYPES = ['회원', '비회원']
+GRADE_GROUPS = ['프리미엄', '일반']
+PRODUCT_PAGES = [f'[제주 직송] 산지 {v} {w} 상품페이지 {i:02d}'
+                 for v in VARIETIES for w in WEIGHTS for i in range(1, 4)]
+
+PRICE_STEPS = np.arange(9_900, 80_000, 1_000)
+
+
+def _skewed_choice(rng, n_choices, size, a=1.3):
+    # 상위 몇 개 값에 주문이 몰리는 현실적인 분포 (Zipf 형태)
+    weights = 1.0 / np.arange(1, n_choices + 1) ** a
+    weights /= weights.sum()
+    return rng.choice(n_choices, size=size, p=weights)
+
+
+def make_orders(n_rows, seed=0, n_customers=None, start='2025-09-01', days=120):
+    rng = np.random.default_rng(seed)
+    if n_customers is None:
+        n_customers = max(1, n_rows // 3)
+
+    # 일부 고객이 여러 번 구매하도록 고객 번호도 편중 샘플링
+    cust_idx = (rng.pareto(2.0, size=n_rows) * n_customers / 6).astype(np.int64) % n_customers
+    phone_pool = np.array([f'010-{(i // 10000) % 10000:04d}-{i % 10000:04d}' for i in range(n_customers)],
+                          dtype=object)
+
+    seconds = rng.integers(0, days * 86400, size=n_rows)
+    order_dt = pd.Timestamp(start) + pd.to_timedelta(seconds, unit='s')
+
+    price_codes = rng.integers(0, len(PRICE_STEPS), size=n_rows)
+    price_text = np.array([f'{p:,}' for p in PRICE_STEPS], dtype=object)
+
+    seller_codes = _skewed_choice(rng, len(SELLERS), n_rows)
+    df = pd.DataFrame({
+        '주문번호': np.char.add('ORD', np.arange(n_rows).astype(str)).astype(object),
+        '주문일': order_dt,
+        '주문자연락처': phone_pool[cust_idx],
+        '셀러명': np.array(SELLERS, dtype=object)[seller_codes],
+        '실결제 금액': price_text[price_codes],
+        '결제금액': price_text[price_codes],
+        '판매단가': price_text[np.maximum(price_codes - 2, 0)],
+        '공급단가': price_text[np.maximum(price_codes - 8, 0)],
+        '과수 크기': np.array(SIZES, dtype=object)[rng.integers(0, len(SIZES), size=n_rows)],
+        '광역지역(정식)': np.array(REGIONS, dtype=object)[_skewed_choice(rng, len(REGIONS), n_rows, a=0.8)],
+        '주문경로': np.array(CHANNELS, dtype=object)[_skewed_choice(rng, len(CHANNELS), n_rows, a=0.9)],
+        '품종': np.array(VARIETIES, dtype=object)[_skewed_choice(rng, len(VARIETIES), n_rows, a=1.5)],
+        '상품명': np.array(PRODUCT_PAGES, dtype=object)[_skewed_choice(rng, len(PRODUCT_PAGES), n_rows, a=1.1)],
+        '무게 구분': np.array(WEIGHTS, dtype=object)[rng.integers(0, len(WEIGHTS), size=n_rows)],
+        '가격대': np.array(PRICE_BANDS, dtype=object)[np.minimum(price_codes // 12, len(PRICE_BANDS) - 1)],
+        '취소여부': np.where(rng.random(n_rows) < 0.03, 'Y', 'N').astype(object),
+        '재구매 횟수': rng.choice([0, 0, 0, 1, 1, 2, 3], size=n_rows),
+        '회원구분': np.array(MEMBER_TYPES, dtype=object)[rng.integers(0, 2, size=n_rows)],
+        '상품성등급_그룹': np.array(GRADE_GROUPS, dtype=object)[rng.integers(0, 2, size=n_rows)],
+    })
+
+    # 원본 파일처럼 일부 결측 섞기
+    na_mask = rng.random(n_rows) < 0.002
+    df.loc[na_mask, '과수 크기'] = np.nan
+    return df
+
+
+def parse_orders(raw):
+    # 대시보드 로더가 read_csv 직후 수행하는 최소 정제 (금액 숫자화 + 날짜 파싱)
+    df = raw.copy()
+    for col in ['실결제 금액', '결제금액', '판매단가', '공급단가']:
+        df[col] = df[col].str.replace(',', '').astype(float)
+    df['주문일'] = pd.to_datetime(df['주문일'])
+    df['주문날짜'] = df['주문일'].dt.date
+    return df
+
+
+def write_orders_csv(path, n_rows, seed=0):
+    df = make_orders(n_rows, seed=seed)
+    df.to_csv(path, index=False)
+    return path
@@ -1,20 +1,183 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 import os
+import tempfile
+import importlib.machinery
+
+from analytics import (
+    AggregateCache,
+    COHORT_FREQS,
+    COHORT_SIZE_COL,
+    COHORT_SPLITS,
+    CUBE_DIMENSIONS,
+    CustomerKeyMap,
+    CustomerTable,
+    DateIndex,
+    EXPORT_BATCH_ROWS,
+    EXPORT_FORMATS,
+    EXPORT_MAX_ROWS,
+    FilterIndex,
+    LatencyStats,
+    OrderCube,
+    OrderDataset,
+    OrderExplorer,
+    RerunProfile,
+    SEGMENTS,
+    SEGMENT_COL,
+    add_customer_keys,
+    add_derived_features,
+    add_repurchase_columns,
+    aov_by_purchase_round,
+    best_region_combos,
+    cache_dir_for,
+    cancel_by_option,
+    channel_aov,
+    channel_share,
+    channel_summary,
+    citrus_orders,
+    cohort_matrix,
+    cohort_rates,
+    common_item_aov,
+    configure_perf_logging,
+    customer_growth,
+    customer_table,
+    customer_type_channels,
+    customer_type_counts,
+    daily_customer_mix,
+    daily_repeat_trend,
+    daily_revenue,
+    daily_revenue_spike,
+    downsample_series,
+    enable_copy_on_write,
+    frame_batches,
+    frame_nbytes,
+    group_summary,
+    growth_orders,
+    headline_kpis,
+    hourly_orders,
+    ingest_partitions,
+    load_or_build,
+    loyal_sellers,
+    order_cube,
+    page_index,
+    page_option_breakdown,
+    partition_signature,
+    path_member_mix,
+    path_visit_mix,
+    process_memory_mb,
+    product_page_stats,
+    purpose_best_options,
+    purpose_option_counts,
+    purpose_repeat_stats,
+    read_orders,
+    region_channel_counts,
+    region_hierarchy,
+    region_path_revenue,
+    region_stats,
+    repeat_split,
+    repurchase_intervals,
+    retention_funnel,
+    revenue_by_customer_type,
+    rfm_segments,
+    row_segments,
+    segment_mix,
+    segment_summary,
+    select_rows,
+    selection_key,
+    seller_pareto,
+    seller_revenue,
+    stale_selections,
+    time_cluster_summary,
+    top_product_pages,
+    true_aov,
+    variety_counts,
+    variety_mix_first_vs_repeat,
+    variety_price_premium,
+    variety_revenue,
+    warm_cache,
+    week_over_week,
+    weekday_hour_matrix,
+    weekday_seller_productivity,
+    weekly_stats,
+    write_batches,
+)
+
+# Streamlit 은 이 스크립트를 __main__ 모듈로 실행하므로, 탭 집계 프로세스 풀의 spawn 워커가 시작하면서
+# 대시보드를 다시 실행하지 않도록 모듈 이름을 '__main__' 으로 지정 (이름이 있으면 워커는 부모 스크립트를 읽지 않음)
+__spec__ = importlib.machinery.ModuleSpec('__main__', None)
 
 # ----------------------------------------------------------------
 # 0. 페이지 설정 및 데이터 로드
 # ----------------------------------------------------------------
 st.set_page_config(page_title="통합 주문 데이터 분석 대시보드", layout="wide")
 
-@st.cache_data
-def load_and_process_data():
+# 처리된 주문 프레임은 모든 세션이 공유하는 읽기 전용 객체 - 세션 쪽 view 는 쓰기 시에만 복사되도록 Copy-on-Write 사용
+enable_copy_on_write()
+
+@st.cache_resource
+def get_latency_stats():
+    # 프로세스 전체가 공유하는 rerun 시간 기록 (p50/p95) + 성능 로그 핸들러 연결 (ORDER_PERF_LOG = 로그 파일 경로, 없으면 stderr)
+    configure_perf_logging(os.environ.get("ORDER_PERF_LOG"))
+    return LatencyStats()
+
+# 이번 rerun 의 구간별 시간 (로드 / 필터 / 탭 / 집계 / 차트)
+profile = RerunProfile()
+
+def stop_rerun(reason):
+    # 탭을 그리지 않고 끝나는 rerun 도 구조화 로그 / 지연 통계에 남긴 뒤 중단 (reason: 로그의 stopped 값)
+    profile.record(stopped=reason)
+    profile.finish(get_latency_stats())
+    st.stop()
+
+def process_order_file(file_path):
+    # 사용하는 컬럼만 타입을 지정해 적재 (category / Arrow 문자열 / 금액 float / 주문일 datetime)
+    df = read_orders(file_path)
+
+    # 고객 식별: '주문자연락처'를 저장된 사전으로 정수 고객키로 변환 (재적재해도 같은 연락처는 같은 키)
+    keymap = CustomerKeyMap.load(cache_dir_for(file_path))
+    df = add_customer_keys(df, keymap)
+    keymap.save()
+    
+    # 날짜 처리
+    df['주문날짜'] = df['주문일'].dt.date
+    
+    # 4. 재구매 정의 수정 (사용자 요청: 주문일이 다른 날짜인 경우만 재구매로 인정)
+    # 고객 식별은 '주문자연락처'에서 만든 정수 고객키를 기준으로 합니다.
+    # 재구매_날짜순서(첫 방문일=0, 이후 방문날짜마다 +1) / 재구매여부 / 최초주문일과
+    # 고객별 이전주문일 / 구매간격을 정렬 1회로 함께 계산합니다.
+    df = add_repurchase_columns(df)
+    
+    # 인플루언서 그룹핑 / 5. 구매 목적 분류 / 6. 구매 시점 클러스터링
+    # (행 단위 apply 대신 analytics.features 의 벡터화 연산 사용)
+    df = add_derived_features(df)
+    
+    return df
+
+@st.cache_resource(max_entries=1)
+def load_and_process_data(partitions=None):
+    # 프로세스에 하나만 두고 모든 세션이 같은 프레임을 읽음 (st.cache_data 는 호출마다 전체 복사본을 만듦)
+    # 새 파티션이 들어와 partitions 가 바뀌면 이전 데이터셋은 캐시에서 내려감
+    # (데이터셋별 리소스 get_order_cube / get_filter_index ... 도 max_entries=1 이라 새 지문으로 만들 때 이전 것이 내려감)
+    # 일자별 주문 파일 폴더(ORDER_DATA_DIR)가 지정되면 새로 들어온 파일만 증분 적재
+    # (partitions 는 폴더의 파일 목록 지문 - 파일이 추가/변경될 때만 다시 실행되도록 캐시 키로 사용)
+    data_dir = os.environ.get("ORDER_DATA_DIR")
+    if partitions and data_dir:
+        df = ingest_partitions(data_dir)
+        if df is None:
+            return None
+        # 새 주문으로 바뀐 그룹을 포함한 선택의 집계만 캐시에서 제거
+        # (RFM 세그먼트는 전체 고객 기준으로 다시 매기므로 이전 데이터셋 지문으로 만든 세그먼트 항목도 제거)
+        get_aggregate_cache().invalidate(stale_selections(df.attrs['store_key'], df.attrs['group_versions'],
+                                                          df.attrs['fingerprint']))
+        # 이전 프레임의 행 슬라이스(f_df)는 이전 데이터셋 전체를 붙잡고 있으므로 모두 제거
+        get_view_cache().invalidate()
+        return df
+
     # 깃허브 배포 및 로컬 환경 모두 지원하도록 스크립트 위치 기준 경로 사용
     base_dir = os.path.dirname(os.path.abspath(__file__))
     file_name = "project1-preprocessed_data.csv"
-    file_path = os.path.join(base_dir, file_name)
+    file_path = os.environ.get("ORDER_DATA_FILE") or os.path.join(base_dir, file_name)
     
     # 만약 파일이 없으면 기존에 사용하던 다른 이름이나 경로도 확인 (백업 로직)
     if not os.path.exists(file_path):
@@ -27,63 +190,91 @@ def load_and_process_data():
         else:
             return None
     
-    df = pd.read_csv(file_path)
-    
-    # 금액 데이터 숫자형 변환
-    price_cols = ['실결제 금액', '결제금액', '판매단가', '공급단가']
-    for col in price_cols:
-        if col in df.columns and df[col].dtype == 'object':
-            df[col] = df[col].str.replace(',', '').astype(float)
-    
-    # 날짜 처리
-    df['주문일'] = pd.to_datetime(df['주문일'])
-    df['주문날짜'] = df['주문일'].dt.date
-    
-    # 인플루언서 그룹핑
-    df['그룹'] = df['셀러명'].apply(lambda x: '킹댕즈' if x == '킹댕즈' else '일반 셀러')
-    
-    # 4. 재구매 정의 수정 (사용자 요청: 주문일이 다른 날짜인 경우만 재구매로 인정)
-    # 고객 식별은 '주문자연락처'를 기준으로 합니다.
-    df = df.sort_values(by=['주문자연락처', '주문일'])
-    
-    # 각 고객별로 주문날짜의 순서를 매깁니다 (첫 방문일=0, 이후 방문날짜마다 +1)
-    df['재구매_날짜순서'] = df.groupby('주문자연락처')['주문날짜'].transform(lambda x: x.map({d: i for i, d in enumerate(sorted(x.unique()))}))
-    df['재구매여부'] = df['재구매_날짜순서'] > 0
-    df['최초주문일'] = df.groupby('주문자연락처')['주문날짜'].transform('min')
-    
-    # 5. 구매 목적 분류 (Heuristic: 과수 크기와 가격대를 조합하여 추정)
-    def classify_purpose(row):
-        size = str(row['과수 크기'])
-        price = row['실결제 금액']
-        # 선물용 키워드가 있거나, 로얄과이면서 고단가인 경우
-        if any(keyword in size for keyword in ['선물', '명품', '로얄', '특']) or (price >= 35000):
-            return '선물용'
-        else:
-            return '자기소비용'
-    
-    df['구매목적'] = df.apply(classify_purpose, axis=1)
-    
-    # 6. 구매 시점 클러스터링 (요일 x 시간 패턴)
-    def classify_time_cluster(row):
-        hr = row['주문일'].hour
-        dy = row['주문일'].dayofweek # 0:월, 5:토, 6:일
-        
-        if dy >= 5: # 주말
-            if 0 <= hr < 7: return 0 # 주말 새벽
-            else: return 2 # 주말 피크
-        else: # 평일
-            if 0 <= hr < 7: return 3 # 평일 새벽
-            else: return 1 # 평일 피크
-            
-    df['time_cluster'] = df.apply(classify_time_cluster, axis=1)
-    
+    # 원본 파일 지문(크기/수정시각/해시)이 같으면 Parquet 캐시에서 바로 로드
+    df = load_or_build(file_path, process_order_file)
+    get_view_cache().invalidate()
     return df
 
-df = load_and_process_data()
+@st.cache_resource
+def get_aggregate_cache():
+    # 프로세스 전체(모든 세션)가 공유하는 집계 캐시
+    return AggregateCache(max_entries=256, ttl=3600)
+
+@st.cache_resource
+def get_view_cache():
+    # 같은 필터 선택의 행 슬라이스(f_df)를 세션 간 공유 (세션에는 데이터 복사 없는 view 로 전달)
+    return AggregateCache(max_entries=32, ttl=3600)
+
+@st.cache_resource(max_entries=1)
+def get_dataset_nbytes(data_key, _df):
+    return frame_nbytes(_df)
+
+@st.cache_resource
+def get_figure_cache():
+    # 프로세스 전체가 공유하는 plotly Figure 캐시 (선택 키 + 차트 이름 + 파라미터)
+    return AggregateCache(max_entries=128, ttl=3600)
+
+@st.cache_resource(max_entries=1)
+def get_order_cube(data_key, _df):
+    # 데이터셋(data_key)마다 한 번만 집계 큐브 생성 (_df 는 해싱하지 않음)
+    # ORDER_DATASET_DIR 에 같은 주문을 파티션 Parquet 로 저장해 두었다면 프레임 대신 데이터셋을 배치 스캔해서 생성
+    # (큐브만 데이터셋에서 만들고, 나머지 탭 / 필터는 적재한 프레임 df 를 그대로 사용)
+    # (데이터셋이 이 프레임(data_key 지문)으로 기록된 경우만 - 예전 데이터로 만든 데이터셋이면 프레임에서 생성)
+    dataset = OrderDataset.from_env(data_key)
+    if dataset is not None:
+        return dataset.build_cube()
+    return OrderCube.build(_df)
+
+@st.cache_resource(max_entries=1)
+def get_customer_table(data_key, _df):
+    # 데이터셋(data_key)마다 한 번만 고객 테이블 생성 (고객별 첫/마지막 주문일, 방문일수, 주문 수, 결제 합계 등)
+    return CustomerTable.build(_df)
+
+@st.cache_resource(max_entries=1)
+def get_rfm_segments(data_key, _df):
+    # 데이터셋(data_key)마다 한 번: 전체 고객의 RFM 점수 / 세그먼트 (기간 / 필터와 무관하게 같은 점수)
+    return rfm_segments(get_customer_table(data_key, _df))
+
+@st.cache_resource(max_entries=1)
+def get_date_index(data_key, _df):
+    # 데이터셋(data_key)마다 한 번만 '주문일' 정렬 인덱스 생성 - 기간 필터는 이진 탐색으로 구간만 잘라냄
+    return DateIndex(_df['주문일'])
+
+@st.cache_resource(max_entries=1)
+def get_filter_index(data_key, _df):
+    # 데이터셋(data_key)마다 한 번만 필터 컬럼의 값별 행 위치 인덱스 생성 (주문 행의 고객 RFM 세그먼트 포함)
+    return FilterIndex(_df).add_column(SEGMENT_COL, row_segments(_df, get_rfm_segments(data_key, _df)))
+
+@st.cache_resource(max_entries=1)
+def get_order_explorer(data_key, _df):
+    # 전체데이터 탭 탐색기 (같은 정렬 / 필터 인덱스 공유) - 페이지 이동은 해당 페이지 행만 읽음
+    return OrderExplorer(_df, get_date_index(data_key, _df), get_filter_index(data_key, _df))
+
+GROUP_OPTIONS = ['킹댕즈', '일반 셀러']
+
+@st.cache_resource(max_entries=1)
+def warm_aggregate_cache(data_key, _df):
+    # 데이터셋(data_key)마다 한 번: 모든 그룹 조합의 탭 집계를 여러 코어에서 미리 계산해 집계 캐시에 저장
+    # ORDER_PRECOMPUTE_WORKERS=0 이면 건너뛰고, 1 이면 현재 프로세스에서 순서대로 계산
+    workers = os.environ.get("ORDER_PRECOMPUTE_WORKERS")
+    if workers == "0":
+        return 0
+    store_key = _df.attrs.get('store_key', data_key)
+    group_versions = _df.attrs.get('group_versions')
+    return warm_cache(get_aggregate_cache(), _df, get_order_cube(data_key, _df), GROUP_OPTIONS,
+                      lambda groups: selection_key(store_key, groups, group_versions),
+                      max_workers=int(workers) if workers else None)
+
+with profile.section("load"):
+    df = load_and_process_data(partition_signature(os.environ.get("ORDER_DATA_DIR")))
 
 if df is None:
     st.error("데이터 파일을 찾을 수 없습니다. 경로를 확인해주세요.")
-    st.stop()
+    stop_rerun("no_data")
+
+# 배포 후 첫 조회부터 캐시에서 바로 응답하도록 탭 집계를 미리 계산 (데이터셋마다 한 번)
+with profile.section("warm"):
+    warm_aggregate_cache(df.attrs.get('fingerprint'), df)
 
 # ----------------------------------------------------------------
 # 1. 사이드바 필터
@@ -91,15 +282,120 @@ if df is None:
 st.sidebar.title("🔍 분석 필터")
 selected_groups = st.sidebar.multiselect(
     "분석할 셀러 그룹",
-    options=['킹댕즈', '일반 셀러'],
-    default=['킹댕즈', '일반 셀러']
+    options=GROUP_OPTIONS,
+    default=GROUP_OPTIONS
 )
 
 if not selected_groups:
     st.warning("분석할 그룹을 선택해주세요.")
-    st.stop()
-
-f_df = df[df['그룹'].isin(selected_groups)]
+    stop_rerun("no_groups")
+
+date_index = get_date_index(df.attrs.get('fingerprint'), df)
+first_day, last_day = date_index.bounds()
+picked = st.sidebar.date_input("주문 기간", value=(first_day, last_day), min_value=first_day,
+                               max_value=last_day) if first_day else ()
+# 시작일만 고른 상태(선택 중)면 마지막 주문일까지
+start_day, end_day = (tuple(picked) + (last_day,))[:2] if picked else (first_day, last_day)
+# 전체 기간이면 None (기간 슬라이스 없이 원본 사용, 미리 계산한 집계 캐시 키와 동일)
+date_range = None if date_index.covers(start_day, end_day) else (start_day, end_day)
+
+# 상세 필터: 선택하지 않은 항목은 전체
+filter_index = get_filter_index(df.attrs.get('fingerprint'), df)
+DETAIL_FILTERS = {'셀러명': "셀러", '주문경로': "유입 경로", '광역지역(정식)': "지역", '품종': "품종", '구매목적': "구매목적",
+                  SEGMENT_COL: "RFM 세그먼트"}
+detail_filters = {}
+with st.sidebar.expander("상세 필터"):
+    for col, label in DETAIL_FILTERS.items():
+        picked_values = st.multiselect(label, options=filter_index.values(col))
+        if picked_values:
+            detail_filters[col] = picked_values
+conditions = dict(detail_filters)
+if set(selected_groups) != set(filter_index.values('그룹')):
+    conditions['그룹'] = selected_groups
+
+# 선택 조건의 행 위치: 기간은 정렬 인덱스에서 이진 탐색으로 잘라내고, 나머지 조건은 값별 행 위치 인덱스로 좁힘
+# (전체 그룹 / 전체 기간 / 상세 필터 없음이면 None = 전체 행)
+with profile.section("filter"):
+    rows = filter_index.resolve(conditions, None if date_range is None else date_index.positions(*date_range))
+    # 합계/건수 집계용 큐브도 같은 조건으로 슬라이스 (RFM 세그먼트를 제외한 필터 컬럼은 모두 큐브 차원)
+    f_cube = get_order_cube(df.attrs.get('fingerprint'), df).slice(selected_groups)
+    if date_range is not None:
+        f_cube = f_cube.between(*date_range)
+    cube_filters = {col: values for col, values in detail_filters.items() if col in CUBE_DIMENSIONS}
+    if cube_filters:
+        f_cube = f_cube.where(**cube_filters)
+
+# 집계 캐시 키: 데이터셋 지문 + 선택 그룹 조합 (증분 적재 시: 저장소 식별자 + 그룹 조합 + 그룹별 버전) + 기간 + 상세 필터
+# RFM 세그먼트는 데이터셋 전체(마지막 주문일 기준 최근성)로 매기므로 새 파티션이 들어오면 모든 고객의 점수가 바뀜 -
+# 세그먼트 필터가 걸린 선택과 세그먼트 집계(rfm_key)는 그룹 버전과 무관하게 데이터셋 지문(revision)으로도 구분
+agg_cache = get_aggregate_cache()
+cache_before = agg_cache.stats()
+data_revision = df.attrs.get('fingerprint')
+sel_key = selection_key(df.attrs.get('store_key', data_revision), selected_groups, df.attrs.get('group_versions'),
+                        date_range, detail_filters, data_revision if SEGMENT_COL in detail_filters else None)
+rfm_key = selection_key(df.attrs.get('store_key', data_revision), selected_groups, df.attrs.get('group_versions'),
+                        date_range, detail_filters, data_revision)
+
+# 세션용 f_df: 같은 선택이면 다른 세션이 만든 행 슬라이스를 재사용하고, 세션마다 데이터 복사 없는 view 로 받음
+# (전체 선택이면 공유 원본의 view - 탭에서 컬럼을 추가해도 공유 원본은 바뀌지 않음)
+with profile.section("filter"):
+    f_df = get_view_cache().get(sel_key, select_rows, df, rows)
+
+# 기간 / 상세 필터 조합에 맞는 주문이 없으면 탭을 그리지 않음 (그룹을 하나도 고르지 않은 경우와 같은 처리)
+if f_df.empty:
+    st.warning("선택한 조건에 해당하는 주문이 없습니다. 기간이나 상세 필터를 조정해주세요.")
+    stop_rerun("empty_selection")
+
+def cached_agg(func, data, *params, variant=None, key=None):
+    # 이전에 본 그룹 조합이면 저장된 집계를 그대로 사용 (data 는 sel_key 에 해당하는 f_df 또는 f_cube)
+    # params 는 func(data, *params) 로 전달되고 캐시 키에도 포함됨 (해시할 수 없는 params 면 variant 로 키를 따로 지정)
+    # key: 선택 키 (기본 sel_key, RFM 세그먼트 집계는 rfm_key)
+    with profile.section(f"agg:{func.__name__}"):
+        return agg_cache.get(sel_key if key is None else key, func, data, *params,
+                             variant=params if variant is None else variant)
+
+# 고객 단위 지표용 고객 테이블: 전체 선택이면 로드 시 만든 테이블, 아니면 선택 주문으로 만든 테이블을 집계 캐시로 공유
+with profile.section("filter"):
+    customers = (get_customer_table(df.attrs.get('fingerprint'), df) if rows is None
+                 else cached_agg(customer_table, f_df))
+    # RFM 세그먼트로 거른 선택은 큐브 차원으로 자를 수 없으므로 선택 주문으로 만든 큐브를 집계 캐시로 공유
+    if SEGMENT_COL in detail_filters:
+        f_cube = cached_agg(order_cube, f_df)
+
+# 전체 고객 기준 RFM 세그먼트 (세그먼트 구성 차트는 선택된 고객만 집계)
+segments = get_rfm_segments(df.attrs.get('fingerprint'), df)
+
+fig_cache = get_figure_cache()
+
+def cached_figure(chart_id, build, *params):
+    # 같은 선택(sel_key) + 차트 + 파라미터면 plotly Figure 를 다시 만들지 않음
+    # (build 는 인자 없이 Figure 를 반환하는 함수, 캐시된 Figure 는 수정하지 않고 그대로 그림)
+    with profile.section(f"fig:{chart_id}"):
+        return fig_cache.get((sel_key, chart_id) + params, build)
+
+def _spool_export(make_batches, fmt, full_df):
+    # 배치 단위로 임시 파일에 기록한 뒤 전달 (다운로드 버튼을 눌렀을 때만 실행)
+    # 반환한 bytes 는 Streamlit 이 메모리에 보관하므로 행 수 상한은 export_buttons 에서 미리 확인
+    with tempfile.TemporaryFile() as tmp:
+        write_batches(make_batches(), fmt, tmp, full_df)
+        tmp.seek(0)
+        return tmp.read()
+
+def export_buttons(name, make_batches, n_rows, full_df=None):
+    # CSV / Parquet 다운로드 버튼 (make_batches: 내보낼 프레임 배치를 만드는 함수, 클릭 전에는 아무것도 만들지 않음)
+    if n_rows > EXPORT_MAX_ROWS:
+        st.warning(f"내보낼 행이 {n_rows:,}건으로 한 번에 내려받을 수 있는 {EXPORT_MAX_ROWS:,}건을 넘습니다. "
+                   "기간이나 상세 필터로 범위를 좁혀주세요.")
+        return
+    for col, fmt in zip(st.columns([1, 1, 6]), EXPORT_FORMATS):
+        with col:
+            st.download_button(f"⬇️ {fmt.upper()}", data=lambda fmt=fmt: _spool_export(make_batches, fmt, full_df),
+                               file_name=f"{name}.{fmt}", mime=EXPORT_FORMATS[fmt], key=f"export_{name}_{fmt}",
+                               on_click="ignore")
+
+# 일자별 시계열은 LTTB 로 최대 1,000점까지만 그려 전송량을 제한
+# (plotly 6 은 숫자 numpy 배열을 base64 typed array 로 직렬화하므로 y 값은 float 배열로 유지)
+MAX_SERIES_POINTS = 1000
 
 # ----------------------------------------------------------------
 # 2. 메인 화면 및 핵심 지표
@@ -107,47 +403,31 @@ f_df = df[df['그룹'].isin(selected_groups)]
 st.title("🍊 통합 과일 주문 데이터 분석 대시보드")
 st.markdown("---")
 
+kpis = cached_agg(headline_kpis, f_df)
 col_m1, col_m2, col_m3, col_m4 = st.columns(4)
 with col_m1:
-    st.metric("총 매출액", f"₩{f_df['실결제 금액'].sum():,.0f}")
+    st.metric("총 매출액", f"₩{kpis['revenue']:,.0f}")
 with col_m2:
-    st.metric("총 주문건수", f"{len(f_df):,}건")
+    st.metric("총 주문건수", f"{kpis['orders']:,}건")
 with col_m3:
-    st.metric("평균 객단가", f"₩{f_df['실결제 금액'].mean():,.0f}")
+    st.metric("평균 객단가", f"₩{kpis['aov']:,.0f}")
 with col_m4:
-    repeat_rate = f_df['재구매여부'].mean() * 100
-    st.metric("재구매 비중 (날짜기준)", f"{repeat_rate:.1f}%")
+    st.metric("재구매 비중 (날짜기준)", f"{kpis['repeat_rate']:.1f}%")
 
 # ----------------------------------------------------------------
 # 3. 탭 구성 (EDA 및 상세 분석)
 # ----------------------------------------------------------------
-tab_dash, tab1, tab2, tab_prod, tab_funnel, tab_time, tab_grade, tab3, tab4, tab_growth, tab5, tab6 = st.tabs([
-    "🚀 Dashboard", "📈 매출 & 채널", "📊 셀러 & 로열티", "📦 상품 페이지 분석", "🔁 재구매 퍼널", "⏰ 구매 시점 분석", "💎 등급별 분석", "🗺️ 지역별 분석", "🔍 경로 상세분석", "🎯 셀러 성장 전략", "🚀 마케팅 전략", "📋 전체데이터"
-])
+# 각 탭은 render_* 함수로 정의하고, 4번 섹션의 탭 선택기에서 고른 탭 하나만 실행합니다.
+# (st.tabs 는 숨겨진 탭까지 매 rerun 마다 모두 계산하므로 사용하지 않음)
+# 지표 계산은 analytics 패키지의 순수 함수가 담당하고, 여기서는 결과를 그리기만 합니다.
 
 # --- 탭 0: Dashboard (신규 메인) ---
-with tab_dash:
+def render_dashboard(f_df):
     st.title("Dashboard")
     st.markdown("<p style='color: #666; font-size: 1.1rem; margin-top: -15px;'>비즈니스 성과를 한눈에 파악하세요</p>", unsafe_allow_html=True)
     
-    # 데이터 준비: 주차별/일별 실적
-    f_df['주차'] = pd.to_datetime(f_df['주문날짜']).dt.isocalendar().week
-    f_df['주문일_DT'] = pd.to_datetime(f_df['주문일'])
-    
-    # WoW 계산용
-    weekly_stats = f_df.groupby('주차').agg({
-        '실결제 금액': 'sum',
-        '주문자연락처': 'nunique'
-    }).reset_index()
-    
-    if len(weekly_stats) >= 2:
-        curr_w = weekly_stats.iloc[-1]
-        prev_w = weekly_stats.iloc[-2]
-        
-        rev_wow = ((curr_w['실결제 금액'] - prev_w['실결제 금액']) / prev_w['실결제 금액'] * 100)
-        cust_wow = ((curr_w['주문자연락처'] - prev_w['주문자연락처']) / prev_w['주문자연락처'] * 100)
-    else:
-        rev_wow, cust_wow = 0, 0
+    # 데이터 준비: 주차별 실적 (WoW 계산용)
+    rev_wow, cust_wow = week_over_week(cached_agg(weekly_stats, f_df))
 
     # 상단 KPI 카드 (Premium Style)
     st.markdown("""
@@ -159,16 +439,15 @@ with tab_dash:
 
     c_kpi1, c_kpi2, c_kpi3, c_kpi4 = st.columns(4)
     with c_kpi1:
-        st.metric("TOTAL REVENUE", f"₩{f_df['실결제 금액'].sum():,.0f}", f"{rev_wow:+.1f}% vs last week")
+        st.metric("TOTAL REVENUE", f"₩{kpis['revenue']:,.0f}", f"{rev_wow:+.1f}% vs last week")
     with c_kpi2:
-        st.metric("ACTIVE CUSTOMERS", f"{f_df['주문자연락처'].nunique():,}명", f"{cust_wow:+.1f}% vs last week")
+        st.metric("ACTIVE CUSTOMERS", f"{kpis['customers']:,}명", f"{cust_wow:+.1f}% vs last week")
     with c_kpi3:
         # 평균 결제액
-        avg_rev = f_df['실결제 금액'].mean()
-        st.metric("AVG TRANSACTION", f"₩{avg_rev:,.0f}")
+        st.metric("AVG TRANSACTION", f"₩{kpis['aov']:,.0f}")
     with c_kpi4:
         # 총 주문건수
-        st.metric("TOTAL ORDERS", f"{len(f_df):,}건")
+        st.metric("TOTAL ORDERS", f"{kpis['orders']:,}건")
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -177,48 +456,49 @@ with tab_dash:
     
     with c_chart1:
         st.write("**Revenue vs Date**")
-        daily_rev = f_df.groupby('주문날짜')['실결제 금액'].sum().reset_index()
-        fig_rev_line = px.area(daily_rev, x='주문날짜', y='실결제 금액',
-                               color_discrete_sequence=['#00C897'])
-        fig_rev_line.update_traces(line_shape='spline', line=dict(width=4))
-        fig_rev_line.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=False),
-            yaxis=dict(showgrid=True, gridcolor='#f0f2f6'),
-            margin=dict(l=0, r=0, t=20, b=0),
-            height=350
-        )
-        st.plotly_chart(fig_rev_line, use_container_width=True)
+        def build_rev_line():
+            daily_rev = downsample_series(cached_agg(daily_revenue, f_cube), '주문날짜', '실결제 금액',
+                                          MAX_SERIES_POINTS)
+            fig_rev_line = px.area(daily_rev, x='주문날짜', y='실결제 금액',
+                                   color_discrete_sequence=['#00C897'])
+            fig_rev_line.update_traces(line_shape='spline', line=dict(width=4))
+            fig_rev_line.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                xaxis=dict(showgrid=False),
+                yaxis=dict(showgrid=True, gridcolor='#f0f2f6'),
+                margin=dict(l=0, r=0, t=20, b=0),
+                height=350
+            )
+            return fig_rev_line
+        st.plotly_chart(cached_figure('rev_line', build_rev_line), use_container_width=True)
 
     with c_chart2:
         st.write("**Customer Growth**")
-        # 누적 고객 수 계산
-        first_orders = f_df.sort_values('주문일').drop_duplicates('주문자연락처')
-        daily_new_cust = first_orders.groupby('주문날짜').size().reset_index(name='신규고객')
-        daily_new_cust['누적고객'] = daily_new_cust['신규고객'].cumsum()
-        
-        fig_cust_line = px.line(daily_new_cust, x='주문날짜', y='누적고객',
-                                color_discrete_sequence=['#636EFA'], markers=True)
-        fig_cust_line.update_traces(line_shape='spline', line=dict(width=4))
-        fig_cust_line.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=False),
-            yaxis=dict(showgrid=True, gridcolor='#f0f2f6'),
-            margin=dict(l=0, r=0, t=20, b=0),
-            height=350
-        )
-        st.plotly_chart(fig_cust_line, use_container_width=True)
+        # 누적 고객 수
+        def build_cust_line():
+            daily_new_cust = downsample_series(cached_agg(customer_growth, customers), '주문날짜', '누적고객',
+                                               MAX_SERIES_POINTS)
+            fig_cust_line = px.line(daily_new_cust, x='주문날짜', y='누적고객',
+                                    color_discrete_sequence=['#636EFA'], markers=True)
+            fig_cust_line.update_traces(line_shape='spline', line=dict(width=4))
+            fig_cust_line.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                xaxis=dict(showgrid=False),
+                yaxis=dict(showgrid=True, gridcolor='#f0f2f6'),
+                margin=dict(l=0, r=0, t=20, b=0),
+                height=350
+            )
+            return fig_cust_line
+        st.plotly_chart(cached_figure('cust_line', build_cust_line), use_container_width=True)
 
     st.markdown("---")
 
     # ⚠️ 취소 리스크 분석 (상시 노출)
     st.write("#### ⚠️ 최근 상품 옵션별 취소 현황 분석")
-    cancel_df = f_df[f_df['취소여부'] == 'Y']
-    if not cancel_df.empty:
-        option_cancel = cancel_df.groupby(['상품명', '과수 크기']).size().reset_index(name='취소건수')
-        option_cancel = option_cancel.sort_values('취소건수', ascending=False).head(10)
+    option_cancel = cached_agg(cancel_by_option, f_df)
+    if not option_cancel.empty:
         st.dataframe(option_cancel.style.background_gradient(subset=['취소건수'], cmap='Reds'),
                      use_container_width=True, hide_index=True)
     else:
@@ -226,7 +506,7 @@ with tab_dash:
 
 
 # --- 탭 1: 매출 & 채널 ---
-with tab1:
+def render_sales_channel(f_df):
     st.subheader("🎯 마케팅 운영 효율 상세 분석")
     st.markdown("""
     일별 매출과 셀러 활동성을 교차 분석하여 **운영 효율성**을 진단합니다. 
@@ -235,13 +515,7 @@ with tab1:
 
     # 1. 요일별 매출 및 셀러 활동성 (마케팅 타이밍 결정)
     st.write("#### 1️⃣ 요일별 마케팅 효율 (어느 요일에 예산을 쓸 것인가?)")
-    f_df['요일'] = f_df['주문일'].dt.day_name()
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    
-    weekday_stats = f_df.groupby(['요일', '그룹']).agg({
-        '실결제 금액': 'sum',
-        '셀러명': 'nunique'
-    }).reindex(day_order, level=0).reset_index()
+    weekday_stats = cached_agg(weekday_seller_productivity, f_cube)
     
     c1, c2 = st.columns(2)
     with c1:
@@ -249,16 +523,15 @@ with tab1:
                               title="요일별 총 매출 합계", text_auto='.2s')
         st.plotly_chart(fig_day_rev, use_container_width=True)
     with c2:
-        fig_day_sel = px.line(weekday_stats, x='요일', y='셀러명', color='그룹', markers=True,
-                               title="요일별 활동 셀러 수 (공급 밀도)")
+        fig_day_sel = cached_figure('day_sel', lambda: px.line(
+            weekday_stats, x='요일', y='셀러명', color='그룹', markers=True, title="요일별 활동 셀러 수 (공급 밀도)"))
         st.plotly_chart(fig_day_sel, use_container_width=True)
 
     # 2. 셀러당 평균 생산성 (활동 대비 수익성)
     st.write("#### 2️⃣ 셀러당 평균 매출 생산성 (셀러 수가 많아지는 것이 유리한가?)")
-    weekday_stats['인당매출'] = weekday_stats['실결제 금액'] / weekday_stats['셀러명']
-    fig_prod = px.area(weekday_stats, x='요일', y='인당매출', color='그룹', 
-                        title="요일별 셀러 1인당 평균 기여 매출",
-                        labels={'인당매출': '평균 매출(원/명)'})
+    fig_prod = cached_figure('prod', lambda: px.area(weekday_stats, x='요일', y='인당매출', color='그룹',
+                                                     title="요일별 셀러 1인당 평균 기여 매출",
+                                                     labels={'인당매출': '평균 매출(원/명)'}))
     st.plotly_chart(fig_prod, use_container_width=True)
 
     st.markdown("---")
@@ -269,38 +542,32 @@ with tab1:
     
     with col_p1:
         # 채널별 AOV
-        ch_aov = f_df.groupby('주문경로')['실결제 금액'].mean().sort_values(ascending=False).reset_index()
+        ch_aov = cached_agg(channel_aov, f_cube)
         fig_aov = px.bar(ch_aov, x='실결제 금액', y='주문경로', orientation='h', color='실결제 금액',
                           title="채널별 건당 평균 결제액(AOV)", text_auto='.0f')
         st.plotly_chart(fig_aov, use_container_width=True)
         
     with col_p2:
         # 셀러 매출 파레토 (상위 20%가 80%를 만드는가?)
-        sel_contri = f_df.groupby('셀러명')['실결제 금액'].sum().sort_values(ascending=False).reset_index()
-        sel_contri['누적매출비중'] = (sel_contri['실결제 금액'].cumsum() / sel_contri['실결제 금액'].sum()) * 100
-        sel_contri['셀러순위비중'] = (sel_contri.index + 1) / len(sel_contri) * 100
-        
-        fig_pareto = px.line(sel_contri, x='셀러순위비중', y='누적매출비중',
-                              title="셀러 매출 기여도(파레토 곡선)",
-                              labels={'셀러순위비중': '셀러 상위 %', '누적매출비중': '누적 매출 비중(%)'})
-        fig_pareto.add_hline(y=80, line_dash="dot", annotation_text="80% 매출 지점")
-        st.plotly_chart(fig_pareto, use_container_width=True)
+        def build_pareto():
+            sel_contri = cached_agg(seller_pareto, f_cube)
+            fig_pareto = px.line(sel_contri, x='셀러순위비중', y='누적매출비중',
+                                  title="셀러 매출 기여도(파레토 곡선)",
+                                  labels={'셀러순위비중': '셀러 상위 %', '누적매출비중': '누적 매출 비중(%)'})
+            fig_pareto.add_hline(y=80, line_dash="dot", annotation_text="80% 매출 지점")
+            return fig_pareto
+        st.plotly_chart(cached_figure('pareto', build_pareto), use_container_width=True)
 
     # 4. 신규 vs 재구매 매출 추이 (성장 동력 진단)
     st.write("#### 4️⃣ 신규 vs 재구매 매출 비중 추이 (성장의 질 분석)")
-    f_df['고객유형'] = f_df['재구매 횟수'].apply(lambda x: '재구매 고객' if x > 0 else '신규 고객')
-    type_trend = f_df.groupby(['주문날짜', '고객유형'])['실결제 금액'].sum().reset_index()
-    fig_type = px.area(type_trend, x='주문날짜', y='실결제 금액', color='고객유형',
-                        title="일자별 신규 vs 재구매 매출 구성 추이")
+    fig_type = cached_figure('type_trend', lambda: px.area(
+        cached_agg(revenue_by_customer_type, f_df), x='주문날짜', y='실결제 금액', color='고객유형',
+        title="일자별 신규 vs 재구매 매출 구성 추이"))
     st.plotly_chart(fig_type, use_container_width=True)
 
     # 5. 채널 성과 요약 표
     st.subheader("📝 채널별 성과 지표 요약 (Raw Data)")
-    ch_sum = f_df.groupby('주문경로').agg({
-        '실결제 금액': 'sum',
-        '주문번호': 'count',
-        '재구매여부': lambda x: x.mean() * 100
-    }).rename(columns={'실결제 금액': '매출', '주문번호': '건수', '재구매여부': '재구매비중(%)'}).reset_index()
+    ch_sum = cached_agg(channel_summary, f_cube)
     st.dataframe(ch_sum.sort_values(by='매출', ascending=False), hide_index=True, use_container_width=True)
 
     # 마케팅 전략 제언 섹션 추가
@@ -324,17 +591,17 @@ with tab1:
 
 
 # --- 탭 2: 셀러 & 로열티 ---
-with tab2:
+def render_seller_loyalty(f_df):
     st.subheader("인기 품종 및 로열티 셀러 분석 (그래프 4, 5)")
     c3, c4 = st.columns(2)
     with c3:
         # [그래프 4] 품종별 판매량
-        prod_count = f_df['품종'].value_counts().head(10).reset_index()
+        prod_count = cached_agg(variety_counts, f_cube).head(10).reset_index()
         fig4 = px.bar(prod_count, x='품종', y='count', color='품종', title="판매량 상위 품종")
         st.plotly_chart(fig4, use_container_width=True)
     with c4:
         # [그래프 5] 셀러별 매출 상위
-        sel_rev = f_df.groupby('셀러명')['실결제 금액'].sum().nlargest(15).reset_index()
+        sel_rev = cached_agg(seller_revenue, f_cube).nlargest(15).reset_index()
         fig5 = px.bar(sel_rev, x='실결제 금액', y='셀러명', orientation='h', color='실결제 금액', title="매출 상위 셀러")
         st.plotly_chart(fig5, use_container_width=True)
 
@@ -343,14 +610,14 @@ with tab2:
     st.subheader("🍊 감귤 구매 목적별 선호 옵션 비교 (선물 vs 자기소비)")
     st.markdown("고객의 구매 목적에 따라 선호하는 과일의 크기, 무게, 가격대가 극명하게 갈립니다. 이를 통해 타겟별 맞춤 전략을 제안합니다.")
     
-    citrus_df = f_df[f_df['품종'] == '감귤'].copy()
+    citrus_df = citrus_orders(f_df)
     
     if not citrus_df.empty:
         purpose_opt = st.radio("분석 기준 선택", ["과수 크기 선호도", "무게 및 가격대 분포"], horizontal=True)
         
         if purpose_opt == "과수 크기 선호도":
             # 목적별 크기 선호도 비교 (Grouped Bar)
-            size_purpose = citrus_df.groupby(['구매목적', '과수 크기']).size().reset_index(name='주문건수')
+            size_purpose = purpose_option_counts(citrus_df, '과수 크기')
             fig_size_p = px.bar(size_purpose, x='과수 크기', y='주문건수', color='구매목적', barmode='group',
                                 title="구매 목적에 따른 감귤 크기(Size) 선호도",
                                 color_discrete_map={'선물용': '#EF553B', '자기소비용': '#636EFA'})
@@ -363,7 +630,7 @@ with tab2:
             
             with c_dist1:
                 # 1. 무게별 분포
-                weight_p = citrus_df.groupby(['구매목적', '무게 구분']).size().reset_index(name='주문건수')
+                weight_p = purpose_option_counts(citrus_df, '무게 구분')
                 fig_weight_p = px.bar(weight_p, x='무게 구분', y='주문건수', color='구매목적', barmode='group',
                                       title="구매 목적별 선호 무게(kg) 비교",
                                       color_discrete_map={'선물용': '#EF553B', '자기소비용': '#636EFA'},
@@ -372,8 +639,7 @@ with tab2:
                 
             with c_dist2:
                 # 2. 가격대별 분포
-                price_p = citrus_df.groupby(['구매목적', '가격대']).size().reset_index(name='주문건수')
-                # 가격대 정렬 (가능한 경우)
+                price_p = purpose_option_counts(citrus_df, '가격대')
                 fig_price_p = px.bar(price_p, x='가격대', y='주문건수', color='구매목적', barmode='group',
                                      title="구매 목적별 선호 가격대 비교",
                                      color_discrete_map={'선물용': '#EF553B', '자기소비용': '#636EFA'},
@@ -382,13 +648,7 @@ with tab2:
 
         # 목적별 요약 인사이트 표
         st.write("**� 구매 목적별 베스트 옵션 요약**")
-        summary_p = citrus_df.groupby('구매목적').agg({
-            '실결제 금액': 'mean',
-            '무게 구분': lambda x: x.mode()[0] if not x.mode().empty else 'N/A',
-            '과수 크기': lambda x: x.mode()[0] if not x.mode().empty else 'N/A'
-        }).rename(columns={'실결제 금액': '평균 객단가', '무게 구분': '가장 많이 팔린 무게', '과수 크기': '대표 선호 크기'}).reset_index()
-        
-        st.table(summary_p)
+        st.table(purpose_best_options(citrus_df))
         
         st.info("""
         **💡 목적별 마케팅 포인트**
@@ -409,37 +669,48 @@ with tab2:
     with c6:
         # [표 3] 재구매율 높은 셀러 (30건 이상)
         st.write("**재구매 로열티가 높은 셀러**")
-        counts = f_df.groupby('셀러명').size()
-        repeats = f_df[f_df['재구매여부'] == True].groupby('셀러명').size()
-        r_ratio = (repeats / counts * 100).fillna(0).loc[counts[counts>=30].index].nlargest(10).reset_index()
-        r_ratio.columns = ['셀러명', '재구매율(%)']
-        st.dataframe(r_ratio, use_container_width=True)
+        st.dataframe(cached_agg(loyal_sellers, f_df), use_container_width=True)
+
+    st.markdown("---")
+
+    # RFM 세그먼트: 점수는 전체 고객 기준(데이터셋마다 한 번 계산), 구성은 선택된 주문의 고객만 집계
+    st.subheader("🧭 RFM 고객 세그먼트")
+    st.markdown("최근성(R) · 구매 빈도(F) · 구매 금액(M)을 전체 고객 중 백분위로 1~5점 매기고, R x F 점수로 고객을 세그먼트로 나눕니다.")
+    seg_summary = cached_agg(segment_summary, segments, customers, variant=(), key=rfm_key)
+    c_s1, c_s2 = st.columns([1, 1])
+    with c_s1:
+        st.dataframe(seg_summary.style.format({'비중(%)': '{:.1f}%', '평균최근성': '{:.1f}일', '평균빈도': '{:.1f}회',
+                                               '평균금액': '₩{:,.0f}'}),
+                     use_container_width=True, hide_index=True)
+        export_buttons("rfm_segments", lambda: frame_batches(seg_summary), len(seg_summary))
+    with c_s2:
+        group_mix = cached_agg(segment_mix, f_df, segments, '그룹', variant=('그룹',), key=rfm_key)
+        fig_group_mix = px.bar(group_mix, x='그룹', y='비중(%)', color=SEGMENT_COL, text_auto='.1f',
+                               category_orders={SEGMENT_COL: SEGMENTS}, title="그룹별 고객 세그먼트 구성 (%)")
+        st.plotly_chart(fig_group_mix, use_container_width=True)
+
+    # 고객 수 상위 셀러의 세그먼트 구성
+    seller_mix = cached_agg(segment_mix, f_df, segments, '셀러명', variant=('셀러명',), key=rfm_key)
+    top_sellers = seller_mix.drop_duplicates('셀러명').nlargest(15, '전체고객수')['셀러명']
+    fig_seller_mix = px.bar(seller_mix[seller_mix['셀러명'].isin(top_sellers)], x='비중(%)', y='셀러명',
+                            color=SEGMENT_COL, orientation='h', category_orders={SEGMENT_COL: SEGMENTS,
+                                                                                 '셀러명': list(top_sellers)},
+                            title="고객 수 상위 15개 셀러의 고객 세그먼트 구성 (%)")
+    st.plotly_chart(fig_seller_mix, use_container_width=True)
+    st.caption("※ 사이드바 '상세 필터'의 RFM 세그먼트를 고르면 모든 탭이 해당 세그먼트 고객의 주문만으로 집계됩니다.")
 
 
 # --- 탭: 상품 페이지 분석 (신규) ---
-with tab_prod:
+def render_product_pages(f_df):
     st.subheader("📦 상품 페이지별 매출 기여도 및 옵션 분석")
     st.markdown("""
     매출 상위 5개 상품 페이지를 추출하고, 해당 페이지가 **킹댕즈**와 관련된 페이지인지 아니면 **일반 셀러**들이 경쟁하는 페이지인지를 구분하여 분석합니다.
     """)
 
-    # 상품페이지(상품명)별 통계 계산
-    # 셀러명에 NaN이 있을 경우 sorted()에서 에러가 발생하므로 dropna()와 문자열 변환 처리
-    page_stats = f_df.groupby('상품명').agg({
-        '실결제 금액': 'sum',
-        '주문번호': 'count',
-        '셀러명': lambda x: sorted(list(set(x.dropna().astype(str))))
-    }).reset_index()
-    
-    # 페이지 유형 분류 (킹댕즈 참여 여부)
-    def classify_page(sellers):
-        if '킹댕즈' in sellers:
-            return '킹댕즈 참여 페이지'
-        else:
-            return '일반셀러 경쟁 페이지'
-    
-    page_stats['페이지 유형'] = page_stats['셀러명'].apply(classify_page)
-    top5_pages = page_stats.nlargest(5, '실결제 금액')
+    # 상품페이지 x 셀러 희소 인덱스 (선택마다 한 번) - 페이지 집계와 상세 조회는 모두 이 인덱스에서
+    pages = cached_agg(page_index, f_df)
+    page_stats = cached_agg(product_page_stats, pages).sort_values('실결제 금액', ascending=False)
+    top5_pages = cached_agg(top_product_pages, pages)
 
     # 시각화: Top 5 페이지 매출
     fig_top_page = px.bar(top5_pages, x='실결제 금액', y='상품명', color='페이지 유형',
@@ -449,28 +720,34 @@ with tab_prod:
     fig_top_page.update_layout(yaxis={'categoryorder':'total ascending'}) # 매출 높은 순 정렬
     st.plotly_chart(fig_top_page, use_container_width=True)
 
-    st.write("### 🔍 Top 5 페이지 상세 옵션 & 셀러 분석")
-    st.info("각 페이지를 클릭하면 해당 페이지에서 가장 많이 팔린 품종, 크기, 무게 옵션과 판매 셀러 현황을 볼 수 있습니다.")
-    
-    for i, (idx, row) in enumerate(top5_pages.iterrows()):
-        p_name = row['상품명']
-        with st.expander(f"🏆 Top {i+1}: [{row['페이지 유형']}] {p_name[:60]}...", expanded=(i==0)):
-            p_df = f_df[f_df['상품명'] == p_name]
-            
-            c1, c2, c3 = st.columns(3)
-            with c1:
-                st.write("**🍎 품종 및 크기 조합**")
-                opt_size = p_df.groupby(['품종', '과수 크기']).size().reset_index(name='주문건수')
-                st.dataframe(opt_size.sort_values('주문건수', ascending=False), hide_index=True, use_container_width=True)
-            with c2:
-                st.write("**⚖️ 무게 및 가격대 분포**")
-                opt_weight = p_df.groupby(['무게 구분', '가격대']).size().reset_index(name='주문건수')
-                st.dataframe(opt_weight.sort_values('주문건수', ascending=False), hide_index=True, use_container_width=True)
-            with c3:
-                st.write("**👤 판매 셀러 현황**")
-                opt_seller = p_df.groupby('셀러명').agg({'실결제 금액':'sum', '주문번호':'count'}).reset_index()
-                opt_seller.columns = ['셀러명', '매출액', '주문건수']
-                st.dataframe(opt_seller.sort_values('매출액', ascending=False), hide_index=True, use_container_width=True)
+    # 전체 페이지 목록 (매출 순)
+    with st.expander(f"📄 전체 상품 페이지 {len(page_stats):,}개 (매출 순)"):
+        st.dataframe(page_stats.rename(columns={'실결제 금액': '매출액', '주문번호': '주문건수'}),
+                     hide_index=True, use_container_width=True)
+
+    st.write("### 🔍 페이지 상세 옵션 & 셀러 분석")
+    st.info("분석할 상품 페이지를 고르면 해당 페이지에서 가장 많이 팔린 품종, 크기, 무게 옵션과 판매 셀러 현황을 볼 수 있습니다. (기본값: 매출 1위 페이지)")
+
+    if page_stats.empty:
+        st.info("선택한 조건에 해당하는 상품 페이지가 없습니다.")
+    else:
+        page_types = dict(zip(page_stats['상품명'], page_stats['페이지 유형']))
+        ranks = {name: i + 1 for i, name in enumerate(page_stats['상품명'])}
+        p_name = st.selectbox("상세 분석할 상품 페이지", options=list(page_stats['상품명']),
+                              format_func=lambda name: f"{ranks[name]}위 [{page_types[name]}] {name[:60]}",
+                              key="product_page")
+        opt_size, opt_weight, opt_seller = page_option_breakdown(pages, f_df, p_name)
+
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.write("**🍎 품종 및 크기 조합**")
+            st.dataframe(opt_size, hide_index=True, use_container_width=True)
+        with c2:
+            st.write("**⚖️ 무게 및 가격대 분포**")
+            st.dataframe(opt_weight, hide_index=True, use_container_width=True)
+        with c3:
+            st.write(f"**👤 판매 셀러 현황 ({len(opt_seller)}명)**")
+            st.dataframe(opt_seller, hide_index=True, use_container_width=True)
 
     st.markdown("---")
     st.success("""
@@ -484,8 +761,11 @@ with tab_prod:
     st.markdown("---")
 
 
+# 코호트 리텐션 분할 기준 (고객 첫 주문의 값)
+COHORT_SPLIT_LABELS = {'그룹': "유입 그룹", '셀러명': "유입 셀러", '주문경로': "유입 경로"}
+
 # --- 탭: 재구매 퍼널 & 패턴 (신규) ---
-with tab_funnel:
+def render_repurchase_funnel(f_df):
     st.subheader("🔁 고객 재구매 퍼널 및 행동 패턴 분석")
     st.markdown("""
     고객이 첫 구매 이후 얼마나 다시 돌아오는지, 그리고 재방문 시 어떤 행동 변화를 보이는지 분석하여 **리텐션(Retention) 전략**을 제안합니다.
@@ -494,20 +774,9 @@ with tab_funnel:
     # 1. 구매 회차별 퍼널 (Retention Funnel Report)
     st.write("#### 1️⃣ 구매 회차별 고객 전환 리포트 (Retention Funnel)")
     
-    # 각 회차별 유니크 고객 수 집계
-    funnel_data = f_df.groupby('재구매_날짜순서')['주문자연락처'].nunique().reset_index()
-    funnel_data.columns = ['단계', '고객수']
-    
-    # 지표 계산: 잔존율(첫구매 대비), 전환율(전단계 대비)
-    first_purchase_count = funnel_data.iloc[0]['고객수']
-    funnel_data['잔존율(%)'] = (funnel_data['고객수'] / first_purchase_count * 100).round(1)
-    
-    # 전단계 대비 전환율 (pct_change와 유사하게 계산)
-    funnel_data['전단계 대비 전환율(%)'] = (funnel_data['고객수'] / funnel_data['고객수'].shift(1) * 100).fillna(100).round(1)
-    
-    # 라벨링
-    funnel_data['구매회차'] = funnel_data['단계'].apply(lambda x: f"{int(x)+1}회차 구매자")
-    
+    # 회차별 유니크 고객 수 / 잔존율(첫구매 대비) / 전환율(전단계 대비)
+    funnel_data = cached_agg(retention_funnel, customers)
+
     # 컬럼 순서 및 이름 정리
     funnel_report = funnel_data[['구매회차', '고객수', '잔존율(%)', '전단계 대비 전환율(%)']]
     
@@ -515,23 +784,26 @@ with tab_funnel:
     st.dataframe(funnel_report.style.background_gradient(subset=['잔존율(%)'], cmap='YlGnBu')
                  .format({'고객수': '{:,}명', '잔존율(%)': '{:.1f}%', '전단계 대비 전환율(%)': '{:.1f}%'}),
                  use_container_width=True, hide_index=True)
+    export_buttons("funnel_report", lambda: frame_batches(funnel_report), len(funnel_report))
     
     st.caption("※ 잔존율(%)은 1회차 구매자(신규 유입) 대비 해당 회차까지 살아남은 고객의 비중입니다.")
 
     # 시각화 차트 추가 (깔때기 및 잔존율 곡선)
     col_v1, col_v2 = st.columns(2)
     with col_v1:
-        fig_f_chart = px.funnel(funnel_data, x='고객수', y='구매회차', 
-                                title="고객 잔존 깔때기 (Funnel Shape)",
-                                color_discrete_sequence=['#636EFA'])
+        fig_f_chart = cached_figure('funnel', lambda: px.funnel(funnel_data, x='고객수', y='구매회차',
+                                                                title="고객 잔존 깔때기 (Funnel Shape)",
+                                                                color_discrete_sequence=['#636EFA']))
         st.plotly_chart(fig_f_chart, use_container_width=True)
     
     with col_v2:
-        fig_r_chart = px.line(funnel_data, x='구매회차', y='잔존율(%)', markers=True,
-                              title="회차별 잔존율 추세 (Retention Curve)",
-                              text='잔존율(%)')
-        fig_r_chart.update_traces(textposition="top center")
-        st.plotly_chart(fig_r_chart, use_container_width=True)
+        def build_retention_curve():
+            fig_r_chart = px.line(funnel_data, x='구매회차', y='잔존율(%)', markers=True,
+                                  title="회차별 잔존율 추세 (Retention Curve)",
+                                  text='잔존율(%)')
+            fig_r_chart.update_traces(textposition="top center")
+            return fig_r_chart
+        st.plotly_chart(cached_figure('retention_curve', build_retention_curve), use_container_width=True)
 
     st.markdown("---")
 
@@ -540,14 +812,9 @@ with tab_funnel:
     with c_f1:
         # 2. 재구매 주기 분석 (Repurchase Interval)
         st.write("#### 2️⃣ 평균 재구매 주기 및 분포")
-        # 고객별 주문 간격 계산
-        f_df_sorted = f_df.sort_values(['주문자연락처', '주문일'])
-        f_df_sorted['이전주문일'] = f_df_sorted.groupby('주문자연락처')['주문날짜'].shift(1)
-        # pd.to_datetime 이 이미 되어있으므로 날짜 차이 계산
-        f_df_sorted['구매간격'] = (pd.to_datetime(f_df_sorted['주문날짜']) - pd.to_datetime(f_df_sorted['이전주문일'])).dt.days
-        
+        # 고객별 주문 간격은 로드 시점에 계산된 구매간격(직전 주문과의 일수)을 사용
         # 이전 구매가 있는 (재구매인) 건들만 대상으로 주기 계산
-        intervals = f_df_sorted[f_df_sorted['구매간격'] > 0]['구매간격']
+        intervals = repurchase_intervals(f_df)
         
         if not intervals.empty:
             avg_interval = intervals.mean()
@@ -563,8 +830,7 @@ with tab_funnel:
     with c_f2:
         # 3. 회차별 평균 결제 금액 (AOV Progression)
         st.write("#### 3️⃣ 구매 회차별 평균 객단가(AOV) 변화")
-        order_aov = f_df.groupby('재구매_날짜순서')['실결제 금액'].mean().reset_index()
-        order_aov['구매회차'] = order_aov['재구매_날짜순서'] + 1
+        order_aov = cached_agg(aov_by_purchase_round, f_df)
         
         fig_aov_trend = px.line(order_aov, x='구매회차', y='실결제 금액', markers=True,
                                 title="구매 회차가 거듭될수록 결제액이 변하는가?",
@@ -576,19 +842,59 @@ with tab_funnel:
     # 4. 품종 확장 패턴 (Cross-sell)
     st.write("#### 4️⃣ 재구매 시 품종 탐색 및 확장 패턴")
     
-    first_counts = f_df[f_df['재구매_날짜순서'] == 0]['품종'].value_counts(normalize=True).head(5).reset_index()
-    repeat_counts = f_df[f_df['재구매_날짜순서'] > 0]['품종'].value_counts(normalize=True).head(5).reset_index()
-    first_counts.columns = ['품종', '비중']
-    repeat_counts.columns = ['품종', '비중']
-    first_counts['유형'] = '첫 구매'
-    repeat_counts['유형'] = '재구매'
-    
-    cross_df = pd.concat([first_counts, repeat_counts])
+    cross_df = cached_agg(variety_mix_first_vs_repeat, f_df)
     fig_cross = px.bar(cross_df, x='비중', y='품종', color='유형', barmode='group',
                        title="첫 구매 vs 재구매 시 주요 품종 선호도 비교",
                        orientation='h')
     st.plotly_chart(fig_cross, use_container_width=True)
 
+    st.markdown("---")
+
+    # 5. 코호트 리텐션 (최초주문일 주/월 x 경과 기간)
+    st.write("#### 5️⃣ 코호트 리텐션 매트릭스 (최초 주문 시점별 잔존율)")
+    col_k1, col_k2, col_k3 = st.columns(3)
+    with col_k1:
+        freq = st.radio("코호트 단위", options=list(COHORT_FREQS), format_func=COHORT_FREQS.get,
+                        horizontal=True, key="cohort_freq")
+    with col_k2:
+        split = st.selectbox("분할 기준", options=[None] + COHORT_SPLITS,
+                             format_func=lambda col: "전체" if col is None else COHORT_SPLIT_LABELS[col],
+                             key="cohort_split")
+    # 코호트 매트릭스는 선택 + 단위 + 분할 기준마다 한 번만 계산 (분할값 선택은 캐시된 매트릭스에서 잘라냄)
+    matrix = cached_agg(cohort_matrix, f_df, freq, split)
+    picked = None
+    if split is not None and not matrix.empty:
+        # 분할값은 코호트 고객수가 많은 순서로
+        split_sizes = matrix[COHORT_SIZE_COL].groupby(level=split, observed=True).sum().sort_values(ascending=False)
+        with col_k3:
+            picked = st.selectbox(COHORT_SPLIT_LABELS[split], options=list(split_sizes.index), key="cohort_value")
+        matrix = matrix.xs(picked, level=split)
+
+    if matrix.empty:
+        st.info("코호트를 만들 고객 데이터가 없습니다.")
+    else:
+        rates = cohort_rates(matrix).astype(float)
+        rates.index = rates.index.strftime('%Y-%m-%d' if freq == 'W' else '%Y-%m')
+        period_label = f"경과 {COHORT_FREQS[freq]}"
+
+        def build_cohort_heatmap():
+            fig_cohort = px.imshow(rates, text_auto='.1f', aspect='auto', color_continuous_scale='YlGnBu',
+                                   labels={'x': period_label, 'y': "코호트", 'color': "잔존율(%)"},
+                                   title="코호트별 경과 기간 잔존율 (%)")
+            fig_cohort.update_xaxes(side='top', dtick=1)
+            return fig_cohort
+        st.plotly_chart(cached_figure('cohort_heatmap', build_cohort_heatmap, freq, split, picked),
+                        use_container_width=True)
+
+        # 표 / 내보내기용 컬럼 이름은 문자열로 (경과 0주, 1주, ...)
+        cohort_table = pd.concat([matrix[COHORT_SIZE_COL].set_axis(rates.index),
+                                  rates.rename(columns=lambda k: f"{k}{COHORT_FREQS[freq]}")], axis=1)
+        cohort_table.index.name = "코호트"
+        st.dataframe(cohort_table, use_container_width=True)
+        export_buttons("cohort_retention", lambda: frame_batches(cohort_table.reset_index()), len(cohort_table))
+        st.caption(f"※ 코호트 = 최초주문일이 속한 {COHORT_FREQS[freq]}, 경과 0 = 첫 구매 {COHORT_FREQS[freq]}. "
+                   "분할 기준은 고객 첫 주문의 그룹 / 셀러 / 유입 경로이며, 아직 오지 않은 기간은 비워 둡니다.")
+
     st.success("""
     **💡 재구매 극대화를 위한 마케팅 액션 아이템**
     1. **이탈 방지 구간 타겟팅**: 퍼널 차트에서 급격히 숫자가 줄어드는 구간(예: 2회->3회) 직후에 **'강력한 리워드'**를 배치하세요.
@@ -598,19 +904,14 @@ with tab_funnel:
 
 
 # --- 탭 3: 지역별 분석 ---
-with tab3:
+def render_region(f_df):
     st.subheader("🗺️ 지역별 입체 분석 및 전략적 클러스터링")
     st.markdown("전국 지역별 매출 분포와 주문 경로, 셀러 간의 상관관계를 한눈에 파악할 수 있도록 시각화하였습니다.")
 
     # 1. 시각적 클러스터링: 매출 vs 재구매율 (지역 성격 분류)
     st.subheader("1. 지역별 성격 분류 (매출 규모 vs 재구매 로열티)")
     
-    reg_stats = f_df.groupby('광역지역(정식)').agg({
-        '실결제 금액': 'sum',
-        '재구매여부': lambda x: x.mean() * 100,
-        '주문번호': 'count'
-    }).reset_index()
-    reg_stats.columns = ['지역', '총매출', '재구매율', '주문건수']
+    reg_stats = cached_agg(region_stats, f_cube)
     
     fig_reg_cluster = px.scatter(reg_stats, x='총매출', y='재구매율', size='주문건수', color='지역',
                                  text='지역', title="지역별 매출-로열티 클러스터 현황",
@@ -632,20 +933,12 @@ with tab3:
     # 2. 계층형 분석: 지역 > 경로 > 셀러 (Sunburst)
     st.subheader("2. 상위 지역별 유입 경로 및 셀러 계층 구조 (Top 5 지역)")
     top5_regions = reg_stats.nlargest(5, '총매출')['지역'].tolist()
-    hierarchy_df = f_df[f_df['광역지역(정식)'].isin(top5_regions)].copy()
-    
-    # 데이터 안정성 확보: 결측치 처리 및 사전 집계
-    path_cols = ['광역지역(정식)', '주문경로', '셀러명']
-    for col in path_cols:
-        hierarchy_df[col] = hierarchy_df[col].fillna(f"{col} 정보없음")
-    
-    # Plotly Sunburst 오류 방지를 위해 명시적 집계 수행
-    sunburst_df = hierarchy_df.groupby(path_cols)['실결제 금액'].sum().reset_index()
-    sunburst_df = sunburst_df[sunburst_df['실결제 금액'] > 0] # 0이하 값 제거
-    
-    fig_sunburst = px.sunburst(sunburst_df, path=path_cols, 
-                                values='실결제 금액', title="지역-경로-셀러 매출 비중 계층도",
-                                color='광역지역(정식)', color_discrete_sequence=px.colors.qualitative.Pastel)
+    path_rev = cached_agg(region_path_revenue, f_cube)
+    # 결측은 '정보없음'으로 채우고 0 이하 값은 제외 (Plotly Sunburst 오류 방지)
+    fig_sunburst = cached_figure('sunburst', lambda: px.sunburst(
+        region_hierarchy(path_rev, top5_regions), path=['광역지역(정식)', '주문경로', '셀러명'],
+        values='실결제 금액', title="지역-경로-셀러 매출 비중 계층도",
+        color='광역지역(정식)', color_discrete_sequence=px.colors.qualitative.Pastel))
     st.plotly_chart(fig_sunburst, use_container_width=True)
 
     st.markdown("---")
@@ -654,29 +947,28 @@ with tab3:
     st.subheader("3. 🏆 전국 지역별 베스트 [경로 x 셀러] 통합 리포트")
     
     # 지역별로 가장 매출이 높은 경로x셀러 조합 추출
-    best_combi_all = f_df.groupby(['광역지역(정식)', '주문경로', '셀러명'])['실결제 금액'].sum().reset_index()
-    idx = best_combi_all.groupby('광역지역(정식)')['실결제 금액'].idxmax()
-    best_combi_summary = best_combi_all.loc[idx].sort_values(by='실결제 금액', ascending=False)
-    best_combi_summary.columns = ['지역', '베스트 경로', '베스트 셀러', '매출합계']
-    
+    best_combi_summary = best_region_combos(path_rev)
+
     st.dataframe(best_combi_summary.style.background_gradient(subset=['매출합계'], cmap='Blues'),
                  use_container_width=True, hide_index=True)
+    export_buttons("best_combi_summary", lambda: frame_batches(best_combi_summary), len(best_combi_summary))
 
     # 4. 상세 조회 (기존 기능 강화)
     with st.expander("🔍 특정 지역 상세 데이터 조회"):
         sel_reg = st.selectbox("상세 분석할 지역 선택", options=reg_stats['지역'].tolist())
         c_reg1, c_reg2 = st.columns(2)
         
-        reg_df_detail = f_df[f_df['광역지역(정식)'] == sel_reg]
+        reg_cube = f_cube.where(**{'광역지역(정식)': [sel_reg]})
         
         with c_reg1:
             st.write(f"**[{sel_reg}] 경로별 기여도**")
-            path_pie = px.pie(reg_df_detail, values='실결제 금액', names='주문경로', hole=0.3)
+            path_pie = px.pie(reg_cube.rollup(['주문경로'], ['실결제 금액']).reset_index(),
+                              values='실결제 금액', names='주문경로', hole=0.3)
             st.plotly_chart(path_pie, use_container_width=True)
         
         with c_reg2:
             st.write(f"**[{sel_reg}] 상위 셀러 Top 5**")
-            top_sel_bar = px.bar(reg_df_detail.groupby('셀러명')['실결제 금액'].sum().nlargest(5).reset_index(),
+            top_sel_bar = px.bar(reg_cube.rollup(['셀러명'], ['실결제 금액'])['실결제 금액'].nlargest(5).reset_index(),
                                  x='실결제 금액', y='셀러명', orientation='h', color='실결제 금액')
             st.plotly_chart(top_sel_bar, use_container_width=True)
 
@@ -684,7 +976,7 @@ with tab3:
 
 
 # --- 탭: 구매 시점 분석 (신규) ---
-with tab_time:
+def render_purchase_time(f_df):
     st.subheader("⏰ 소비자 구매 요일/시간 패턴 분석 (Clustering)")
     st.markdown("""
     소비자들의 구매 패턴을 요일과 시간대를 기준으로 **4개의 클러스터**로 분류했습니다. 
@@ -694,53 +986,25 @@ with tab_time:
     # 1. 클러스터별 요약 테이블 (사용자 요청 포맷)
     st.write("#### 📋 구매 패턴 클러스터링 요약")
     
-    # 요일 이름 매핑용
-    day_map = {0:'월요일', 1:'화요일', 2:'수요일', 3:'목요일', 4:'금요일', 5:'토요일', 6:'일요일'}
-    
-    cluster_stats = f_df.groupby('time_cluster').agg({
-        '주문번호': 'count',
-        '실결제 금액': 'mean',
-        '주문일': lambda x: x.dt.dayofweek.mode()[0],
-        'time_cluster': 'first' # 해석을 위해
-    }).reset_index(drop=True)
-    
-    # 대표 시간(최빈값) 추가
-    cluster_stats['대표시간'] = f_df.groupby('time_cluster')['주문일'].apply(lambda x: f"{x.dt.hour.mode()[0]}시")
-    
-    # 해석 및 정리
-    meaning_map = {
-        1: '평일 오후 피크',
-        2: '주말 저녁 피크',
-        0: '새벽 저강도 (주말)',
-        3: '새벽 저강도 (평일)'
-    }
-    cluster_stats['해석'] = cluster_stats['time_cluster'].map(meaning_map)
-    cluster_stats['대표요일'] = cluster_stats['주문일'].map(day_map)
-    cluster_stats.columns = ['cluster', '총 주문수', '평균주문금액', '요일번호', '대표시간', '해석', '대표요일']
-    
-    # 최종 출력용 정렬 및 선택
-    disp_table = cluster_stats[['cluster', '총 주문수', '평균주문금액', '대표요일', '대표시간', '해석']]
-    st.dataframe(disp_table.sort_values('총 주문수', ascending=False), hide_index=True, use_container_width=True)
+    # 클러스터별 주문수 / 평균금액 / 대표 요일 / 대표 시간(최빈값) / 해석
+    disp_table = cached_agg(time_cluster_summary, f_df)
+    st.dataframe(disp_table, hide_index=True, use_container_width=True)
 
     st.markdown("---")
 
     # 2. 요일 x 시간 히트맵
     st.write("#### 📅 요일 × 시간대별 주문 집중도 히트맵")
     
-    # 히트맵 데이터 생성
-    f_df['hour'] = f_df['주문일'].dt.hour
-    f_df['day_name'] = f_df['주문일'].dt.day_name()
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    
-    pivot_df = f_df.groupby(['day_name', 'hour']).size().unstack(fill_value=0)
-    pivot_df = pivot_df.reindex(day_order) # 요일 순서 정렬
-    
-    fig_heatmap = px.imshow(pivot_df, 
-                            labels=dict(x="시간(Hour)", y="요일(Day)", color="주문건수"),
-                            x=list(range(24)),
-                            y=day_order,
-                            color_continuous_scale='Viridis',
-                            title="요일별 시간대 주문 발생 현황 (Heatmap)")
+    # 히트맵 데이터 (요일 / 주문시간 은 로드 시 계산된 컬럼, 요일 순서로 정렬)
+    def build_heatmap():
+        pivot_df = cached_agg(weekday_hour_matrix, f_df)
+        return px.imshow(pivot_df,
+                         labels=dict(x="시간(Hour)", y="요일(Day)", color="주문건수"),
+                         x=list(range(24)),
+                         y=list(pivot_df.index),
+                         color_continuous_scale='Viridis',
+                         title="요일별 시간대 주문 발생 현황 (Heatmap)")
+    fig_heatmap = cached_figure('heatmap', build_heatmap)
     st.plotly_chart(fig_heatmap, use_container_width=True)
 
     st.info("""
@@ -751,28 +1015,19 @@ with tab_time:
 
 
 # --- 탭: 등급별 분석 (신규) ---
-with tab_grade:
+def render_grade(f_df):
     st.subheader("💎 상품 등급 및 구매 목적별 입체 분석")
     st.markdown("""
     상품 등급(프리미엄/일반)과 구매 목적(선물용/자기소비용)을 결합하여 **수익성**과 **고객 선호도**를 분석합니다.
     """)
 
-    # 정확한 AOV 계산을 위한 함수 (주문번호 기준)
-    def calculate_true_aov(data, group_col):
-        stats = data.groupby(group_col).agg({
-            '실결제 금액': 'sum',
-            '주문번호': 'nunique'
-        }).reset_index()
-        stats['AOV'] = stats['실결제 금액'] / stats['주문번호']
-        return stats
-
     # 1. 등급 vs 목적 교차 분석
     st.write("#### 1️⃣ 상품 등급 및 구매 목적별 지표")
     col_g1, col_g2 = st.columns(2)
     
     with col_g1:
         # 등급별 AOV
-        grade_aov = calculate_true_aov(f_df, '상품성등급_그룹')
+        grade_aov = true_aov(f_df, '상품성등급_그룹')
         fig_g_aov = px.bar(grade_aov, x='상품성등급_그룹', y='AOV', color='상품성등급_그룹',
                             title="상품 등급별 평균 객단가(AOV)", text_auto='.0f',
                             color_discrete_map={'프리미엄': '#FFD700', '일반': '#C0C0C0'})
@@ -780,7 +1035,7 @@ with tab_grade:
     
     with col_g2:
         # 목적별 AOV
-        purpose_aov = calculate_true_aov(f_df, '구매목적')
+        purpose_aov = true_aov(f_df, '구매목적')
         fig_p_aov = px.bar(purpose_aov, x='구매목적', y='AOV', color='구매목적',
                             title="구매 목적별 평균 객단가(AOV)", text_auto='.0f',
                             color_discrete_map={'선물용': '#EF553B', '자기소비용': '#636EFA'})
@@ -797,10 +1052,7 @@ with tab_grade:
 
     # 2. 목적별 재구매 패턴
     st.write("#### 2️⃣ 구매 목적에 따른 재구매 충성도")
-    purpose_stats = f_df.groupby('구매목적').agg({
-        '재구매여부': 'mean',
-        '주문번호': 'count'
-    }).reset_index()
+    purpose_stats = cached_agg(purpose_repeat_stats, f_cube)
     purpose_stats['재구매비중'] = purpose_stats['재구매여부'] * 100
 
     fig_p_rep = px.bar(purpose_stats, x='구매목적', y='재구매비중', color='구매목적',
@@ -816,44 +1068,49 @@ with tab_grade:
       - **전략**: '가성비' 강조만으로는 한계가 있습니다. **'정기 구독'**이나 **'멤버십 포인트'** 제도를 도입하여 고정적인 재방문 유인(Lock-in)을 만들어야 합니다.
     """)
 
+    st.markdown("---")
 
+    # 3. 재구매 여부(이진) 대신 RFM 세그먼트 구성으로 본 충성도
+    st.write("#### 3️⃣ 상품 등급 및 구매 목적별 RFM 고객 세그먼트 구성")
+    col_s1, col_s2 = st.columns(2)
+    for col, by, title in [(col_s1, '상품성등급_그룹', "상품 등급별 고객 세그먼트 (%)"),
+                           (col_s2, '구매목적', "구매 목적별 고객 세그먼트 (%)")]:
+        with col:
+            mix = cached_agg(segment_mix, f_df, segments, by, variant=(by,), key=rfm_key)
+            fig_mix = px.bar(mix, x=by, y='비중(%)', color=SEGMENT_COL, text_auto='.1f',
+                             category_orders={SEGMENT_COL: SEGMENTS}, title=title)
+            st.plotly_chart(fig_mix, use_container_width=True)
 
 
-with tab4:
+
+
+def render_path_detail(f_df):
     st.subheader("기타/크롬 경로 상세 분석 (표 5)")
-    detail_paths = f_df[f_df['주문경로'].isin(['기타', '크롬'])]
-    
+
     # [표 5] 신규 vs 기존 유입 분석
     st.write("**신규 유입 고객 vs 기존 고객 재방문 비중**")
-    detail_paths['유형'] = detail_paths['재구매여부'].apply(lambda x: '기존' if x else '신규')
-    path_summary = detail_paths.groupby(['주문경로', '유형']).size().unstack(fill_value=0)
-    st.table(path_summary)
+    st.table(cached_agg(path_visit_mix, f_df))
 
     # [그래프 7] 회원/비회원 구분
     st.write("**회원 vs 비회원 구매 비중**")
-    mem_dist = detail_paths.groupby(['주문경로', '회원구분']).size().reset_index(name='건수')
+    mem_dist = cached_agg(path_member_mix, f_df)
     fig7 = px.bar(mem_dist, x='주문경로', y='건수', color='회원구분', barmode='group')
     st.plotly_chart(fig7, use_container_width=True)
 
 # --- 탭: 셀러 성장 전략 (보고서 형식) ---
-with tab_growth:
+def render_seller_growth(f_df):
     st.header("📋 셀러 성장 및 인플루언서 영입 전략 보고서")
     
     # [데이터 클리닝] 분석의 정확도를 위해 결측치 및 0원 데이터 원천 차단
-    f_df_growth = f_df.copy()
-    # 1. 가격 데이터가 없거나 0원인 경우 제외
-    f_df_growth = f_df_growth[f_df_growth['실결제 금액'] > 0]
-    # 2. 주요 분석 컬럼에 결측치가 있는 행 제거
-    f_df_growth = f_df_growth.dropna(subset=['실결제 금액', '그룹', '주문경로', '주문날짜', '고객유형'])
-    # 3. 빈 문자열("") 처리
-    f_df_growth = f_df_growth[f_df_growth['주문경로'].astype(str).str.strip() != ""]
-    
-    # [사전 계산] 감귤 품목의 가격 프리미엄 (결론 섹션용)
-    citrus_common = f_df_growth[f_df_growth['품종'] == '감귤'].groupby('그룹')['실결제 금액'].mean()
-    if '킹댕즈' in citrus_common.index and '일반 셀러' in citrus_common.index:
-        diff_p_val = ((citrus_common['킹댕즈'] - citrus_common['일반 셀러']) / citrus_common['일반 셀러'] * 100).round(1)
-    else:
-        diff_p_val = 15.9 # 기본값
+    f_df_growth = growth_orders(f_df)
+    # 보고서는 두 그룹 비교가 전제 (사이드바 필터로 한 그룹만 남으면 안내만 표시)
+    if f_df_growth['그룹'].nunique() < 2:
+        st.info("이 보고서는 킹댕즈와 일반 셀러를 비교합니다. 두 그룹의 주문이 모두 포함되도록 사이드바 필터를 조정해주세요.")
+        return
+
+    # [사전 계산] 감귤 품목의 가격 프리미엄 (결론 섹션 / 6-4 공용, 두 그룹이 모두 없으면 None)
+    diff_p = variety_price_premium(f_df_growth)
+    diff_p_val = diff_p if diff_p is not None else 15.9 # 기본값
 
     # 1. 목적
     st.markdown("### 1. 목적")
@@ -898,18 +1155,11 @@ with tab_growth:
     st.markdown("### 📊 셀러 그룹별 현황")
     st.write("상세 분석에 앞서, 인플루언서 1인과 일반 셀러 집단의 규모 차이를 한눈에 확인합니다.")
 
-    # 지표 계산
-    summary_stats = f_df_growth.groupby('그룹').agg({
-        '실결제 금액': 'sum',
-        '주문번호': 'count',
-        '셀러명': 'nunique'
-    }).reset_index()
-    
-    summary_stats['그룹'] = summary_stats['그룹'].replace('킹댕즈', '인플루언서(킹댕즈)')
-    summary_stats.columns = ['그룹', '총 매출액', '총 주문건수', '참여 셀러 수']
-    
+    # 지표 계산 (그룹별 총 매출액 / 총 주문건수 / 참여 셀러 수 / 셀러 1인당 평균 매출)
+    summary_stats = group_summary(f_df_growth)
+
     # 가독성을 위한 포맷팅
-    summary_formatted = summary_stats.copy()
+    summary_formatted = summary_stats.drop(columns='셀러 1인당 평균 매출')
     summary_formatted['총 매출액'] = summary_formatted['총 매출액'].apply(lambda x: f"₩{x:,.0f}")
     summary_formatted['총 주문건수'] = summary_formatted['총 주문건수'].apply(lambda x: f"{x:,.0f}건")
     summary_formatted['참여 셀러 수'] = summary_formatted['참여 셀러 수'].apply(lambda x: f"{x:,.0f}명")
@@ -930,8 +1180,6 @@ with tab_growth:
         
     with col_vis2:
         # 2. 인당 생산성 비교 (Bar Chart)
-        summary_stats['셀러 1인당 평균 매출'] = summary_stats['총 매출액'] / summary_stats['참여 셀러 수']
-        
         # 가독성을 위한 배수 계산
         ratio = (summary_stats[summary_stats['그룹'] == '인플루언서(킹댕즈)']['셀러 1인당 평균 매출'].values[0] / 
                  summary_stats[summary_stats['그룹'] == '일반 셀러']['셀러 1인당 평균 매출'].values[0])
@@ -967,13 +1215,8 @@ with tab_growth:
 
     # 6-1. 유입 경로 비교
     st.subheader("📊 6-1. 상세 유입 경로 분석 (안정성 vs. 확장성)")
-    channel_comp = f_df_growth.groupby(['그룹', '주문경로']).size().reset_index(name='주문건수')
-    group_totals = channel_comp.groupby('그룹')['주문건수'].transform('sum')
-    channel_comp['비중(%)'] = (channel_comp['주문건수'] / group_totals * 100).round(1)
-    
     # 1% 미만 유입경로는 '기타'로 묶어 분석의 효율성 제고
-    channel_comp['주문경로_집계'] = channel_comp.apply(lambda x: x['주문경로'] if x['비중(%)'] >= 1.0 else '기타', axis=1)
-    channel_final = channel_comp.groupby(['그룹', '주문경로_집계']).agg({'주문건수': 'sum', '비중(%)': 'sum'}).reset_index()
+    channel_final = channel_share(f_df_growth)
     
     channel_pivot = channel_final.pivot(index='주문경로_집계', columns='그룹', values='비중(%)').fillna(0)
     st.write("**[상세 데이터] 유입 경로별 비중 (%)**")
@@ -1006,8 +1249,7 @@ with tab_growth:
     
     with col_c1:
         # 일반 셀러 신규/재구매 비중
-        gen_cust = f_df_growth[f_df_growth['그룹'] == '일반 셀러']['고객유형'].value_counts().reset_index()
-        gen_cust.columns = ['고객유형', '건수']
+        gen_cust = customer_type_counts(f_df_growth, '일반 셀러')
         fig_gen_pie = px.pie(gen_cust, values='건수', names='고객유형', hole=0.5,
                               title="일반 셀러: 고객 구성 비율",
                               color_discrete_map={'신규 고객': '#A5D6A7', '재구매 고객': '#1B5E20'})
@@ -1016,8 +1258,7 @@ with tab_growth:
         
     with col_c2:
         # 킹댕즈 신규/재구매 비중
-        kd_cust = f_df_growth[f_df_growth['그룹'] == '킹댕즈']['고객유형'].value_counts().reset_index()
-        kd_cust.columns = ['고객유형', '건수']
+        kd_cust = customer_type_counts(f_df_growth, '킹댕즈')
         fig_kd_pie = px.pie(kd_cust, values='건수', names='고객유형', hole=0.5,
                              title="킹댕즈: 고객 구성 비율",
                              color_discrete_map={'신규 고객': '#FFCDD2', '재구매 고객': '#B71C1C'})
@@ -1028,13 +1269,12 @@ with tab_growth:
 
     # 6-3. 킹댕즈 매출 스파이크 패턴
     st.subheader("📊 6-3. 인플루언서 매출 폭발 패턴 (Time-series)")
-    kd_only = f_df_growth[f_df_growth['그룹'] == '킹댕즈'].copy()
+    kd_only = f_df_growth[f_df_growth['그룹'] == '킹댕즈']
     if not kd_only.empty:
-        kd_daily = kd_only.groupby('주문날짜')['실결제 금액'].sum().reset_index()
+        kd_daily, peak_row = daily_revenue_spike(kd_only)
         fig_spike = px.line(kd_daily, x='주문날짜', y='실결제 금액', markers=True,
                              title="킹댕즈 매출 발생 스파이크",
                              line_shape='spline', color_discrete_sequence=['#FF4B4B'])
-        peak_row = kd_daily.loc[kd_daily['실결제 금액'].idxmax()]
         fig_spike.add_annotation(x=peak_row['주문날짜'], y=peak_row['실결제 금액'],
                                  text="SNS 홍보 및 공구 오픈", showarrow=True, arrowhead=1)
         st.plotly_chart(fig_spike, use_container_width=True)
@@ -1042,21 +1282,8 @@ with tab_growth:
         # 일자별 고객 유형 및 구매 목적 상세 분석 table
         st.write("**[상세 데이터] 일자별 유입 고객 성격 및 구매 목적 (신규/재구매 x 선물/소비)**")
         
-        # 그룹화: 주문날짜, 고객유형, 구매목적
-        kd_detail = kd_only.groupby(['주문날짜', '고객유형', '구매목적']).size().unstack(level=[1, 2], fill_value=0)
-        
-        # 컬럼명 평탄화 및 정리
-        kd_detail.columns = [f"{col[0]}({col[1]})" for col in kd_detail.columns]
-        kd_detail = kd_detail.reset_index()
-        
-        # 필수 컬럼 보장 (데이터가 없을 경우 대비)
-        required_cols = ['신규 고객(선물용)', '신규 고객(자기소비용)', '재구매 고객(선물용)', '재구매 고객(자기소비용)']
-        for col in required_cols:
-            if col not in kd_detail.columns:
-                kd_detail[col] = 0
-        
-        kd_detail['총 주문건수'] = kd_detail[required_cols].sum(axis=1)
-        kd_detail = kd_detail[['주문날짜'] + required_cols + ['총 주문건수']].sort_values('주문날짜')
+        # 주문날짜 x (고객유형, 구매목적) 건수 - 없는 조합도 0으로 표시
+        kd_detail = daily_customer_mix(kd_only)
 
         st.dataframe(kd_detail.style.background_gradient(subset=['재구매 고객(선물용)', '재구매 고객(자기소비용)'], cmap='OrRd'), 
                      use_container_width=True, hide_index=True)
@@ -1064,11 +1291,7 @@ with tab_growth:
         # 주기를 한눈에 확인하기 위한 '신규 vs. 재구매' 트렌드 차트
         st.write("**📊 재구매 사이클 시각화 (신규 vs. 재구매 유입 트렌드)**")
         
-        kd_trend = kd_only.groupby(['주문날짜', '고객유형']).size().unstack(fill_value=0).reset_index()
-        if '신규 고객' not in kd_trend.columns: kd_trend['신규 고객'] = 0
-        if '재구매 고객' not in kd_trend.columns: kd_trend['재구매 고객'] = 0
-        
-        kd_trend['재구매 비중(%)'] = (kd_trend['재구매 고객'] / (kd_trend['신규 고객'] + kd_trend['재구매 고객']) * 100).round(1)
+        kd_trend = daily_repeat_trend(kd_only)
         
         # 2중 축 차트 생성 (Area: 건수, Line: 비중)
         from plotly.subplots import make_subplots
@@ -1101,9 +1324,7 @@ with tab_growth:
         # 신규 vs. 재구매 유입 경로 비교 분석
         st.write("**📊 신규 vs. 재구매 고객 유입 경로 상세 비교 (브라우저/검색 유입 확인)**")
         
-        path_type = kd_only.groupby(['고객유형', '주문경로']).size().reset_index(name='주문건수')
-        # 비중 계산
-        path_type['비중(%)'] = path_type.groupby('고객유형')['주문건수'].transform(lambda x: (x / x.sum() * 100).round(1))
+        path_type = customer_type_channels(kd_only)
         
         fig_path_type = px.bar(path_type, y='고객유형', x='비중(%)', color='주문경로',
                                 title="신규 vs. 재구매 고객: 유입 경로 비중 비교",
@@ -1144,11 +1365,7 @@ with tab_growth:
 
     # 데이터 정제: 두 그룹 모두 데이터가 존재하는 품종만 필터링 (직접 비교를 위해)
     # 킹댕즈는 주로 '감귤' 위주이므로, 공통 분모가 있는 품종 선별
-    common_items = f_df_growth.groupby(['품종', '그룹']).size().unstack().dropna().index.tolist()
-    aov_item_df = f_df_growth[f_df_growth['품종'].isin(common_items)].copy()
-
-    # 품종별/그룹별 객단가 계산
-    item_aov = aov_item_df.groupby(['품종', '그룹'])['실결제 금액'].mean().reset_index()
+    item_aov = common_item_aov(f_df_growth)
     
     # 레이아웃 조정을 위해 컬럼 사용 (차트 크기 조절)
     col_aov_main, col_aov_side = st.columns([3, 1])
@@ -1164,17 +1381,13 @@ with tab_growth:
     with col_aov_side:
         st.write("") # 간격 조정
         st.write("")
-        # 감귤 기준 프리미엄 계산
-        kg_aov = item_aov[item_aov['품종'] == '감귤']
-        if len(kg_aov) == 2:
-            kd_val = kg_aov[kg_aov['그룹'] == '킹댕즈']['실결제 금액'].values[0]
-            gen_val = kg_aov[kg_aov['그룹'] == '일반 셀러']['실결제 금액'].values[0]
-            diff_p = ((kd_val - gen_val) / gen_val * 100).round(1)
+        # 감귤 기준 프리미엄 (두 그룹 모두 판매한 경우만)
+        if diff_p is not None:
             st.metric("감귤 품목 가격 프리미엄", f"+{diff_p}%", help="일반 셀러 대비 킹댕즈의 판매가 우위")
 
     st.success(f"""
     **💡 분석 결과 및 전략적 시사점**
-    - **브랜드 프리미엄 확인**: 가장 비중이 큰 **'감귤'** 품목에서 킹댕즈는 일반 셀러 대비 약 **{diff_p if 'diff_p' in locals() else '15'}% 이상 높은 객단가**를 기록하고 있습니다.
+    - **브랜드 프리미엄 확인**: 가장 비중이 큰 **'감귤'** 품목에서 킹댕즈는 일반 셀러 대비 약 **{diff_p if diff_p is not None else '15'}% 이상 높은 객단가**를 기록하고 있습니다.
     - **신뢰 기반 구매**: 이는 소비자가 동일한 귤이라도 인플루언서의 추천(큐레이션)이 더해졌을 때 더 높은 비용을 지불할 의사가 있음을 시사합니다.
     - **영입 전략**: 신규 인플루언서 영입 시, "우리 플랫폼은 당신의 영향력만큼 상품의 가치를 대우받을 수 있다"는 **'가격 방어력'**을 핵심 셀링 포인트로 활용해야 합니다.
     """)
@@ -1249,7 +1462,7 @@ with tab_growth:
             - **수수료 정책 점검**: 등급별 상향 수수료 인하 정책을 통해 장기 활동 유인 제공.
             """)
         
-with tab5:
+def render_marketing(f_df):
     st.header("🚀 데이터 기반 마케팅 최적화 전략")
     st.markdown("데이터 분석 결과를 바탕으로 매출 증대와 재구매율 향상을 위한 5가지 핵심 전략을 제안합니다.")
 
@@ -1257,7 +1470,7 @@ with tab5:
     st.subheader("1. 그룹별 수익성 강화 (객단가 분석)")
     col_a1, col_a2 = st.columns([2, 1])
     with col_a1:
-        group_aov = calculate_true_aov(f_df, '그룹')
+        group_aov = true_aov(f_df, '그룹')
         fig_a1 = px.bar(group_aov, x='그룹', y='AOV', color='그룹', 
                          title="그룹별 평균 객단가(AOV) 비교",
                          text_auto='.0f', labels={'AOV': '평균 객단가(원)'})
@@ -1276,11 +1489,9 @@ with tab5:
     st.subheader("2. 시간대별 푸시 마케팅 최적화")
     col_b1, col_b2 = st.columns([2, 1])
     with col_b1:
-        f_df['주문시간'] = f_df['주문일'].dt.hour
-        hour_dist = f_df.groupby('주문시간').size().reset_index(name='주문건수')
-        fig_b1 = px.line(hour_dist, x='주문시간', y='주문건수', markers=True,
-                          title="시간대별 주문 발생 현황",
-                          labels={'주문시간': '시(Hour)', '주문건수': '주문 수'})
+        fig_b1 = cached_figure('hourly_orders', lambda: px.line(
+            cached_agg(hourly_orders, f_df), x='주문시간', y='주문건수', markers=True,
+            title="시간대별 주문 발생 현황", labels={'주문시간': '시(Hour)', '주문건수': '주문 수'}))
         st.plotly_chart(fig_b1, use_container_width=True)
     with col_b2:
         st.success("""
@@ -1297,15 +1508,13 @@ with tab5:
     col_c1, col_c2 = st.columns(2)
     with col_c1:
         # 킹댕즈 그룹 재구매 비중
-        kd_df = f_df[f_df['그룹'] == '킹댕즈']
-        kd_repeat = kd_df['재구매여부'].apply(lambda x: '재구매' if x else '신규').value_counts()
+        kd_repeat = repeat_split(customers, '킹댕즈')
         fig_c1 = px.pie(values=kd_repeat.values, names=kd_repeat.index, hole=0.5,
                          title="킹댕즈 그룹 신규 vs 재구매 비중", color_discrete_sequence=px.colors.sequential.RdBu)
         st.plotly_chart(fig_c1, use_container_width=True)
     with col_c2:
         # 일반 셀러 그룹 재구매 비중
-        gen_df = f_df[f_df['그룹'] == '일반 셀러']
-        gen_repeat = gen_df['재구매여부'].apply(lambda x: '재구매' if x else '신규').value_counts()
+        gen_repeat = repeat_split(customers, '일반 셀러')
         fig_c2 = px.pie(values=gen_repeat.values, names=gen_repeat.index, hole=0.5,
                          title="일반 셀러 그룹 신규 vs 재구매 비중", color_discrete_sequence=px.colors.sequential.Greens)
         st.plotly_chart(fig_c2, use_container_width=True)
@@ -1319,10 +1528,9 @@ with tab5:
 
     # [추가 차트 4] 지역별 주요 유입 경로 (히트맵)
     st.subheader("4. 지역별 맞춤형 주문 경로 마케팅")
-    reg_path = f_df.groupby(['광역지역(정식)', '주문경로']).size().unstack(fill_value=0)
-    fig_d1 = px.imshow(reg_path, text_auto=True, color_continuous_scale='Viridis',
-                        title="지역별 주문 경로 이용 현황 (건수)",
-                        labels=dict(x="주문 경로", y="지역", color="주문 건수"))
+    fig_d1 = cached_figure('region_channel', lambda: px.imshow(
+        cached_agg(region_channel_counts, f_cube), text_auto=True, color_continuous_scale='Viridis',
+        title="지역별 주문 경로 이용 현황 (건수)", labels=dict(x="주문 경로", y="지역", color="주문 건수")))
     st.plotly_chart(fig_d1, use_container_width=True)
     st.info("""
     **[분석 결과]**
@@ -1335,9 +1543,9 @@ with tab5:
 
     # [추가 차트 5] 품종별 매출 기여도 및 성장 가능성
     st.subheader("5. 전략 품목 선정 (매출 기여도)")
-    prod_rev = f_df.groupby('품종')['실결제 금액'].sum().sort_values(ascending=False).head(10).reset_index()
-    fig_e1 = px.funnel(prod_rev, x='실결제 금액', y='품종', color='품종',
-                        title="주요 품종별 매출 기여도 Top 10")
+    fig_e1 = cached_figure('variety_funnel', lambda: px.funnel(
+        cached_agg(variety_revenue, f_cube).head(10).reset_index(), x='실결제 금액', y='품종', color='품종',
+        title="주요 품종별 매출 기여도 Top 10"))
     st.plotly_chart(fig_e1, use_container_width=True)
     st.success("""
     **[최종 제언]**
@@ -1346,6 +1554,77 @@ with tab5:
     """)
 
 # --- 탭 6: 전체데이터 ---
-with tab6:
+def render_data_preview(f_df):
     st.subheader("데이터 미리보기")
-    st.dataframe(f_df.sort_values(by='주문일', ascending=False).head(100), use_container_width=True)
+    # 전체 정렬/복사 없이 미리 만든 정렬 인덱스에서 요청한 페이지만 꺼냄 (필터 조합별 위치는 재사용)
+    explorer = get_order_explorer(df.attrs.get('fingerprint'), df)
+    # 그룹 / 상세 필터 / 기간은 사이드바 선택을 그대로 사용
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        sort_order = st.radio("정렬", ["최신순", "오래된순"], horizontal=True)
+    with col2:
+        page_size = st.selectbox("페이지당 행 수", [50, 100, 250, 500], index=1)
+
+    # 사이드바 기간은 정렬 인덱스의 연속 구간으로 적용
+    window = date_range or (None, None)
+    total = explorer.count(conditions, *window)
+    n_pages = explorer.page_count(conditions, page_size, *window)
+    page = st.number_input(f"페이지 (총 {n_pages:,}쪽)", min_value=1, max_value=n_pages, value=1, step=1)
+    start = (page - 1) * page_size
+    st.caption(f"총 {total:,}건 중 {min(start + 1, total):,}–{min(start + page_size, total):,}번째 주문")
+    descending = sort_order == "최신순"
+    st.dataframe(explorer.page(page - 1, page_size, conditions, descending, *window), use_container_width=True)
+    # 현재 필터/정렬의 전체 결과(모든 페이지)를 배치 단위로 내보내기
+    export_buttons("orders", lambda: explorer.iter_batches(conditions, descending, EXPORT_BATCH_ROWS, *window), total, df)
+
+
+# ----------------------------------------------------------------
+# 4. 탭 선택 및 렌더링 (선택된 탭만 계산)
+# ----------------------------------------------------------------
+TAB_PAGES = {
+    "🚀 Dashboard": render_dashboard,
+    "📈 매출 & 채널": render_sales_channel,
+    "📊 셀러 & 로열티": render_seller_loyalty,
+    "📦 상품 페이지 분석": render_product_pages,
+    "🔁 재구매 퍼널": render_repurchase_funnel,
+    "⏰ 구매 시점 분석": render_purchase_time,
+    "💎 등급별 분석": render_grade,
+    "🗺️ 지역별 분석": render_region,
+    "🔍 경로 상세분석": render_path_detail,
+    "🎯 셀러 성장 전략": render_seller_growth,
+    "🚀 마케팅 전략": render_marketing,
+    "📋 전체데이터": render_data_preview,
+}
+DEFAULT_TAB = "🚀 Dashboard"
+
+active_tab = st.radio("분석 탭", options=list(TAB_PAGES), index=list(TAB_PAGES).index(DEFAULT_TAB),
+                      horizontal=True, key="active_tab", label_visibility="collapsed")
+st.markdown("---")
+with profile.section(f"tab:{active_tab}"):
+    TAB_PAGES[active_tab](f_df)
+
+# 집계 캐시 적중률 (사이드바 하단)
+cache_stats = agg_cache.stats()
+st.sidebar.caption(f"⚡ 집계 캐시 적중률 {cache_stats['hit_rate']:.0%} "
+                   f"(적중 {cache_stats['hits']:,} / 계산 {cache_stats['misses']:,}, 저장 {cache_stats['entries']}개)")
+
+# rerun 구간별 시간: 구조화 로그(JSON 한 줄) + 선택 시 사이드바 성능 패널
+# (캐시 적중/계산 수는 이번 rerun 동안의 증가분 - 동시에 실행 중인 다른 세션 몫이 섞일 수 있음)
+memory_mb = process_memory_mb()
+profile.record(tab=active_tab, rows=len(f_df), cache_hits=cache_stats['hits'] - cache_before['hits'],
+               cache_misses=cache_stats['misses'] - cache_before['misses'],
+               memory_mb=None if memory_mb is None else round(memory_mb, 1))
+latency_stats = get_latency_stats()
+perf_entry = profile.finish(latency_stats)
+if st.sidebar.toggle("⏱ 성능 패널", value=os.environ.get("ORDER_PERF_PANEL") == "1"):
+    latency = latency_stats.summary()
+    with st.sidebar.container(border=True):
+        st.caption(f"이번 실행 {perf_entry['total_ms']:,.0f}ms · 최근 {latency['count']}회 "
+                   f"p50 {latency['p50']:,.0f}ms / p95 {latency['p95']:,.0f}ms")
+        st.caption(f"캐시 적중 {perf_entry['cache_hits']} / 계산 {perf_entry['cache_misses']} · "
+                   f"그림 캐시 {fig_cache.stats()['entries']}개 · "
+                   f"메모리 {'-' if memory_mb is None else f'{memory_mb:,.0f}MB'} "
+                   f"(공유 데이터셋 {get_dataset_nbytes(df.attrs.get('fingerprint'), df) / 1e6:,.0f}MB)")
+        breakdown = pd.DataFrame(profile.breakdown())
+        breakdown['section'] = ['\u3000' * d + name for name, d in zip(breakdown['section'], breakdown['depth'])]
+        st.dataframe(breakdown[['section', 'ms', 'calls']], hide_index=True, use_container_width=True)
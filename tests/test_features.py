@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from analytics.features import add_derived_features
+from benchmarks.bench_features import check_identical
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 벡터화 파생 컬럼 (그룹 / 구매목적 / time_cluster) == 기존 행 단위 apply 결과
+# 실행: python -m pytest tests
+# ----------------------------------------------------------------
+
+
+def _orders(n=2_000, seed=1):
+    return parse_orders(make_orders(n, seed=seed))
+
+
+def test_matches_legacy_apply():
+    check_identical(_orders())
+
+
+def test_missing_date_price_and_size():
+    # 주문일 NaT / 금액 결측 / 과수 크기 결측 행도 기존 apply 와 같은 값
+    df = _orders(500)
+    df.loc[df.index[:5], '주문일'] = pd.NaT
+    df.loc[df.index[5:10], '실결제 금액'] = np.nan
+    df.loc[df.index[10:15], '과수 크기'] = np.nan
+    check_identical(df)
+
+
+def test_single_group():
+    df = _orders()
+    check_identical(df[df['셀러명'] == '킹댕즈'])
+    check_identical(df[df['셀러명'] != '킹댕즈'])
+
+
+def test_empty_selection():
+    # 기존 apply 는 빈 프레임에서 실패하므로 컬럼이 만들어지는지만 확인
+    out = add_derived_features(_orders().iloc[:0].copy())
+    assert out.empty
+    assert {'그룹', '구매목적', 'time_cluster'} <= set(out.columns)
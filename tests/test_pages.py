@@ -0,0 +1,55 @@
+import numpy as np
+
+from analytics.features import add_derived_features
+from analytics.metrics import product_page_stats
+from analytics.pages import page_index
+from analytics.repurchase import add_repurchase_columns
+from analytics.schema import ARROW_STRING, CATEGORY_COLUMNS
+from benchmarks.bench_pages import check_identical
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 상품 페이지 인덱스 (페이지별 매출 / 주문 수 / 셀러 수 / 유형, 페이지 상세 3표) == 기존 tab_prod 구현
+# check_identical 은 전체 선택과 킹댕즈 선택을 함께 비교
+# ----------------------------------------------------------------
+
+
+def _raw(n=3_000, seed=3):
+    return make_orders(n, seed=seed)
+
+
+def _prepare(raw):
+    # 대시보드 적재와 같은 dtype (반복 문자열은 category, 주문번호는 Arrow 문자열)
+    df = parse_orders(raw)
+    df = df.astype({col: 'category' for col in CATEGORY_COLUMNS if col in df.columns} | {'주문번호': ARROW_STRING})
+    return add_derived_features(add_repurchase_columns(df))
+
+
+def test_matches_legacy_pages():
+    check_identical(_prepare(_raw()))
+
+
+def test_missing_contact_and_date():
+    raw = _raw()
+    raw.loc[raw.index[:30], '주문자연락처'] = np.nan
+    raw.loc[raw.index[30:60], '주문일'] = np.nan
+    check_identical(_prepare(raw))
+
+
+def test_missing_seller_and_page():
+    raw = _raw()
+    raw.loc[raw.index[:30], '셀러명'] = np.nan
+    raw.loc[raw.index[30:60], '상품명'] = np.nan
+    check_identical(_prepare(raw))
+
+
+def test_single_group():
+    raw = _raw()
+    check_identical(_prepare(raw[raw['셀러명'] == '킹댕즈']))
+    check_identical(_prepare(raw[raw['셀러명'] != '킹댕즈']))
+
+
+def test_empty_selection():
+    df = _prepare(_raw()).iloc[:0]
+    check_identical(df)
+    assert product_page_stats(page_index(df)).empty
@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+import pytest
+
+from analytics.cube import OrderCube
+from analytics.features import add_derived_features
+from analytics.repurchase import add_repurchase_columns
+from analytics.schema import read_orders
+from benchmarks.bench_pipeline import TAB_BLOCKS, bench_size, prepare_orders, run_tab, selection_inputs
+from benchmarks.synthetic import make_orders, write_orders_csv
+
+# ----------------------------------------------------------------
+# 파이프라인 벤치마크 하니스: 합성 CSV 적재 -> 단계별 / 탭별 측정 결과 구조,
+# 그리고 모든 탭 집계 블록이 경계 조건(연락처 / 주문일 결측, 한 그룹뿐인 데이터 = 빈 선택)에서도 실행되는지
+# ----------------------------------------------------------------
+
+
+def _load(raw, tmp_path):
+    # bench_size 와 같은 적재 순서 (CSV -> read_orders -> 재구매 -> 파생 컬럼)
+    path = tmp_path / 'orders.csv'
+    raw.to_csv(path, index=False)
+    return add_derived_features(add_repurchase_columns(prepare_orders(read_orders(path))))
+
+
+def _with_missing(column):
+    def edit(raw):
+        raw = raw.copy()
+        raw.loc[raw.index[:30], column] = np.nan
+        return raw
+    return edit
+
+
+EDGE_CASES = {
+    'base': lambda raw: raw,
+    'missing_contact': _with_missing('주문자연락처'),
+    'missing_order_date': _with_missing('주문일'),
+    'single_group': lambda raw: raw[raw['셀러명'] == '킹댕즈'],
+}
+
+
+def test_bench_size_reports_every_stage_and_tab(tmp_path):
+    csv_path = write_orders_csv(str(tmp_path / 'orders.csv'), 2_000)
+    result = bench_size(csv_path, 2_000, 1)
+    assert result['rows'] == 2_000
+    assert result['cube_cells'] > 0
+    assert set(result['tabs']) == set(TAB_BLOCKS)
+    assert all(t >= 0 for t in list(result['stages'].values()) + list(result['tabs'].values()))
+    # 회귀 추적용 JSON 으로 그대로 저장 가능
+    json.dumps(result, ensure_ascii=False)
+
+
+@pytest.mark.parametrize('case', list(EDGE_CASES))
+def test_tab_blocks_run_on_edge_cases(case, tmp_path):
+    df = _load(EDGE_CASES[case](make_orders(2_000, seed=4)), tmp_path)
+    selections = selection_inputs(df, OrderCube.build(df))
+    if case == 'single_group':
+        # '일반 셀러' 선택은 빈 프레임
+        assert any(inputs['frame'].empty for inputs in selections)
+    for inputs in selections:
+        for blocks in TAB_BLOCKS.values():
+            run_tab(blocks, inputs)
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from analytics.repurchase import add_repurchase_columns, repurchase_intervals
+from benchmarks.bench_repurchase import check_identical, legacy_repurchase
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# 재구매 엔진 (재구매_날짜순서 / 재구매여부 / 최초주문일 / 구매간격) == 기존 고객별 transform 결과
+# ----------------------------------------------------------------
+
+
+def _orders(n=2_000, seed=2):
+    return parse_orders(make_orders(n, seed=seed))
+
+
+def test_matches_legacy_transform():
+    check_identical(_orders())
+
+
+def test_missing_contact():
+    # 연락처가 없는 주문은 기존 groupby 처럼 결측
+    df = _orders()
+    df.loc[df.index[:20], '주문자연락처'] = np.nan
+    check_identical(df)
+
+
+def test_missing_order_date():
+    # 기존 구현은 NaT 와 날짜 비교에서 실패 - 날짜가 있는 행은 NaT 행을 뺀 결과와 같고, NaT 행은 결측
+    df = _orders()
+    df.loc[df.index[:20], '주문일'] = pd.NaT
+    df['주문날짜'] = df['주문일'].dt.date
+    engine = add_repurchase_columns(df.copy()).sort_index()
+    valid = df[df['주문일'].notna()]
+    legacy = legacy_repurchase(valid.copy()).sort_index()
+    for col in ['재구매_날짜순서', '재구매여부', '최초주문일']:
+        assert (legacy[col].to_numpy() == engine.loc[valid.index, col].to_numpy()).all(), col
+    missing = engine.loc[df.index[:20]]
+    assert missing['재구매_날짜순서'].isna().all()
+    assert not missing['재구매여부'].any()
+    assert missing['구매간격'].isna().all()
+    assert (repurchase_intervals(engine) > 0).all()
+
+
+def test_single_group_and_customer():
+    df = _orders()
+    check_identical(df[df['셀러명'] == '킹댕즈'])
+    check_identical(df[df['주문자연락처'] == df['주문자연락처'].iloc[0]])
+
+
+def test_empty_selection():
+    out = add_repurchase_columns(_orders().iloc[:0].copy())
+    assert out.empty
+    assert repurchase_intervals(out).empty
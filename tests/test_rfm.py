@@ -0,0 +1,60 @@
+import numpy as np
+
+from analytics.customer_table import customer_table
+from analytics.features import add_derived_features
+from analytics.repurchase import add_repurchase_columns
+from analytics.rfm import RFM_BINS, SEGMENT_COL, rfm_segments, segment_summary
+from benchmarks.bench_rfm import check_identical
+from benchmarks.synthetic import make_orders, parse_orders
+
+# ----------------------------------------------------------------
+# RFM 세그먼트 (고객 테이블 + 백분위 점수) == 기존 고객별 groupby + 행별 apply 결과
+# ----------------------------------------------------------------
+
+
+def _raw(n=3_000, seed=3):
+    return make_orders(n, seed=seed, n_customers=n // 2)
+
+
+def _prepare(raw):
+    return add_derived_features(add_repurchase_columns(parse_orders(raw)))
+
+
+def test_matches_legacy_rfm():
+    check_identical(_prepare(_raw()))
+
+
+def test_missing_contact():
+    raw = _raw()
+    raw.loc[raw.index[:30], '주문자연락처'] = np.nan
+    check_identical(_prepare(raw))
+
+
+def test_missing_order_date():
+    # 첫 주문이 아닌 주문의 주문일을 지움: 마지막 주문일 / 방문일수는 날짜가 있는 주문 기준
+    raw = _raw()
+    repeat_rows = _prepare(raw).query('재구매_날짜순서 > 0').index[:30]
+    raw.loc[repeat_rows, '주문일'] = np.nan
+    check_identical(_prepare(raw))
+
+
+def test_customer_without_order_date():
+    # 기존 구현은 최근성이 결측인 고객에서 실패 - 점수는 1점으로 매기고 세그먼트는 항상 붙음
+    raw = _raw()
+    raw.loc[raw.index[:30], '주문일'] = np.nan
+    segments = rfm_segments(customer_table(_prepare(raw)))
+    for col in ['R', 'F', 'M']:
+        assert segments[col].between(1, RFM_BINS).all(), col
+    assert segments[SEGMENT_COL].notna().all()
+
+
+def test_single_group_and_customer():
+    df = _prepare(_raw())
+    check_identical(df[df['그룹'] == '킹댕즈'])
+    check_identical(df[df['고객키'] == df['고객키'].iloc[0]])
+
+
+def test_empty_selection():
+    segments = rfm_segments(customer_table(_prepare(_raw()).iloc[:0]))
+    assert segments.empty
+    assert segment_summary(segments).empty